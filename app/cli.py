@@ -0,0 +1,341 @@
+"""
+Command-line tools
+`python -m app.cli tailor-batch INPUT.jsonl OUTPUT.jsonl` tailors a JSONL file
+of resume/job description pairs in-process with resumable checkpoints
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set
+
+import orjson
+from dotenv import load_dotenv
+
+from app.llm.rate_limiter import PRIORITY_BATCH, request_priority
+from app.utils.logger import logger, setup_logger_from_env
+
+
+class Checkpoint:
+    """
+    Progress of a tailor-batch run
+    
+    Every input line below `watermark` has its record in the output file;
+    `completed` holds finished lines at or above it. Because concurrent
+    items finish out of order, dispatch is held to a window above the
+    watermark, which bounds `completed` (and memory) regardless of input
+    size. The output file is the source of truth: records appended after
+    the last save are recovered from its tail on resume.
+    """
+    
+    def __init__(self, path: str, input_path: str):
+        self.path = path
+        self.input_path = os.path.abspath(input_path)
+        self.watermark = 1
+        self.completed: Set[int] = set()
+        self.output_offset = 0
+    
+    @classmethod
+    def load(cls, path: str, input_path: str) -> "Checkpoint":
+        """
+        Read a checkpoint, or start a fresh one if `path` does not exist
+        
+        Raises:
+            ValueError: If the checkpoint belongs to a different input file
+        """
+        checkpoint = cls(path, input_path)
+        if not os.path.exists(path):
+            return checkpoint
+        
+        with open(path, "rb") as f:
+            data = json.load(f)
+        if data["input"] != checkpoint.input_path:
+            raise ValueError(f"Checkpoint {path} belongs to {data['input']}, not {checkpoint.input_path}")
+        checkpoint.watermark = data["watermark"]
+        checkpoint.completed = set(data["completed"])
+        checkpoint.output_offset = data["output_offset"]
+        return checkpoint
+    
+    def recover(self, output_path: str) -> int:
+        """
+        Fold in records written after the last save
+        
+        A torn final record (the run was killed mid-write) is truncated so
+        its item runs again.
+        
+        Returns:
+            Number of records recovered from the output tail
+        """
+        if not os.path.exists(output_path):
+            if self.output_offset:
+                raise ValueError(f"Checkpoint {self.path} refers to missing output {output_path}")
+            return 0
+        
+        recovered = 0
+        with open(output_path, "rb+") as f:
+            f.seek(self.output_offset)
+            end = self.output_offset
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    line = orjson.loads(raw)["line"]
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    break
+                self.mark_done(line)
+                end += len(raw)
+                recovered += 1
+            f.truncate(end)
+        self.output_offset = end
+        return recovered
+    
+    def is_done(self, line: int) -> bool:
+        """Whether an input line already has its output record"""
+        return line < self.watermark or line in self.completed
+    
+    def mark_done(self, line: int) -> None:
+        """Record a finished line and advance the watermark past finished lines"""
+        if line >= self.watermark:
+            self.completed.add(line)
+        while self.watermark in self.completed:
+            self.completed.remove(self.watermark)
+            self.watermark += 1
+    
+    def save(self, output_offset: int) -> None:
+        """Atomically write the checkpoint (the output must be fsynced up to `output_offset`)"""
+        self.output_offset = output_offset
+        data = {
+            "input": self.input_path,
+            "watermark": self.watermark,
+            "completed": sorted(self.completed),
+            "output_offset": output_offset,
+        }
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+
+def _parse_item(raw: bytes) -> Dict[str, Any]:
+    """Validate one input record"""
+    try:
+        item = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e}")
+    if not isinstance(item, dict):
+        raise ValueError("Each line must be a JSON object")
+    for field in ("resume_text", "job_description"):
+        if not isinstance(item.get(field), str) or not item[field].strip():
+            raise ValueError(f"Missing {field}")
+    return item
+
+
+async def tailor_batch(
+    input_path: str,
+    output_path: str,
+    checkpoint_path: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    variant: Optional[str] = None,
+    use_cache: bool = True,
+    checkpoint_every: int = 50
+) -> Dict[str, int]:
+    """
+    Tailor every resume/job description pair of a JSONL file
+    
+    Input lines are objects with resume_text, job_description and an
+    optional id. Output records are appended as items finish (so not in
+    input order) as {"line", "id", "result"} or {"line", "id", "error"},
+    where line is the 1-based input line number. Re-running with the same
+    output resumes: lines that already have a record are skipped. Failed
+    items are final; remove their records and the checkpoint to redo them.
+    
+    Args:
+        input_path: JSONL file of items
+        output_path: JSONL file results are appended to
+        checkpoint_path: Checkpoint file (defaults to OUTPUT.checkpoint)
+        concurrency: Pipelines in flight (defaults to BATCH_CONCURRENCY)
+        variant: Registered graph variant to run (defaults to PIPELINE_VARIANT)
+        use_cache: Look up the result cache for each item
+        checkpoint_every: Records written between checkpoint saves
+    
+    Returns:
+        Counts of succeeded, failed, skipped (already done) and recovered
+        items
+    
+    Raises:
+        ValueError: If the checkpoint does not match the input or output
+    """
+    from app.graph.pipeline import run_resume_tailor_pipeline
+    
+    if concurrency is None:
+        concurrency = int(os.getenv("BATCH_CONCURRENCY", 4))
+    concurrency = max(concurrency, 1)
+    checkpoint = Checkpoint.load(checkpoint_path or f"{output_path}.checkpoint", input_path)
+    stats: Counter = Counter(recovered=checkpoint.recover(output_path))
+    if stats["recovered"] or checkpoint.watermark > 1:
+        logger.info(f"Resuming {input_path} from line {checkpoint.watermark} ({stats['recovered']} records recovered)")
+    
+    # In-flight items may finish out of order; never run ahead of the
+    # watermark by more than this, so memory stays flat
+    window = concurrency * 8
+    progress = asyncio.Condition()
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: Set[asyncio.Task] = set()
+    written = 0
+    started = time.monotonic()
+    
+    output = open(output_path, "ab")
+    
+    def save_checkpoint() -> None:
+        output.flush()
+        os.fsync(output.fileno())
+        checkpoint.save(output.tell())
+    
+    def write(record: Dict[str, Any]) -> None:
+        nonlocal written
+        output.write(orjson.dumps(record) + b"\n")
+        checkpoint.mark_done(record["line"])
+        written += 1
+        if written % checkpoint_every == 0:
+            save_checkpoint()
+            rate = written / max(time.monotonic() - started, 1e-9)
+            logger.info(
+                f"tailor-batch: {written} written ({stats['failed']} failed), "
+                f"watermark line {checkpoint.watermark}, {rate:.2f} items/s"
+            )
+    
+    async def run_item(line: int, item: Dict[str, Any]) -> None:
+        record: Dict[str, Any] = {"line": line, "id": item.get("id")}
+        try:
+            async with semaphore:
+                record["result"] = await run_resume_tailor_pipeline(
+                    item["resume_text"],
+                    item["job_description"],
+                    variant=variant,
+                    use_cache=use_cache
+                )
+            stats["succeeded"] += 1
+        except Exception as e:
+            record["error"] = str(e) or e.__class__.__name__
+            stats["failed"] += 1
+        async with progress:
+            write(record)
+            progress.notify_all()
+    
+    try:
+        with open(input_path, "rb") as source, request_priority(PRIORITY_BATCH):
+            for line, raw in enumerate(source, start=1):
+                if checkpoint.is_done(line):
+                    stats["skipped"] += 1
+                    continue
+                if not raw.strip():
+                    checkpoint.mark_done(line)
+                    continue
+                
+                try:
+                    item = _parse_item(raw)
+                except ValueError as e:
+                    stats["failed"] += 1
+                    write({"line": line, "id": None, "error": str(e)})
+                    continue
+                
+                async with progress:
+                    await progress.wait_for(lambda: line - checkpoint.watermark < window)
+                task = asyncio.create_task(run_item(line, item))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            
+            await asyncio.gather(*tasks)
+    finally:
+        # Interrupted: drop unfinished items (they run again on resume)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        save_checkpoint()
+        output.close()
+    
+    logger.info(
+        f"tailor-batch finished: {stats['succeeded']} succeeded, {stats['failed']} failed, "
+        f"{stats['skipped']} skipped in {time.monotonic() - started:.1f}s"
+    )
+    return {key: stats[key] for key in ("succeeded", "failed", "skipped", "recovered")}
+
+
+async def _run_tailor_batch(args: argparse.Namespace) -> Dict[str, int]:
+    """Run tailor-batch with the process-wide clients opened and closed around it"""
+    from app.llm.client import close_groq_client, init_groq_client
+    from app.storage.checkpoints import close_checkpoint_saver
+    from app.storage.jd_registry import close_jd_registry
+    from app.storage.result_cache import close_result_cache
+    
+    init_groq_client()
+    try:
+        return await tailor_batch(
+            args.input,
+            args.output,
+            checkpoint_path=args.checkpoint,
+            concurrency=args.concurrency,
+            variant=args.variant,
+            use_cache=not args.no_cache,
+            checkpoint_every=args.checkpoint_every
+        )
+    finally:
+        await close_groq_client()
+        close_jd_registry()
+        await close_result_cache()
+        close_checkpoint_saver()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of `python -m app.cli`
+    
+    Returns:
+        Exit code: 0 on success, 1 if any item failed, 2 on usage or
+        configuration errors
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Resume Tailor command-line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    batch = commands.add_parser(
+        "tailor-batch",
+        help="tailor a JSONL file of resume/job description pairs",
+        description=tailor_batch.__doc__.strip().splitlines()[0]
+    )
+    batch.add_argument("input", help="JSONL file with resume_text, job_description and optional id per line")
+    batch.add_argument("output", help="JSONL file results are appended to")
+    batch.add_argument("--checkpoint", help="checkpoint file (default OUTPUT.checkpoint)")
+    batch.add_argument("--concurrency", type=int, help="pipelines in flight (default BATCH_CONCURRENCY or 4)")
+    batch.add_argument("--variant", help="graph variant (default PIPELINE_VARIANT)")
+    batch.add_argument("--no-cache", action="store_true", help="skip result cache lookups")
+    batch.add_argument("--checkpoint-every", type=int, default=50, help="records between checkpoint saves")
+    args = parser.parse_args(argv)
+    
+    load_dotenv()
+    setup_logger_from_env()
+    
+    if not os.getenv("GROQ_API_KEY"):
+        logger.error("GROQ_API_KEY not configured")
+        return 2
+    
+    try:
+        summary = asyncio.run(_run_tailor_batch(args))
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+    except KeyboardInterrupt:
+        logger.warning("tailor-batch interrupted; re-run the same command to resume")
+        return 130
+    
+    print(json.dumps(summary))
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Prompt input compaction
+Shrinks resumes and job descriptions before they are embedded in prompts:
+whitespace normalisation, boilerplate removal, line de-duplication and
+token budgets
+"""
+
+import re
+from typing import List, Tuple
+
+from app.utils.text import estimate_tokens
+
+
+# Job-posting sections that never carry skills or requirements
+BOILERPLATE_HEADINGS = (
+    "equal opportunity", "equal employment", "eeo", "diversity",
+    "benefits", "perks", "what we offer", "compensation", "salary",
+    "about us", "about the company", "who we are", "our values", "our culture",
+    "accommodation", "privacy", "how to apply", "disclaimer",
+)
+
+# Sentences dropped as legal boilerplate even without a heading
+BOILERPLATE_PHRASES = (
+    "equal opportunity employer",
+    "without regard to race",
+    "reasonable accommodation",
+    "e-verify",
+    "protected veteran",
+    "sexual orientation, gender identity",
+)
+
+_HORIZONTAL_SPACE_RE = re.compile(r"[ \t ]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_BULLET_PREFIX_RE = re.compile(r"^\s*([-*•▪●]|\d+[.)])\s*")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Stripping that leaves less than this share of the text is assumed to have
+# misfired (e.g. a posting pasted without headings) and is undone
+_MIN_KEPT_FRACTION = 0.2
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines and strip line ends"""
+    lines = [_HORIZONTAL_SPACE_RE.sub(" ", line).strip() for line in text.splitlines()]
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _is_heading(line: str, after_blank: bool) -> bool:
+    """Heading: ends with ':', ALL CAPS, or a short Title Case line after a blank line"""
+    stripped = line.strip()
+    if not stripped or len(stripped) > 60 or _BULLET_PREFIX_RE.match(line):
+        return False
+    letters = [ch for ch in stripped if ch.isalpha()]
+    if not letters:
+        return False
+    if stripped.endswith(":") or all(ch.isupper() for ch in letters):
+        return True
+    words = stripped.split()
+    return after_blank and len(words) <= 5 and all(word[0].isupper() for word in words if word[0].isalpha())
+
+
+def strip_boilerplate(text: str) -> str:
+    """
+    Remove boilerplate sections and paragraphs from a job description
+    
+    A heading that matches BOILERPLATE_HEADINGS drops everything up to the
+    next heading, provided a non-boilerplate heading follows later: a
+    heading-like line can be a job title ("Benefits Specialist"), so the
+    first line is never treated as boilerplate and a trailing block is
+    kept rather than risk dropping the requirements. Sentences containing
+    a BOILERPLATE_PHRASES phrase are dropped on their own, since pasted
+    postings are often a single paragraph. If stripping leaves almost
+    nothing, the text is returned unstripped.
+    """
+    lines = text.splitlines()
+    first_line = next((i for i, line in enumerate(lines) if line.strip()), 0)
+    headings: List[Tuple[int, bool]] = []
+    after_blank = True
+    for i, line in enumerate(lines):
+        if _is_heading(line, after_blank):
+            heading = line.strip().lower()
+            boilerplate = i != first_line and any(marker in heading for marker in BOILERPLATE_HEADINGS)
+            headings.append((i, boilerplate))
+        after_blank = not line.strip()
+    
+    last_content_heading = max((i for i, boilerplate in headings if not boilerplate), default=-1)
+    dropped = set()
+    for (start, boilerplate), (end, _) in zip(headings, headings[1:]):
+        if boilerplate and start < last_content_heading:
+            dropped.update(range(start, end))
+    kept = []
+    for i, line in enumerate(lines):
+        if i in dropped:
+            continue
+        sentences = _SENTENCE_END_RE.split(line)
+        clean = [
+            sentence for sentence in sentences
+            if not any(phrase in sentence.lower() for phrase in BOILERPLATE_PHRASES)
+        ]
+        if clean or not line.strip():
+            kept.append(" ".join(clean) if len(clean) < len(sentences) else line)
+    
+    stripped = _BLANK_LINES_RE.sub("\n\n", "\n".join(kept)).strip()
+    if len(stripped) < _MIN_KEPT_FRACTION * len(text.strip()):
+        return text.strip()
+    return stripped
+
+
+def dedupe_lines(text: str) -> str:
+    """Drop repeated lines (ignoring case and bullet markers), keeping the first"""
+    seen = set()
+    kept = []
+    for line in text.splitlines():
+        key = _BULLET_PREFIX_RE.sub("", line).strip().casefold()
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(line)
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(kept)).strip()
+
+
+def cap_tokens(text: str, budget: int) -> str:
+    """
+    Truncate text to an estimated token budget at a line boundary
+    
+    Args:
+        text: Text to cap
+        budget: Maximum estimated tokens (0 or less disables the cap)
+    
+    Returns:
+        The text, cut after the last whole line that fits
+    """
+    if budget <= 0 or estimate_tokens(text) <= budget:
+        return text
+    
+    kept = []
+    used = 0
+    for line in text.splitlines():
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept).strip()
+
+
+def compact_job_description(text: str, budget: int = 0) -> str:
+    """Apply every compaction step to a job description"""
+    text = normalize_whitespace(text)
+    text = strip_boilerplate(text)
+    text = dedupe_lines(text)
+    return cap_tokens(text, budget)
+
+
+def compact_resume(text: str, budget: int = 0) -> str:
+    """
+    Compact a resume without changing its content
+    
+    Only whitespace is normalised before capping: repeated lines in a resume
+    (e.g. the same bullet under two jobs) are meaningful.
+    """
+    return cap_tokens(normalize_whitespace(text), budget)
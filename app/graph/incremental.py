@@ -0,0 +1,276 @@
+"""
+Incremental re-tailoring of a stored session
+Diffs an edited resume against the session's sections and only re-runs
+skill matching and section rewrites for the text that changed
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.graph import nodes
+from app.graph.compaction import compact_resume
+from app.graph.sections import REWRITABLE_KINDS, split_resume_sections, stitch_sections
+from app.llm.hedging import get_request_deadline
+from app.llm.routing import routing_fingerprint
+from app.skills.matcher import match_skills_locally, unmatched_skills
+from app.utils.deadline import deadline
+from app.utils.logger import logger
+from app.utils.metrics import CACHE_LOOKUPS
+from app.utils.tracing import start_span
+
+
+def _llm_classified_skills(resume_text: str, required_skills: List[str], mode: str) -> List[str]:
+    """Skills whose verdict comes from the LLM in the given skill match mode"""
+    if mode == "llm":
+        return list(required_skills)
+    if mode == "hybrid":
+        return unmatched_skills(required_skills, match_skills_locally(resume_text, required_skills)["matched_skills"])
+    return []
+
+
+def capture_session_state(final_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pick what a tailoring session keeps out of a final graph state
+    
+    The standard graph rewrites the resume in one call, so its sessions
+    have no per-section rewrites to reuse; their first update rewrites
+    every section. Output from calls that fell back (unparsable skill
+    verdicts, sections kept as written, the summary placeholder) is not
+    kept, and a degraded session skips the unchanged-resume shortcut, so
+    the next update retries it.
+    
+    Args:
+        final_state: Final state of a standard or sectioned graph run
+    
+    Returns:
+        Session fields (see SessionStore)
+    """
+    resume_text = final_state.get("resume_text", "")
+    sections = final_state.get("sections")
+    rewrites = {
+        item["index"]: item["text"]
+        for item in final_state.get("section_rewrites", [])
+        if not item.get("degraded")
+    }
+    if sections is None:
+        sections = split_resume_sections(resume_text)
+        rewrites = {}
+    
+    required = final_state.get("all_required_skills", [])
+    matched = {str(skill).casefold() for skill in final_state.get("matched_skills", [])}
+    verdicts = {} if final_state.get("skill_match_degraded") else {
+        skill: skill.casefold() in matched
+        for skill in _llm_classified_skills(resume_text, required, nodes.get_skill_match_mode())
+    }
+    summary = final_state.get("summary", "")
+    
+    return {
+        "resume_text": resume_text,
+        "job_description": final_state.get("job_description", ""),
+        "jd_keywords": final_state.get("jd_keywords", {}),
+        "all_required_skills": required,
+        "sections": [{**section, "rewrite": rewrites.get(section["index"])} for section in sections],
+        "llm_verdicts": verdicts,
+        "matched_skills": final_state.get("matched_skills", []),
+        "missing_skills": final_state.get("missing_skills", []),
+        "summary": None if summary == nodes.SUMMARY_UNAVAILABLE else summary,
+        "tailored_resume": final_state.get("tailored_resume", ""),
+        "fingerprint": routing_fingerprint(),
+        "degraded": bool(final_state.get("degraded")),
+    }
+
+
+async def _classify(resume_text: str, skills: List[str]) -> Optional[Dict[str, bool]]:
+    """LLM verdicts for `skills` against a (partial) resume text (None if the call fails)"""
+    if not skills or not resume_text.strip():
+        return {skill: False for skill in skills}
+    try:
+        analysis = await nodes.llm_match_skills(resume_text, skills)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON response: {e}")
+        return None
+    found = {str(skill).casefold() for skill in analysis.get("matched_skills", [])}
+    return {skill: skill.casefold() in found for skill in skills}
+
+
+async def _rematch_skills(
+    session: Dict[str, Any],
+    resume_text: str,
+    prompt_resume_text: str,
+    changed_text: str
+) -> Tuple[List[str], List[str], Dict[str, bool], int]:
+    """
+    Match skills for an edited resume, asking the LLM only about changed text
+    
+    The local matcher re-runs over the whole resume (it costs no LLM
+    call). LLM verdicts are reused: a skill previously judged missing is
+    only re-checked against the changed sections, since unchanged text
+    already failed to evidence it; skills never sent to the LLM before are
+    checked against the whole resume. A skill once judged present stays
+    present until the next full /tailor run. Skills whose check fails are
+    dropped from the verdicts, so the next update checks them against the
+    whole resume.
+    
+    Args:
+        session: Stored session
+        resume_text: The whole edited resume (for the local matcher)
+        prompt_resume_text: Its token-capped copy (for LLM prompts)
+        changed_text: Text of the new or edited sections
+    
+    Returns:
+        matched_skills, missing_skills, updated LLM verdicts and the number
+        of skills sent to the LLM
+    """
+    required = session["all_required_skills"]
+    mode = nodes.get_skill_match_mode()
+    local = match_skills_locally(resume_text, required)
+    
+    verdicts = dict(session.get("llm_verdicts", {}))
+    llm_skills = _llm_classified_skills(resume_text, required, mode)
+    unseen = [skill for skill in llm_skills if skill not in verdicts]
+    previously_missing = [skill for skill in llm_skills if verdicts.get(skill) is False]
+    
+    results = await asyncio.gather(
+        _classify(prompt_resume_text, unseen),
+        _classify(changed_text, previously_missing),
+    )
+    for skills, result in zip((unseen, previously_missing), results):
+        if result is None:
+            # Unclassified: forget them so the next update checks the whole resume
+            for skill in skills:
+                verdicts.pop(skill, None)
+        else:
+            verdicts.update(result)
+    
+    if mode == "llm":
+        matched = [skill for skill in required if verdicts.get(skill)]
+    elif mode == "hybrid":
+        matched_set = set(local["matched_skills"]) | {skill for skill in llm_skills if verdicts.get(skill)}
+        matched = [skill for skill in required if skill in matched_set]
+    else:
+        matched = local["matched_skills"]
+    matched = list(dict.fromkeys(matched))
+    missing = [skill for skill in dict.fromkeys(required) if skill not in set(matched)]
+    
+    return matched, missing, verdicts, len(unseen) + (len(previously_missing) if changed_text.strip() else 0)
+
+
+async def run_session_update(session: Dict[str, Any], resume_text: str) -> Dict[str, Any]:
+    """
+    Re-tailor an edited resume against a session's job description
+    
+    Sections whose text is unchanged keep their stored rewrite; only new or
+    edited sections are rewritten (in parallel), skills are re-matched as
+    described in _rematch_skills, and the summary is regenerated only when
+    something changed. The session is updated in place; rewrites, verdicts
+    and summaries from calls that fell back are not stored, so the next
+    update retries them.
+    
+    Args:
+        session: Stored session (see SessionStore)
+        resume_text: The edited resume
+    
+    Returns:
+        Result dictionary (same fields as run_resume_tailor_pipeline) plus
+        rewritten_sections, reused_sections and rematched_skills counts
+    """
+    with start_span("session.update", {"session.id": session["session_id"]}) as span, \
+            deadline(get_request_deadline()):
+        # The capped copy is for prompts only; sections cover the whole resume
+        prompt_resume_text = compact_resume(resume_text, nodes.get_token_budget("RESUME_TOKEN_BUDGET", 3000))
+        new_sections = split_resume_sections(resume_text)
+        
+        # Rewrites are only reusable if the same models produced them
+        reusable = session.get("fingerprint") == routing_fingerprint()
+        previous: Dict[str, Any] = {}
+        for section in session["sections"]:
+            previous.setdefault(section["text"], section.get("rewrite") if reusable else None)
+        
+        new_texts = {section["text"] for section in new_sections}
+        changed = [section for section in new_sections if section["text"] not in previous]
+        removed = [text for text in previous if text not in new_texts]
+        changed_text = "\n\n".join(section["text"] for section in changed)
+        
+        if not changed and not removed and reusable and not session.get("degraded"):
+            logger.info(f"Session {session['session_id']}: resume unchanged, reusing stored result")
+            span.set_attribute("session.unchanged", True)
+            return {
+                "tailored_resume": session["tailored_resume"],
+                "summary": session["summary"],
+                "matched_skills": session["matched_skills"],
+                "missing_skills": session["missing_skills"],
+                "rewritten_sections": 0,
+                "reused_sections": sum(1 for s in new_sections if s["kind"] in REWRITABLE_KINDS),
+                "rematched_skills": 0,
+            }
+        
+        matched, missing, verdicts, rematched = await _rematch_skills(
+            session, resume_text, prompt_resume_text, changed_text
+        )
+        
+        to_rewrite = [
+            section for section in new_sections
+            if section["kind"] in REWRITABLE_KINDS and previous.get(section["text"]) is None
+        ]
+        reused = sum(1 for section in new_sections if section["kind"] in REWRITABLE_KINDS) - len(to_rewrite)
+        CACHE_LOOKUPS.labels("session_sections", "hit").inc(reused)
+        CACHE_LOOKUPS.labels("session_sections", "miss").inc(len(to_rewrite))
+        logger.info(
+            f"Session {session['session_id']}: {len(changed)} changed sections, "
+            f"rewriting {len(to_rewrite)}, reusing {reused}, {rematched} skills sent to the LLM"
+        )
+        
+        context = {
+            "job_description": session["job_description"],
+            "matched_skills": matched,
+            "missing_skills": missing,
+            "keywords": session["jd_keywords"].get("keywords", []),
+        }
+        state = {**context, "resume_text": resume_text, "prompt_resume_text": prompt_resume_text}
+        rewrite_updates, summary_update = await asyncio.gather(
+            asyncio.gather(*[
+                nodes.rewrite_section_node({"section": section, **context}) for section in to_rewrite
+            ]),
+            nodes.write_summary_node(state),
+        )
+        
+        rewrites = {
+            section["index"]: previous[section["text"]]
+            for section in new_sections
+            if previous.get(section["text"]) is not None
+        }
+        # Sections kept as written after a failed rewrite are stitched but not stored
+        fallbacks = {}
+        for update in rewrite_updates:
+            for item in update["section_rewrites"]:
+                (fallbacks if item.get("degraded") else rewrites)[item["index"]] = item["text"]
+        summary_degraded = bool(summary_update.get("degraded"))
+        llm_skills = _llm_classified_skills(resume_text, session["all_required_skills"], nodes.get_skill_match_mode())
+        unclassified = any(skill not in verdicts for skill in llm_skills)
+        
+        tailored_resume = stitch_sections(new_sections, {**rewrites, **fallbacks}) or resume_text
+        span.set_attribute("session.sections_rewritten", len(to_rewrite))
+        span.set_attribute("session.sections_reused", reused)
+    
+    session.update({
+        "resume_text": resume_text,
+        "sections": [{**section, "rewrite": rewrites.get(section["index"])} for section in new_sections],
+        "llm_verdicts": verdicts,
+        "matched_skills": matched,
+        "missing_skills": missing,
+        "summary": None if summary_degraded else summary_update["summary"],
+        "tailored_resume": tailored_resume,
+        "fingerprint": routing_fingerprint(),
+        "degraded": bool(fallbacks) or summary_degraded or unclassified,
+    })
+    
+    return {
+        "tailored_resume": tailored_resume,
+        "summary": summary_update["summary"],
+        "matched_skills": matched,
+        "missing_skills": missing,
+        "rewritten_sections": len(to_rewrite),
+        "reused_sections": reused,
+        "rematched_skills": rematched,
+    }
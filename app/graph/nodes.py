@@ -5,82 +5,218 @@ Each node performs a specific task in the workflow
 
 import json
 import os
-from typing import Dict, Any, List
-from groq import Groq
-from app.utils.logger import logger
+from typing import Dict, Any, List, Optional
+from langchain_core.runnables import RunnableConfig
+from app.llm.client import call_groq_api, stream_groq_api
+from app.llm.hedging import get_hedger, get_node_deadline
+from app.llm.parsing import PARSE_TRUNCATED, parse_llm_json_with_path
+from app.llm.routing import escalation_model, get_node_model, validate_output
+from app.graph.compaction import compact_job_description, compact_resume
+from app.graph.sections import REWRITABLE_KINDS, split_resume_sections, stitch_sections
+from app.skills.matcher import match_skills_locally, unmatched_skills
+from app.storage.jd_registry import get_jd_registry
+from app.utils.deadline import DeadlineExceeded, deadline, within_deadline
+from app.utils.json_stream import JsonStringFieldStreamer
+from app.utils.logger import logger, preview
+from app.utils.metrics import CACHE_LOOKUPS, DEADLINES_EXCEEDED, MODEL_ROUTING, observe_node
+from app.utils.single_flight import SingleFlight
+from app.utils.text import content_hash, estimate_tokens
+from app.utils.tracing import set_current_attributes
 
 
-# Initialize Groq client
-def get_groq_client() -> Groq:
-    """Get Groq client with API key from environment"""
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
-        raise ValueError("GROQ_API_KEY environment variable is not set")
-    return Groq(api_key=api_key)
+def get_token_budget(name: str, default: int) -> int:
+    """Get a prompt input token budget from environment (0 disables the cap)"""
+    return int(os.getenv(name, default))
 
 
-def get_model_name() -> str:
-    """Get model name from environment or use default"""
-    return os.getenv("MODEL_NAME", "llama-3.3-70b-versatile")
-
-
-def call_groq_api(prompt: str, temperature: float = 0.3, max_tokens: int = 2000) -> str:
+async def call_node_llm(
+    node: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int
+) -> Dict[str, Any]:
     """
-    Call Groq API with retry logic
+    Make a node's structured LLM call on the model routed to that node
+    
+    The call runs within the node's deadline budget (NODE_DEADLINE_<NODE>,
+    never beyond the request deadline) and is hedged with a duplicate when
+    it runs past the node's observed p95 latency.
+    
+    With MODEL_CASCADE on, a fast model's response that cannot be parsed
+    or does not match the node's output schema is retried once on the
+    large model (MODEL_NAME). Every outcome is counted in
+    llm_model_routing_total.
     
     Args:
-        prompt: The prompt to send to the model
+        node: Graph node name (selects the model and output schema)
+        prompt: Prompt asking for a JSON object
         temperature: Temperature for response generation
         max_tokens: Maximum tokens in response
     
     Returns:
-        Generated text response
+        Parsed JSON response
+    
+    Raises:
+        json.JSONDecodeError: If the final response cannot be parsed
+        DeadlineExceeded: If the node or request deadline passes first
+    """
+    try:
+        with deadline(get_node_deadline(node)):
+            return await within_deadline(_call_node_llm(node, prompt, temperature, max_tokens))
+    except DeadlineExceeded:
+        DEADLINES_EXCEEDED.labels(node).inc()
+        logger.warning(f"{node}: LLM call abandoned at its deadline")
+        raise
+
+
+# Nodes whose output is the user-facing text: a response cut off by
+# max_tokens and closed by the repair scanner would silently lose its tail
+TRUNCATION_SENSITIVE_NODES = ("rewrite_resume", "rewrite_section")
+
+# Summary returned when the summary could not be generated
+SUMMARY_UNAVAILABLE = "Unable to generate summary. Please try again."
+
+
+def parse_node_response(node: str, response: str) -> Dict[str, Any]:
     """
-    client = get_groq_client()
-    model_name = get_model_name()
+    Parse a node's LLM response, rejecting truncated rewrites
     
+    Raises:
+        json.JSONDecodeError: If the response cannot be parsed, or was cut
+            off by max_tokens and the node is truncation sensitive
+    """
+    result, path = parse_llm_json_with_path(response)
+    if path == PARSE_TRUNCATED:
+        if node in TRUNCATION_SENSITIVE_NODES:
+            raise json.JSONDecodeError("Response truncated at max_tokens", response, len(response))
+        logger.warning(f"{node}: response was truncated at max_tokens and closed by the JSON repair")
+    return result
+
+
+async def _call_node_llm(node: str, prompt: str, temperature: float, max_tokens: int) -> Dict[str, Any]:
+    model = get_node_model(node)
+    response = await get_hedger().call(
+        node,
+        lambda: call_groq_api(
+            prompt, temperature=temperature, max_tokens=max_tokens, json_mode=True, model=model
+        ),
+        tokens=estimate_tokens(prompt) + max_tokens
+    )
+    
+    error = None
     try:
-        logger.info(f"Calling Groq API with model: {model_name}")
-        
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert resume writer and career consultant. Provide accurate, professional, and actionable insights."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            model=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        
-        response = chat_completion.choices[0].message.content
-        logger.info("Groq API call successful")
-        return response
-        
-    except Exception as e:
-        logger.error(f"Groq API call failed: {str(e)}")
+        result = parse_node_response(node, response)
+        problem = validate_output(node, result)
+    except json.JSONDecodeError as e:
+        result, error, problem = None, e, f"unparseable JSON ({e.msg})"
+    
+    if problem is None:
+        MODEL_ROUTING.labels(node, model, "accepted").inc()
+        return result
+    
+    large = escalation_model(node)
+    if large is None:
+        MODEL_ROUTING.labels(node, model, "invalid").inc()
+        if error is not None:
+            logger.error(f"Unparseable {node} response from {model}: {preview(response)}")
+            raise error
+        # No cascade: callers fall back on missing fields as before
+        return result
+    
+    logger.warning(f"{node}: {model} output invalid ({problem}), escalating to {large}")
+    MODEL_ROUTING.labels(node, model, "escalated").inc()
+    set_current_attributes({"llm.routing.escalated_from": model})
+    
+    # Not hedged: the node's latency history describes its routed model
+    response = await call_groq_api(
+        prompt, temperature=temperature, max_tokens=max_tokens, json_mode=True, model=large
+    )
+    try:
+        result = parse_node_response(node, response)
+    except json.JSONDecodeError:
+        MODEL_ROUTING.labels(node, large, "invalid").inc()
+        logger.error(f"Unparseable {node} response from {large}: {preview(response)}")
         raise
+    MODEL_ROUTING.labels(node, large, "accepted" if validate_output(node, result) is None else "invalid").inc()
+    return result
 
 
-def extract_keywords_node(state: Dict[str, Any]) -> Dict[str, Any]:
+@observe_node("compact_inputs")
+def compact_inputs_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Node A: Extract keywords and skills from job description
+    Node 0: Compact the resume and job description before any prompt uses them
+    
+    Normalises whitespace, strips job-posting boilerplate (EEO, benefits,
+    about-us sections), drops repeated job-description lines and caps both
+    inputs to their token budgets. The compacted resume goes to
+    prompt_resume_text for the prompts only: resume_text stays whole, since
+    the tailored resume is built from it.
     
     Args:
-        state: Current graph state containing job_description
+        state: Current graph state with resume_text and job_description
     
     Returns:
-        Updated state with extracted keywords and required skills
+        Updated state with prompt_resume_text, the compacted job description
+        and tokens_saved
     """
-    logger.info("Node A: Extracting keywords from job description")
-    
+    resume_text = state.get("resume_text", "")
     job_description = state.get("job_description", "")
     
+    compact_resume_text = compact_resume(
+        resume_text, get_token_budget("RESUME_TOKEN_BUDGET", 3000)
+    )
+    compact_jd = compact_job_description(
+        job_description, get_token_budget("JD_TOKEN_BUDGET", 1500)
+    )
+    
+    tokens_before = estimate_tokens(resume_text) + estimate_tokens(job_description)
+    tokens_after = estimate_tokens(compact_resume_text) + estimate_tokens(compact_jd)
+    
+    state["prompt_resume_text"] = compact_resume_text
+    state["job_description"] = compact_jd
+    state["tokens_saved"] = tokens_before - tokens_after
+    
+    logger.info(f"Compacted inputs: {tokens_before} -> {tokens_after} estimated tokens ({state['tokens_saved']} saved)")
+    
+    return state
+
+
+def get_prompt_resume_text(state: Dict[str, Any]) -> str:
+    """The compacted resume for prompts, or resume_text before compaction ran"""
+    return state.get("prompt_resume_text") or state.get("resume_text", "")
+
+
+def collect_required_skills(jd_keywords: Dict[str, Any]) -> List[str]:
+    """Flatten the skill categories of a keyword analysis into one de-duplicated list"""
+    skills = (
+        jd_keywords.get("technical_skills", []) +
+        jd_keywords.get("soft_skills", []) +
+        jd_keywords.get("qualifications", [])
+    )
+    seen = set()
+    unique = []
+    for skill in skills:
+        key = str(skill).strip().casefold()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(skill)
+    return unique
+
+
+async def analyze_job_description(job_description: str) -> Dict[str, Any]:
+    """
+    Extract keywords and skills from a job description with the LLM
+    
+    Args:
+        job_description: Job description text
+    
+    Returns:
+        Keyword analysis with technical_skills, soft_skills, qualifications
+        and keywords lists
+    
+    Raises:
+        json.JSONDecodeError: If the model response cannot be parsed
+    """
     prompt = f"""
 Analyze the following job description and extract:
 1. Key technical skills (e.g., programming languages, frameworks, tools)
@@ -101,44 +237,75 @@ Provide your response in the following JSON format:
 
 Return ONLY the JSON object, no additional text.
 """
+
+    return await call_node_llm("extract_keywords", prompt, temperature=0.2, max_tokens=1000)
+
+
+# Coalesces concurrent extractions of the same job description (e.g. a batch
+# of resumes against one posting before the registry has an entry)
+_jd_flight = SingleFlight("extract_keywords")
+
+
+async def _lookup_or_analyze(job_description: str) -> Dict[str, Any]:
+    """Get the registry entry for a job description, analysing it on a miss"""
+    registry = get_jd_registry()
+    entry = await registry.find_by_text(job_description)
+    
+    if entry is not None:
+        CACHE_LOOKUPS.labels("jd_registry", "hit").inc()
+        logger.info(f"Job description analysis found in registry: {entry['jd_id']}")
+        return entry
+    
+    CACHE_LOOKUPS.labels("jd_registry", "miss").inc()
+    extracted_data = await analyze_job_description(job_description)
+    return await registry.put(
+        job_description,
+        extracted_data,
+        collect_required_skills(extracted_data)
+    )
+
+
+@observe_node("extract_keywords")
+async def extract_keywords_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Node A: Extract keywords and skills from job description
+    
+    Reuses a precomputed analysis when the state already carries one or the
+    job description is in the registry; otherwise calls the LLM and stores
+    the result for later requests. Concurrent calls for the same job
+    description share one lookup and LLM call.
+    
+    Args:
+        state: Current graph state containing job_description
+    
+    Returns:
+        Updated state with extracted keywords and required skills
+    """
+    logger.info("Node A: Extracting keywords from job description")
+    
+    job_description = state.get("job_description", "")
+    
+    if state.get("jd_keywords"):
+        logger.info("Using precomputed job description analysis")
+        if not state.get("all_required_skills"):
+            state["all_required_skills"] = collect_required_skills(state["jd_keywords"])
+        return state
     
     try:
-        response = call_groq_api(prompt, temperature=0.2, max_tokens=1000)
-        
-        # Parse JSON response
-        # Try to extract JSON from response if wrapped in markdown
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        response = response.strip()
-        
-        # Try to parse JSON - use strict=False to be more lenient
-        try:
-            extracted_data = json.loads(response)
-        except json.JSONDecodeError:
-            # If normal parsing fails, try with a more permissive approach
-            # Remove problematic whitespace/control chars but preserve structure
-            import re
-            # Try to clean up the response while preserving JSON structure
-            response = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', response)  # Remove control characters
-            extracted_data = json.loads(response)
-        
-        state["jd_keywords"] = extracted_data
-        state["all_required_skills"] = (
-            extracted_data.get("technical_skills", []) +
-            extracted_data.get("soft_skills", []) +
-            extracted_data.get("qualifications", [])
+        entry = await _jd_flight.do(
+            content_hash(job_description, get_node_model("extract_keywords")),
+            lambda: _lookup_or_analyze(job_description)
         )
         
-        logger.info(f"Extracted {len(state['all_required_skills'])} skills from job description")
+        state["jd_keywords"] = entry["jd_keywords"]
+        state["all_required_skills"] = entry["all_required_skills"]
         
+        logger.info(f"Extracted {len(state['all_required_skills'])} skills from job description")
+    
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON response: {e}")
         # Fallback: basic extraction
+        state["degraded"] = True
         state["jd_keywords"] = {
             "technical_skills": [],
             "soft_skills": [],
@@ -153,21 +320,37 @@ Return ONLY the JSON object, no additional text.
     return state
 
 
-def match_skills_node(state: Dict[str, Any]) -> Dict[str, Any]:
+SKILL_MATCH_MODES = ("local", "hybrid", "llm")
+
+
+def get_skill_match_mode() -> str:
     """
-    Node B: Match resume skills against job requirements
+    Get the skill matching mode from environment or use default
+    
+    - local: deterministic taxonomy matcher only
+    - hybrid: local matcher, escalating every skill it did not find to the LLM
+    - llm: classify every skill with the LLM
+    """
+    mode = os.getenv("SKILL_MATCH_MODE", "hybrid").lower()
+    if mode not in SKILL_MATCH_MODES:
+        raise ValueError(f"Invalid SKILL_MATCH_MODE: {mode}")
+    return mode
+
+
+async def llm_match_skills(resume_text: str, skills: List[str]) -> Dict[str, Any]:
+    """
+    Classify skills as present or missing in a resume with the LLM
     
     Args:
-        state: Current graph state with resume_text and all_required_skills
+        resume_text: Resume content
+        skills: Required skills to classify
     
     Returns:
-        Updated state with matched and missing skills
-    """
-    logger.info("Node B: Matching skills between resume and job description")
-    
-    resume_text = state.get("resume_text", "")
-    all_required_skills = state.get("all_required_skills", [])
+        Dictionary with matched_skills and missing_skills lists
     
+    Raises:
+        json.JSONDecodeError: If the model response cannot be parsed
+    """
     prompt = f"""
 You are analyzing a resume against required skills for a job.
 
@@ -175,7 +358,7 @@ Resume:
 {resume_text}
 
 Required Skills from Job Description:
-{", ".join(all_required_skills)}
+{", ".join(skills)}
 
 Task:
 1. Identify which required skills are present in the resume (matched_skills)
@@ -190,51 +373,103 @@ Provide your response in the following JSON format:
 
 Return ONLY the JSON object, no additional text.
 """
+
+    return await call_node_llm("match_skills", prompt, temperature=0.2, max_tokens=1000)
+
+
+@observe_node("match_skills")
+async def match_skills_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Node B: Match resume skills against job requirements
+    
+    In local and hybrid modes the taxonomy matcher classifies skills
+    deterministically. Hybrid mode sends only the skills it did not find
+    to the LLM in a much smaller prompt: a taxonomy skill can still be
+    evidenced by related terms no alias covers ("SQL" by "PostgreSQL").
+    
+    Args:
+        state: Current graph state with resume_text and all_required_skills
+    
+    Returns:
+        Updated state with matched and missing skills
+    """
+    logger.info("Node B: Matching skills between resume and job description")
+    
+    resume_text = state.get("resume_text", "")
+    prompt_resume_text = get_prompt_resume_text(state)
+    all_required_skills = state.get("all_required_skills", [])
+    mode = get_skill_match_mode()
+    
+    if mode == "llm":
+        to_llm = all_required_skills
+        matched, missing = [], []
+    else:
+        local = match_skills_locally(resume_text, all_required_skills)
+        matched = local["matched_skills"]
+        if mode == "hybrid":
+            missing, to_llm = [], unmatched_skills(all_required_skills, matched)
+        else:
+            missing, to_llm = local["missing_skills"] + local["ambiguous_skills"], []
+        logger.info(
+            f"Local matcher: {len(matched)} matched, {len(missing)} missing, "
+            f"{len(local['ambiguous_skills'])} ambiguous"
+        )
     
     try:
-        response = call_groq_api(prompt, temperature=0.2, max_tokens=1000)
-        
-        # Parse JSON response
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        response = response.strip()
-        
-        # Try to parse JSON
-        try:
-            skill_analysis = json.loads(response)
-        except json.JSONDecodeError:
-            # If normal parsing fails, remove control characters
-            import re
-            response = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', response)
-            skill_analysis = json.loads(response)
-        
-        state["matched_skills"] = skill_analysis.get("matched_skills", [])
-        state["missing_skills"] = skill_analysis.get("missing_skills", [])
-        
-        logger.info(f"Found {len(state['matched_skills'])} matched skills and {len(state['missing_skills'])} missing skills")
-        
+        if to_llm:
+            skill_analysis = await llm_match_skills(prompt_resume_text, to_llm)
+            
+            if mode == "llm":
+                matched = skill_analysis.get("matched_skills", [])
+                missing = skill_analysis.get("missing_skills", [])
+            else:
+                # Only trust the LLM for the skills we asked about
+                llm_matched = {
+                    str(skill).casefold() for skill in skill_analysis.get("matched_skills", [])
+                }
+                for skill in to_llm:
+                    (matched if skill.casefold() in llm_matched else missing).append(skill)
+    
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON response: {e}")
-        state["matched_skills"] = []
-        state["missing_skills"] = all_required_skills
+        state["degraded"] = state["skill_match_degraded"] = True
+        if mode == "llm":
+            matched, missing = [], all_required_skills
+        else:
+            missing = missing + to_llm
     except Exception as e:
         logger.error(f"Error in match_skills_node: {e}")
         raise
     
+    if mode != "llm":
+        # Report skills in job-description order regardless of how they were classified
+        order = {skill: i for i, skill in enumerate(all_required_skills)}
+        matched = sorted(matched, key=order.get)
+        missing = sorted(missing, key=order.get)
+    
+    state["matched_skills"] = matched
+    state["missing_skills"] = missing
+    
+    logger.info(f"Found {len(state['matched_skills'])} matched skills and {len(state['missing_skills'])} missing skills")
+    
     return state
 
 
-def rewrite_resume_node(state: Dict[str, Any]) -> Dict[str, Any]:
+@observe_node("rewrite_resume")
+async def rewrite_resume_node(
+    state: Dict[str, Any],
+    config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
     """
     Node C: Rewrite resume and generate professional summary
     
+    When the run config carries an `on_token` callback under "configurable",
+    the completion is streamed and the decoded tailored_resume text is
+    passed to the callback as it is generated.
+    
     Args:
         state: Current graph state with all previous analysis
+        config: LangGraph run config
     
     Returns:
         Updated state with tailored_resume and summary
@@ -242,6 +477,7 @@ def rewrite_resume_node(state: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Node C: Rewriting resume and generating summary")
     
     resume_text = state.get("resume_text", "")
+    prompt_resume_text = get_prompt_resume_text(state)
     job_description = state.get("job_description", "")
     matched_skills = state.get("matched_skills", [])
     missing_skills = state.get("missing_skills", [])
@@ -251,7 +487,7 @@ def rewrite_resume_node(state: Dict[str, Any]) -> Dict[str, Any]:
 You are an expert resume writer. Your task is to tailor the given resume to match the job description.
 
 Original Resume:
-{resume_text}
+{prompt_resume_text}
 
 Job Description:
 {job_description}
@@ -276,69 +512,180 @@ Provide your response in the following JSON format:
 
 Return ONLY the JSON object, no additional text.
 """
-    
+
+    response = None
     try:
-        response = call_groq_api(prompt, temperature=0.4, max_tokens=3000)
-        
-        # Clean and parse JSON response
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        response = response.strip()
-        
-        # Try to parse JSON
-        try:
-            result = json.loads(response)
-        except json.JSONDecodeError:
-            # If normal parsing fails, we need to fix string values with unescaped newlines
-            import re
-            
-            # Strategy: Find string values in JSON and escape special characters within them
-            # This regex finds content between quotes that are property values
-            def escape_json_string(match):
-                content = match.group(1)
-                # Escape special characters
-                content = content.replace('\\', '\\\\')  # Escape backslashes first
-                content = content.replace('\n', '\\n')   # Escape newlines
-                content = content.replace('\r', '\\r')   # Escape carriage returns
-                content = content.replace('\t', '\\t')   # Escape tabs
-                content = content.replace('"', '\\"')    # Escape quotes
-                return f'"{content}"'
-            
-            # Find and fix string values (content between ": " and next " or ,/})
-            # This is a simplified approach - match content after colon
-            try:
-                # Split by quote, process odd indices (string contents)
-                parts = response.split('"')
-                for i in range(1, len(parts), 2):
-                    if i < len(parts):
-                        # This is string content - escape newlines
-                        parts[i] = parts[i].replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-                response = '"'.join(parts)
-                result = json.loads(response)
-            except:
-                # If that fails too, just remove control characters
-                response = re.sub(r'[\x00-\x1f\x7f-\x9f]', ' ', response)
-                result = json.loads(response)
+        on_token = ((config or {}).get("configurable") or {}).get("on_token")
+        if on_token is None:
+            result = await call_node_llm("rewrite_resume", prompt, temperature=0.4, max_tokens=3000)
+        else:
+            # Tokens already sent to the client cannot be taken back, so a
+            # streamed rewrite stays on its routed model (no cascade)
+            streamer = JsonStringFieldStreamer("tailored_resume")
+            chunks = []
+            with deadline(get_node_deadline("rewrite_resume")):
+                async for chunk in stream_groq_api(
+                    prompt, temperature=0.4, max_tokens=3000, model=get_node_model("rewrite_resume")
+                ):
+                    chunks.append(chunk)
+                    text = streamer.feed(chunk)
+                    if text:
+                        await on_token(text)
+            response = "".join(chunks)
+            result = parse_node_response("rewrite_resume", response)
         
         state["tailored_resume"] = result.get("tailored_resume", resume_text)
         state["summary"] = result.get("professional_summary", "")
         
         logger.info("Resume rewriting completed successfully")
-        
+    
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON response: {e}")
-        logger.error(f"Response preview: {response[:200] if len(response) > 200 else response}")
+        if response is not None:
+            logger.error(f"Response preview: {preview(response)}")
         # Fallback - try to extract content without JSON parsing
         state["tailored_resume"] = resume_text
-        state["summary"] = "Unable to generate summary. Please try again."
+        state["summary"] = SUMMARY_UNAVAILABLE
+        state["degraded"] = True
     except Exception as e:
         logger.error(f"Error in rewrite_resume_node: {e}")
         raise
     
     return state
 
+
+@observe_node("plan_sections")
+def plan_sections_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Split the resume into sections for the parallel rewrite
+    
+    Args:
+        state: Current graph state with resume_text
+    
+    Returns:
+        State update with the ordered resume sections
+    """
+    sections = split_resume_sections(state.get("resume_text", ""))
+    rewritable = sum(1 for section in sections if section["kind"] in REWRITABLE_KINDS)
+    logger.info(f"Split resume into {len(sections)} sections ({rewritable} to rewrite)")
+    return {"sections": sections}
+
+
+@observe_node("rewrite_section")
+async def rewrite_section_node(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map step: rewrite a single resume section for the target job
+    
+    Args:
+        task: Send payload with the section and the shared job context
+    
+    Returns:
+        State update appending this section's rewrite
+    """
+    section = task["section"]
+    logger.info(f"Rewriting section {section['index']} ({section['kind']})")
+    
+    prompt = f"""
+You are an expert resume writer. Rewrite ONE section of a resume so it better matches the job description.
+
+Section ({section["kind"]}):
+{section["text"]}
+
+Job Description:
+{task["job_description"]}
+
+Matched Skills (emphasize these): {", ".join(task["matched_skills"])}
+Missing Skills (if the candidate has transferable skills, mention them): {", ".join(task["missing_skills"][:5])}
+Key Keywords to incorporate: {", ".join(task["keywords"][:10])}
+
+Instructions:
+1. Keep the section heading, dates, employers, titles and facts unchanged
+2. Emphasize matched skills and relevant achievements
+3. Incorporate keywords naturally; do not invent experience
+4. Keep roughly the same length and the same layout (bullets stay bullets)
+
+Provide your response in the following JSON format:
+{{
+    "rewritten_section": "The rewritten section text..."
+}}
+
+Return ONLY the JSON object, no additional text.
+"""
+
+    # Output length dominates latency: budget it from the section itself
+    max_tokens = min(1500, 200 + len(section["text"]) // 2)
+    
+    degraded = False
+    try:
+        result = await call_node_llm("rewrite_section", prompt, temperature=0.4, max_tokens=max_tokens)
+        rewritten = result.get("rewritten_section") or section["text"]
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON response for section {section['index']}: {e}")
+        rewritten, degraded = section["text"], True
+    except DeadlineExceeded:
+        # One slow section must not fail the resume: keep it as written
+        rewritten, degraded = section["text"], True
+    
+    return {
+        "section_rewrites": [{"index": section["index"], "text": rewritten, "degraded": degraded}],
+        "degraded": degraded
+    }
+
+
+@observe_node("write_summary")
+async def write_summary_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map step: generate the professional summary alongside the section rewrites
+    
+    Args:
+        state: Current graph state with the resume and match results
+    
+    Returns:
+        State update with the summary
+    """
+    logger.info("Generating professional summary")
+    
+    prompt = f"""
+You are an expert resume writer. Write a compelling professional summary (3-4 sentences) highlighting this candidate's fit for the job.
+
+Resume:
+{get_prompt_resume_text(state)}
+
+Job Description:
+{state.get("job_description", "")}
+
+Matched Skills (emphasize these): {", ".join(state.get("matched_skills", []))}
+
+Provide your response in the following JSON format:
+{{
+    "professional_summary": "A 3-4 sentence summary highlighting key qualifications..."
+}}
+
+Return ONLY the JSON object, no additional text.
+"""
+
+    try:
+        result = await call_node_llm("write_summary", prompt, temperature=0.4, max_tokens=400)
+        summary = result.get("professional_summary", "")
+    except (json.JSONDecodeError, DeadlineExceeded) as e:
+        logger.error(f"Failed to generate summary: {e}")
+        return {"summary": SUMMARY_UNAVAILABLE, "degraded": True}
+    
+    return {"summary": summary}
+
+
+@observe_node("stitch_sections")
+def stitch_sections_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce step: stitch the rewritten sections back into one resume
+    
+    Args:
+        state: Current graph state with sections and section_rewrites
+    
+    Returns:
+        State update with tailored_resume
+    """
+    rewrites = {item["index"]: item["text"] for item in state.get("section_rewrites", [])}
+    tailored_resume = stitch_sections(state.get("sections", []), rewrites)
+    logger.info(f"Stitched {len(rewrites)} rewritten sections into tailored resume")
+    return {"tailored_resume": tailored_resume or state.get("resume_text", "")}
@@ -3,19 +3,48 @@ LangGraph pipeline orchestration for resume tailoring
 Defines the workflow graph and execution order
 """
 
-from typing import Dict, Any, TypedDict
+import asyncio
+import copy
+import json
+import operator
+import os
+from typing import Annotated, Dict, Any, AsyncIterator, Callable, List, Optional, TypedDict
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
+from app.graph.compaction import compact_job_description
 from app.graph.nodes import (
+    analyze_job_description,
+    collect_required_skills,
+    compact_inputs_node,
+    get_token_budget,
     extract_keywords_node,
     match_skills_node,
-    rewrite_resume_node
+    plan_sections_node,
+    rewrite_resume_node,
+    rewrite_section_node,
+    stitch_sections_node,
+    write_summary_node
 )
+from app.graph.incremental import capture_session_state
+from app.graph.sections import REWRITABLE_KINDS
+from app.llm.hedging import get_request_deadline
+from app.llm.routing import routing_fingerprint
+from app.llm.rate_limiter import PRIORITY_BATCH, request_priority
+from app.storage.checkpoints import checkpoints_enabled, get_checkpoint_saver
+from app.storage.jd_registry import get_jd_registry
+from app.storage.result_cache import compute_result_key, get_result_cache
+from app.utils.deadline import DeadlineExceeded, deadline
 from app.utils.logger import logger
+from app.utils.metrics import DEADLINES_EXCEEDED, PIPELINE_IN_FLIGHT, PIPELINE_RESUMES
+from app.utils.tracing import set_current_attributes, start_span
+from app.utils.single_flight import SingleFlight
 
 
 class GraphState(TypedDict):
     """Type definition for the graph state"""
     resume_text: str
+    # Token-capped copy of resume_text used in prompts
+    prompt_resume_text: str
     job_description: str
     jd_keywords: Dict[str, Any]
     all_required_skills: list
@@ -23,48 +52,328 @@ class GraphState(TypedDict):
     missing_skills: list
     tailored_resume: str
     summary: str
+    tokens_saved: int
+    # Set by any node that fell back instead of producing real output; the
+    # parallel branches may each set it, so updates are OR-ed
+    degraded: Annotated[bool, operator.or_]
+    # Whether the LLM skill classification fell back (its verdicts are not kept)
+    skill_match_degraded: bool
 
 
-def create_resume_tailor_graph() -> StateGraph:
+class SectionedGraphState(GraphState):
+    """Graph state for the section-parallel rewrite"""
+    sections: list
+    # Each parallel rewrite_section branch appends its result
+    section_rewrites: Annotated[list, operator.add]
+
+
+# A graph factory builds an uncompiled StateGraph; node overrides let the
+# warmup dry run swap the real (LLM-calling) nodes for stubs
+NodeOverrides = Optional[Dict[str, Callable]]
+GraphFactory = Callable[[NodeOverrides], StateGraph]
+
+DEFAULT_VARIANT = "sectioned"
+STANDARD_VARIANT = "standard"
+
+_graph_factories: Dict[str, GraphFactory] = {}
+_compiled_graphs: Dict[str, Any] = {}
+
+
+def create_resume_tailor_graph(nodes: NodeOverrides = None) -> StateGraph:
     """
     Create and configure the LangGraph workflow
     
-    The workflow consists of three sequential nodes:
+    The workflow consists of sequential nodes:
+    0. Compact the prompt inputs
     1. Extract keywords from job description
     2. Match skills between resume and JD
     3. Rewrite resume and generate summary
     
+    Args:
+        nodes: Optional mapping of node name to replacement callable
+    
     Returns:
         Configured StateGraph ready for compilation
     """
-    logger.info("Creating resume tailor graph")
+    node_funcs = {
+        "compact_inputs": compact_inputs_node,
+        "extract_keywords": extract_keywords_node,
+        "match_skills": match_skills_node,
+        "rewrite_resume": rewrite_resume_node,
+    }
+    node_funcs.update(nodes or {})
     
     # Initialize the graph with state schema
     workflow = StateGraph(GraphState)
     
     # Add nodes to the graph
-    workflow.add_node("extract_keywords", extract_keywords_node)
-    workflow.add_node("match_skills", match_skills_node)
-    workflow.add_node("rewrite_resume", rewrite_resume_node)
+    workflow.add_node("compact_inputs", node_funcs["compact_inputs"])
+    workflow.add_node("extract_keywords", node_funcs["extract_keywords"])
+    workflow.add_node("match_skills", node_funcs["match_skills"])
+    workflow.add_node("rewrite_resume", node_funcs["rewrite_resume"])
     
     # Define the workflow edges (execution order)
-    workflow.set_entry_point("extract_keywords")
+    workflow.set_entry_point("compact_inputs")
+    workflow.add_edge("compact_inputs", "extract_keywords")
     workflow.add_edge("extract_keywords", "match_skills")
     workflow.add_edge("match_skills", "rewrite_resume")
     workflow.add_edge("rewrite_resume", END)
     
-    logger.info("Graph created with 3 nodes: extract_keywords -> match_skills -> rewrite_resume")
+    return workflow
+
+
+def route_section_rewrites(state: Dict[str, Any]) -> List[Send]:
+    """
+    Fan out one rewrite_section branch per rewritable section, plus the summary
+    
+    Args:
+        state: Graph state after plan_sections
+    
+    Returns:
+        Send packets executed in parallel in the next step
+    """
+    context = {
+        "job_description": state.get("job_description", ""),
+        "matched_skills": state.get("matched_skills", []),
+        "missing_skills": state.get("missing_skills", []),
+        "keywords": state.get("jd_keywords", {}).get("keywords", []),
+    }
+    sends = [
+        Send("rewrite_section", {"section": section, **context})
+        for section in state.get("sections", [])
+        if section["kind"] in REWRITABLE_KINDS
+    ]
+    sends.append(Send("write_summary", state))
+    return sends
+
+
+def create_sectioned_graph(nodes: NodeOverrides = None) -> StateGraph:
+    """
+    Create the section-parallel (map-reduce) workflow
+    
+    Compaction, keywords and skill matching run as in the standard graph. The resume is
+    then split into sections, each rewritable section is rewritten in its own
+    parallel branch while the professional summary is generated alongside,
+    and a reduce node stitches the results back in document order. Wall-clock
+    time follows the longest section rather than the whole document.
+    
+    Args:
+        nodes: Optional mapping of node name to replacement callable
+    
+    Returns:
+        Configured StateGraph ready for compilation
+    """
+    node_funcs = {
+        "compact_inputs": compact_inputs_node,
+        "extract_keywords": extract_keywords_node,
+        "match_skills": match_skills_node,
+        "plan_sections": plan_sections_node,
+        "rewrite_section": rewrite_section_node,
+        "write_summary": write_summary_node,
+        "stitch_sections": stitch_sections_node,
+    }
+    node_funcs.update(nodes or {})
+    
+    workflow = StateGraph(SectionedGraphState)
+    
+    for name, func in node_funcs.items():
+        workflow.add_node(name, func)
+    
+    workflow.set_entry_point("compact_inputs")
+    workflow.add_edge("compact_inputs", "extract_keywords")
+    workflow.add_edge("extract_keywords", "match_skills")
+    workflow.add_edge("match_skills", "plan_sections")
+    workflow.add_conditional_edges(
+        "plan_sections",
+        route_section_rewrites,
+        ["rewrite_section", "write_summary"]
+    )
+    workflow.add_edge("rewrite_section", "stitch_sections")
+    workflow.add_edge("write_summary", "stitch_sections")
+    workflow.add_edge("stitch_sections", END)
     
     return workflow
 
 
-def run_resume_tailor_pipeline(resume_text: str, job_description: str) -> Dict[str, Any]:
+def register_graph_variant(name: str, factory: GraphFactory) -> None:
+    """
+    Register a named graph variant
+    
+    Args:
+        name: Variant name used to select the graph at run time
+        factory: Callable returning an uncompiled StateGraph
+    """
+    _graph_factories[name] = factory
+    # Drop any stale compiled copy so the next lookup rebuilds it
+    _compiled_graphs.pop(name, None)
+    logger.info(f"Registered graph variant: {name}")
+
+
+def get_compiled_graph(name: str = DEFAULT_VARIANT):
+    """
+    Get the compiled graph for a variant, compiling it on first use
+    
+    Args:
+        name: Registered variant name
+    
+    Returns:
+        Compiled LangGraph application shared by all requests
+    
+    Raises:
+        ValueError: If the variant is not registered
+    """
+    compiled = _compiled_graphs.get(name)
+    if compiled is not None:
+        return compiled
+    
+    factory = _graph_factories.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown pipeline variant: {name}")
+    
+    compiled = factory(None).compile()
+    _compiled_graphs[name] = compiled
+    logger.info(f"Compiled graph variant: {name}")
+    return compiled
+
+
+def build_initial_state(
+    resume_text: str,
+    job_description: str,
+    jd_analysis: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build the initial graph state for a tailoring run
+    
+    Args:
+        resume_text: Original resume content
+        job_description: Target job description
+        jd_analysis: Precomputed registry entry; skips keyword extraction
+    
+    Returns:
+        Initial graph state
+    """
+    state = {
+        "resume_text": resume_text,
+        "prompt_resume_text": "",
+        "job_description": job_description,
+        "jd_keywords": {},
+        "all_required_skills": [],
+        "matched_skills": [],
+        "missing_skills": [],
+        "tailored_resume": "",
+        "summary": "",
+        "tokens_saved": 0,
+        "degraded": False,
+        "skill_match_degraded": False
+    }
+    if jd_analysis:
+        state["jd_keywords"] = jd_analysis["jd_keywords"]
+        state["all_required_skills"] = jd_analysis["all_required_skills"]
+    return state
+
+
+def extract_result(final_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the response fields out of a final graph state"""
+    return {
+        "tailored_resume": final_state.get("tailored_resume", ""),
+        "summary": final_state.get("summary", ""),
+        "matched_skills": final_state.get("matched_skills", []),
+        "missing_skills": final_state.get("missing_skills", [])
+    }
+
+
+async def _stub_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Pass-through node used for the warmup dry run"""
+    return state
+
+
+async def warmup_graphs() -> None:
+    """
+    Compile every registered variant and dry-run its topology on stub nodes
+    
+    Called from the background warmup (app.warmup) so the first real
+    request does not pay for graph compilation or LangGraph's lazy first-run
+    setup.
+    """
+    for name, factory in _graph_factories.items():
+        get_compiled_graph(name)
+        
+        stub_graph = factory(None)
+        stub_nodes = {node: _stub_node for node in stub_graph.nodes}
+        await factory(stub_nodes).compile().ainvoke(
+            build_initial_state("warmup resume", "warmup job description")
+        )
+    
+    logger.info(f"Warmed up graph variants: {', '.join(_compiled_graphs)}")
+
+
+def _get_default_variant() -> str:
+    """Get the pipeline variant from environment or use default"""
+    return os.getenv("PIPELINE_VARIANT", DEFAULT_VARIANT)
+
+
+async def register_job_description(job_description: str) -> Dict[str, Any]:
+    """
+    Store a job description in the registry, extracting keywords only once
+    
+    Args:
+        job_description: Job description text
+    
+    Returns:
+        Registry entry with jd_id, jd_keywords and all_required_skills
+    
+    Raises:
+        ValueError: If the keyword analysis could not be parsed
+    """
+    # Compact first so the id matches what the graph looks up for raw text
+    job_description = compact_job_description(
+        job_description, get_token_budget("JD_TOKEN_BUDGET", 1500)
+    )
+    
+    registry = get_jd_registry()
+    entry = await registry.find_by_text(job_description)
+    if entry is not None:
+        return entry
+    
+    try:
+        jd_keywords = await analyze_job_description(job_description)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to analyze job description: {e}")
+    
+    return await registry.put(job_description, jd_keywords, collect_required_skills(jd_keywords))
+
+
+# Coalesces identical concurrent tailoring requests (double clicks, retries)
+_pipeline_flight = SingleFlight("tailor_pipeline")
+
+
+async def run_resume_tailor_pipeline(
+    resume_text: str,
+    job_description: str,
+    variant: Optional[str] = None,
+    jd_analysis: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    include_session_state: bool = False
+) -> Dict[str, Any]:
     """
     Execute the complete resume tailoring pipeline
     
+    Results are served from the result cache when an identical request
+    (same normalised inputs, model, variant and prompt templates) has been
+    tailored before. Identical requests that arrive while one is running
+    share that execution instead of starting their own. When a run fails
+    part-way, its graph state is checkpointed under the result key and a
+    retry of the same request resumes after the last completed node.
+    
     Args:
         resume_text: Original resume content
         job_description: Target job description
+        variant: Registered graph variant to run (defaults to PIPELINE_VARIANT)
+        jd_analysis: Precomputed registry entry; skips keyword extraction
+        use_cache: Look up the result cache first (fresh results are
+            stored either way)
+        include_session_state: Also return the sections, analysis and
+            rewrites a tailoring session needs, under "session_state"
     
     Returns:
         Dictionary containing tailored resume and analysis results
@@ -72,43 +381,352 @@ def run_resume_tailor_pipeline(resume_text: str, job_description: str) -> Dict[s
     Raises:
         Exception: If any step in the pipeline fails
     """
+    variant = variant or _get_default_variant()
+    key = compute_result_key(resume_text, job_description, routing_fingerprint(), variant)
+    cache = get_result_cache()
+    
+    if cache is not None and use_cache:
+        cached = await cache.get(key)
+        if cached is not None:
+            logger.info("Serving tailored resume from result cache")
+            set_current_attributes({"pipeline.variant": variant, "cache.hit": True})
+            if not include_session_state:
+                cached.pop("session_state", None)
+            return cached
+    
+    set_current_attributes({
+        "pipeline.variant": variant,
+        "cache.hit": False,
+        "single_flight.joined": bool(_pipeline_flight.in_flight(key)),
+    })
+    
+    async def execute() -> Dict[str, Any]:
+        result = await _execute_pipeline(resume_text, job_description, variant, jd_analysis, key)
+        degraded = result.pop("degraded")
+        if cache is not None:
+            if degraded:
+                # A fallback output must not be served to every retry
+                logger.warning("Not caching degraded result (a node fell back)")
+            else:
+                await cache.set(key, result)
+        return result
+    
+    result = await _pipeline_flight.do(key, execute)
+    if not include_session_state:
+        result = {field: value for field, value in result.items() if field != "session_state"}
+    # Coalesced callers must not share one mutable result
+    return copy.deepcopy(result)
+
+
+async def _execute_pipeline(
+    resume_text: str,
+    job_description: str,
+    variant: str,
+    jd_analysis: Optional[Dict[str, Any]],
+    thread_id: str
+) -> Dict[str, Any]:
+    """Run one graph execution for run_resume_tailor_pipeline"""
     logger.info("Starting resume tailor pipeline execution")
     
+    PIPELINE_IN_FLIGHT.inc()
     try:
-        # Create and compile the graph
-        workflow = create_resume_tailor_graph()
-        app = workflow.compile()
+        app = get_compiled_graph(variant)
         
         # Initialize state
-        initial_state = {
-            "resume_text": resume_text,
-            "job_description": job_description,
-            "jd_keywords": {},
-            "all_required_skills": [],
-            "matched_skills": [],
-            "missing_skills": [],
-            "tailored_resume": "",
-            "summary": ""
-        }
+        graph_input: Optional[Dict[str, Any]] = build_initial_state(resume_text, job_description, jd_analysis)
+        config: Dict[str, Any] = {}
+        resumed = False
+        
+        if checkpoints_enabled():
+            saver = get_checkpoint_saver()
+            app = app.copy({"checkpointer": saver})
+            config = {"configurable": {"thread_id": thread_id}}
+            snapshot = await app.aget_state(config)
+            if snapshot.next:
+                # An earlier attempt failed: continue from its last checkpoint
+                logger.info(f"Resuming checkpointed run {thread_id} at {', '.join(snapshot.next)}")
+                PIPELINE_RESUMES.inc()
+                graph_input, resumed = None, True
+            elif snapshot.values:
+                await saver.adelete_thread(thread_id)
         
         logger.info("Executing graph workflow")
         
-        # Run the graph
-        final_state = app.invoke(initial_state)
+        # Run the graph; node and LLM spans nest under this one, and every
+        # node's deadline budget is capped by the request deadline
+        with start_span("pipeline", {"pipeline.variant": variant, "pipeline.resumed": resumed}) as span, \
+                deadline(get_request_deadline()):
+            final_state = await app.ainvoke(graph_input, config)
+            span.set_attribute("pipeline.tokens_saved", final_state.get("tokens_saved"))
         
         logger.info("Pipeline execution completed successfully")
         
-        # Extract results
-        result = {
-            "tailored_resume": final_state.get("tailored_resume", ""),
-            "summary": final_state.get("summary", ""),
-            "matched_skills": final_state.get("matched_skills", []),
-            "missing_skills": final_state.get("missing_skills", [])
-        }
-        
-        return result
+        if config:
+            # Only failed runs are kept for resuming and inspection
+            await saver.adelete_thread(thread_id)
         
+        return {
+            **extract_result(final_state),
+            "session_state": capture_session_state(final_state),
+            "degraded": bool(final_state.get("degraded")),
+        }
+    
+    except DeadlineExceeded:
+        DEADLINES_EXCEEDED.labels("pipeline").inc()
+        logger.error(f"Pipeline execution exceeded its deadline{_checkpoint_note(thread_id)}")
+        raise
+    
     except Exception as e:
-        logger.error(f"Pipeline execution failed: {str(e)}")
+        logger.error(f"Pipeline execution failed: {str(e)}{_checkpoint_note(thread_id)}")
         raise Exception(f"Resume tailoring pipeline failed: {str(e)}")
+    
+    finally:
+        PIPELINE_IN_FLIGHT.dec()
+
+
+def _checkpoint_note(thread_id: str) -> str:
+    """Log suffix pointing at the checkpoint a failed run left behind"""
+    return f" (checkpointed as {thread_id}; a retry resumes it)" if checkpoints_enabled() else ""
+
+
+async def get_run_checkpoint(thread_id: str, variant: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Inspect the checkpoint a failed tailoring run left behind
+    
+    Args:
+        thread_id: Result key of the run (logged when it failed)
+        variant: Graph variant the run used (defaults to PIPELINE_VARIANT)
+    
+    Returns:
+        Dictionary with the graph state values, the nodes still to run
+        (next), the step and checkpoint_id, or None if nothing is stored
+    """
+    app = get_compiled_graph(variant or _get_default_variant()).copy({"checkpointer": get_checkpoint_saver()})
+    snapshot = await app.aget_state({"configurable": {"thread_id": thread_id}})
+    if not snapshot.values:
+        return None
+    return {
+        "values": snapshot.values,
+        "next": list(snapshot.next),
+        "step": (snapshot.metadata or {}).get("step"),
+        "checkpoint_id": snapshot.config["configurable"]["checkpoint_id"],
+    }
+
+
+# State fields reported in the progress event emitted after each node
+NODE_EVENT_FIELDS = {
+    "extract_keywords": ("jd_keywords", "all_required_skills"),
+    "match_skills": ("matched_skills", "missing_skills"),
+}
+
+
+async def stream_resume_tailor_pipeline(
+    resume_text: str,
+    job_description: str,
+    variant: Optional[str] = None,
+    jd_analysis: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Execute the pipeline and yield progress events as they happen
+    
+    Events are dictionaries with "event" and "data" keys:
+    - node: a node finished; data carries its name and key outputs
+    - token: decoded tailored_resume text as the rewrite is generated
+    - result: the final result (same shape as run_resume_tailor_pipeline)
+    - error: the pipeline failed; data carries the detail message
+    
+    Args:
+        resume_text: Original resume content
+        job_description: Target job description
+        variant: Registered graph variant to run (defaults to STREAM_PIPELINE_VARIANT)
+        jd_analysis: Precomputed registry entry; skips keyword extraction
+    
+    Yields:
+        Progress events in order
+    """
+    logger.info("Starting streaming resume tailor pipeline execution")
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def on_token(text: str) -> None:
+        await queue.put({"event": "token", "data": {"text": text}})
+    
+    async def produce() -> None:
+        PIPELINE_IN_FLIGHT.inc()
+        try:
+            # Token streaming needs the single-call rewrite of the standard graph
+            app = get_compiled_graph(
+                variant or os.getenv("STREAM_PIPELINE_VARIANT", STANDARD_VARIANT)
+            )
+            final_state = build_initial_state(resume_text, job_description, jd_analysis)
+            
+            # The producer task copied the request's context: spans nest under it
+            with deadline(get_request_deadline()):
+                async for update in app.astream(
+                    final_state,
+                    config={"configurable": {"on_token": on_token}},
+                    stream_mode="updates"
+                ):
+                    for node_name, node_state in update.items():
+                        node_state = node_state or {}
+                        final_state.update(node_state)
+                        data = {"node": node_name}
+                        for field in NODE_EVENT_FIELDS.get(node_name, ()):
+                            data[field] = node_state.get(field)
+                        await queue.put({"event": "node", "data": data})
+            
+            logger.info("Streaming pipeline execution completed successfully")
+            await queue.put({"event": "result", "data": extract_result(final_state)})
+        
+        except DeadlineExceeded:
+            DEADLINES_EXCEEDED.labels("pipeline").inc()
+            logger.error("Streaming pipeline execution exceeded its deadline")
+            await queue.put({
+                "event": "error",
+                "data": {"detail": "Resume tailoring timed out"}
+            })
+        
+        except Exception as e:
+            logger.error(f"Streaming pipeline execution failed: {str(e)}")
+            await queue.put({
+                "event": "error",
+                "data": {"detail": f"Resume tailoring pipeline failed: {str(e)}"}
+            })
+        
+        finally:
+            PIPELINE_IN_FLIGHT.dec()
+            await queue.put(None)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            event = await queue.get()
+            if event is None:
+                break
+            yield event
+    finally:
+        # Client went away (or we finished): never leave the graph running
+        if not producer.done():
+            producer.cancel()
+
+
+async def run_batch_tailor_pipeline(
+    resumes: List[str],
+    job_description: str,
+    concurrency: Optional[int] = None,
+    variant: Optional[str] = None,
+    use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Tailor many resumes against one job description
+    
+    The job description is analysed once; the remaining nodes then run per
+    resume with at most `concurrency` pipelines in flight. All LLM calls run
+    at batch priority so interactive requests are scheduled first.
+    
+    Args:
+        resumes: Resume texts to tailor
+        job_description: Target job description shared by all resumes
+        concurrency: Maximum concurrent pipelines (defaults to BATCH_CONCURRENCY)
+        variant: Registered graph variant to run (defaults to PIPELINE_VARIANT)
+        use_cache: Look up the result cache for each resume
+    
+    Returns:
+        One dictionary per resume, in input order, with either a "result"
+        or an "error" entry
+    """
+    if concurrency is None:
+        concurrency = int(os.getenv("BATCH_CONCURRENCY", 4))
+    
+    logger.info(f"Starting batch pipeline for {len(resumes)} resumes (concurrency={concurrency})")
+    
+    # Batch work yields LLM budget to interactive requests
+    with request_priority(PRIORITY_BATCH):
+        try:
+            jd_analysis = await register_job_description(job_description)
+        except ValueError as e:
+            # Same fallback as extract_keywords_node: continue without keywords
+            logger.error(f"Batch job description analysis failed: {e}")
+            jd_analysis = {
+                "jd_keywords": {
+                    "technical_skills": [],
+                    "soft_skills": [],
+                    "qualifications": [],
+                    "keywords": []
+                },
+                "all_required_skills": []
+            }
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_one(resume_text: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await run_resume_tailor_pipeline(
+                        resume_text,
+                        job_description,
+                        variant=variant,
+                        jd_analysis=jd_analysis,
+                        use_cache=use_cache
+                    )
+                    return {"result": result, "error": None}
+                except Exception as e:
+                    return {"result": None, "error": str(e)}
+        
+        results = await asyncio.gather(*[run_one(resume) for resume in resumes])
+    
+    failed = sum(1 for item in results if item["error"])
+    logger.info(f"Batch pipeline completed: {len(results) - failed} succeeded, {failed} failed")
+    
+    return results
+
+
+async def rank_resumes(
+    resumes: List[str],
+    job_descriptions: List[str],
+    top_k: int = 10
+) -> Dict[str, Any]:
+    """
+    Shortlist resumes against many job descriptions without calling the LLM
+    
+    Job descriptions already in the registry are scored against their
+    extracted all_required_skills; others fall back to the taxonomy skills
+    found in their text. Nothing is extracted or stored here.
+    
+    Args:
+        resumes: Resume texts
+        job_descriptions: Job description texts
+        top_k: Matches to keep per resume and per job
+    
+    Returns:
+        Dictionary with resumes_by_job, jobs_by_resume (see rank_matches)
+        and jd_ids (registry id per job, or None if it was not registered)
+    """
+    # NumPy/SciPy load on first use; tailoring-only processes never need them
+    from app.skills.ranking import rank_matches
+    
+    budget = get_token_budget("JD_TOKEN_BUDGET", 1500)
+    job_descriptions = [compact_job_description(text, budget) for text in job_descriptions]
+    registry = get_jd_registry()
+    entries = await asyncio.gather(*[registry.find_by_text(text) for text in job_descriptions])
+    
+    with start_span("rank", {"rank.resumes": len(resumes), "rank.jobs": len(job_descriptions)}):
+        # CPU-bound vector work stays off the event loop
+        ranking = await asyncio.to_thread(
+            rank_matches,
+            resumes,
+            job_descriptions,
+            [entry["all_required_skills"] if entry else None for entry in entries],
+            top_k
+        )
+    
+    cached = sum(1 for entry in entries if entry)
+    logger.info(
+        f"Ranked {len(resumes)} resumes against {len(job_descriptions)} job descriptions "
+        f"({cached} with cached skill analysis)"
+    )
+    return {**ranking, "jd_ids": [entry["jd_id"] if entry else None for entry in entries]}
+
 
+register_graph_variant(STANDARD_VARIANT, create_resume_tailor_graph)
+register_graph_variant("sectioned", create_sectioned_graph)
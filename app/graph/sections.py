@@ -0,0 +1,151 @@
+"""
+Resume section splitting for the section-parallel rewrite
+Splits plain-text resumes into ordered sections that can be rewritten
+independently and stitched back together
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+
+# Heading keyword -> section kind
+SECTION_KINDS = {
+    "summary": "summary",
+    "professional summary": "summary",
+    "profile": "summary",
+    "objective": "summary",
+    "about me": "summary",
+    "skills": "skills",
+    "technical skills": "skills",
+    "core competencies": "skills",
+    "competencies": "skills",
+    "technologies": "skills",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "employment": "experience",
+    "employment history": "experience",
+    "work history": "experience",
+    "projects": "projects",
+    "education": "education",
+    "certifications": "certifications",
+    "certificates": "certifications",
+    "awards": "other",
+    "publications": "other",
+    "languages": "other",
+    "volunteering": "other",
+}
+
+# Kinds whose content is worth rewriting for the target job
+REWRITABLE_KINDS = {"summary", "skills", "experience", "projects", "education", "certifications", "other"}
+
+_BULLET_RE = re.compile(r"^\s*([-*•▪●]|\d+[.)])\s+")
+
+
+def _heading_kind(line: str) -> Optional[str]:
+    """Return the section kind if the line is a section heading"""
+    stripped = line.strip()
+    if not stripped or len(stripped) > 40 or _BULLET_RE.match(line):
+        return None
+    
+    key = re.sub(r"[^a-z ]", "", stripped.lower().rstrip(":")).strip()
+    if key in SECTION_KINDS:
+        return SECTION_KINDS[key]
+    
+    # Unknown but heading-shaped: short ALL CAPS line or short line ending in ':'
+    letters = [ch for ch in stripped if ch.isalpha()]
+    if len(stripped.split()) <= 4 and letters and (
+        stripped.endswith(":") or all(ch.isupper() for ch in letters)
+    ):
+        return "other"
+    return None
+
+
+def _split_entries(lines: List[str]) -> List[List[str]]:
+    """Split an experience/projects body into one block per entry"""
+    entries: List[List[str]] = []
+    current: List[str] = []
+    seen_bullet = False
+    
+    for line in lines:
+        is_bullet = bool(_BULLET_RE.match(line))
+        starts_entry = line.strip() and not is_bullet and (seen_bullet or (current and not current[-1].strip()))
+        
+        if starts_entry and any(item.strip() for item in current):
+            entries.append(current)
+            current = []
+            seen_bullet = False
+        
+        current.append(line)
+        seen_bullet = seen_bullet or is_bullet
+    
+    if any(item.strip() for item in current):
+        entries.append(current)
+    return entries
+
+
+def _make_section(index: int, kind: str, title: str, lines: List[str]) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "kind": kind,
+        "title": title,
+        "text": "\n".join(lines).strip("\n"),
+    }
+
+
+def split_resume_sections(resume_text: str) -> List[Dict[str, Any]]:
+    """
+    Split a resume into ordered sections
+    
+    Text before the first heading becomes a "header" section (name and
+    contact details). Experience and projects sections are split further
+    into one section per entry; the first entry carries the heading.
+    
+    Args:
+        resume_text: Plain-text resume
+    
+    Returns:
+        Sections in document order, each with index, kind, title and text
+    """
+    blocks: List[Dict[str, Any]] = []
+    current = {"kind": "header", "title": "", "lines": []}
+    
+    for line in resume_text.splitlines():
+        kind = _heading_kind(line)
+        if kind is not None:
+            blocks.append(current)
+            current = {"kind": kind, "title": line.strip(), "lines": [line]}
+        else:
+            current["lines"].append(line)
+    blocks.append(current)
+    
+    sections: List[Dict[str, Any]] = []
+    for block in blocks:
+        if not any(line.strip() for line in block["lines"]):
+            continue
+        
+        if block["kind"] in ("experience", "projects"):
+            heading, body = block["lines"][:1], block["lines"][1:]
+            entries = _split_entries(body) or [[]]
+            entries[0] = heading + entries[0]
+            for entry in entries:
+                sections.append(_make_section(len(sections), block["kind"], block["title"], entry))
+        else:
+            sections.append(_make_section(len(sections), block["kind"], block["title"], block["lines"]))
+    
+    return sections
+
+
+def stitch_sections(sections: List[Dict[str, Any]], rewrites: Dict[int, str]) -> str:
+    """
+    Reassemble a resume from its sections
+    
+    Args:
+        sections: Sections from split_resume_sections
+        rewrites: Rewritten text by section index; missing entries keep the original
+    
+    Returns:
+        The stitched resume text
+    """
+    parts = [rewrites.get(section["index"], section["text"]).strip() for section in sections]
+    return "\n\n".join(part for part in parts if part)
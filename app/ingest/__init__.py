@@ -0,0 +1,3 @@
+"""
+Server-side resume ingestion: multipart uploads and PDF/DOCX text extraction
+"""
@@ -0,0 +1,146 @@
+"""
+Resume text extraction from uploaded documents
+Runs inside ingestion worker processes, so it imports nothing from the app
+"""
+
+import io
+import zipfile
+from typing import Optional
+from xml.etree import ElementTree
+
+
+DOC_PDF = "pdf"
+DOC_DOCX = "docx"
+DOC_TEXT = "txt"
+
+# Largest word/document.xml inflated from a DOCX (guards against zip bombs)
+MAX_DOCX_XML_BYTES = 16 * 1024 * 1024
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_EXTENSIONS = {".pdf": DOC_PDF, ".docx": DOC_DOCX, ".txt": DOC_TEXT, ".md": DOC_TEXT}
+_CONTENT_TYPES = {
+    "application/pdf": DOC_PDF,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": DOC_DOCX,
+    "text/plain": DOC_TEXT,
+    "text/markdown": DOC_TEXT,
+}
+
+
+class UnsupportedDocumentError(ValueError):
+    """The upload is not a PDF, DOCX or plain-text file"""
+
+
+class DocumentExtractionError(ValueError):
+    """The document could not be read or contains no text"""
+
+
+def detect_document_type(data: bytes, filename: Optional[str], content_type: Optional[str]) -> str:
+    """
+    Identify the document format from its magic bytes, then its name and type
+    
+    Raises:
+        UnsupportedDocumentError: If the format is not supported
+    """
+    if data.startswith(b"%PDF-"):
+        return DOC_PDF
+    if data.startswith(b"PK\x03\x04"):
+        return DOC_DOCX
+    
+    name = (filename or "").lower()
+    for extension, doc_type in _EXTENSIONS.items():
+        if name.endswith(extension):
+            if doc_type != DOC_TEXT:
+                # Named .pdf/.docx but without the matching signature
+                raise DocumentExtractionError(f"File is not a valid {doc_type.upper()} document")
+            return doc_type
+    
+    doc_type = _CONTENT_TYPES.get((content_type or "").split(";")[0].strip().lower())
+    if doc_type == DOC_TEXT or (doc_type is None and b"\x00" not in data[:1024]):
+        return DOC_TEXT
+    raise UnsupportedDocumentError("Unsupported file type. Upload a PDF, DOCX or plain-text resume")
+
+
+def extract_pdf_text(data: bytes) -> str:
+    """Text of every page of a PDF (requires pypdf)"""
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PdfReadError
+    except ImportError:
+        raise UnsupportedDocumentError("PDF uploads require the pypdf package on the server")
+    
+    try:
+        reader = PdfReader(io.BytesIO(data))
+        if reader.is_encrypted:
+            raise DocumentExtractionError("Encrypted PDFs are not supported")
+        pages = [page.extract_text() or "" for page in reader.pages]
+    except PdfReadError as e:
+        raise DocumentExtractionError(f"Could not read PDF: {e}")
+    return "\n\n".join(page.strip() for page in pages if page.strip())
+
+
+def extract_docx_text(data: bytes) -> str:
+    """Paragraph text of a DOCX body, read directly from word/document.xml"""
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            # zipfile never inflates more than the declared file_size
+            info = archive.getinfo("word/document.xml")
+            if info.file_size > MAX_DOCX_XML_BYTES:
+                raise DocumentExtractionError(
+                    f"DOCX body expands to {info.file_size} bytes (limit {MAX_DOCX_XML_BYTES})"
+                )
+            root = ElementTree.fromstring(archive.read(info))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise DocumentExtractionError(f"Could not read DOCX: {e}")
+    
+    paragraphs = []
+    for paragraph in root.iter(f"{_WORD_NS}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{_WORD_NS}t" and node.text:
+                parts.append(node.text)
+            elif node.tag == f"{_WORD_NS}tab":
+                parts.append("\t")
+            elif node.tag in (f"{_WORD_NS}br", f"{_WORD_NS}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+
+def extract_plain_text(data: bytes) -> str:
+    """Decode a text upload (UTF-8 with BOM handling, falling back to cp1252)"""
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp1252", errors="replace")
+
+
+_EXTRACTORS = {
+    DOC_PDF: extract_pdf_text,
+    DOC_DOCX: extract_docx_text,
+    DOC_TEXT: extract_plain_text,
+}
+
+
+def extract_text(data: bytes, filename: Optional[str] = None, content_type: Optional[str] = None) -> str:
+    """
+    Extract the resume text from an uploaded document
+    
+    CPU-bound; called in a worker process by the ingestion service.
+    
+    Args:
+        data: File contents
+        filename: Client-supplied file name (used as a type hint)
+        content_type: Client-supplied MIME type (used as a type hint)
+    
+    Returns:
+        Extracted text with NUL characters and surrounding blank lines removed
+    
+    Raises:
+        UnsupportedDocumentError: If the format is not supported
+        DocumentExtractionError: If the document is unreadable or has no text
+    """
+    text = _EXTRACTORS[detect_document_type(data, filename, content_type)](data)
+    text = text.replace("\x00", "").strip()
+    if not text:
+        raise DocumentExtractionError("No text could be extracted (scanned or image-only documents are not supported)")
+    return text
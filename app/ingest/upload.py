@@ -0,0 +1,329 @@
+"""
+Streaming multipart uploads and pooled, cached text extraction
+Upload bodies are spooled to a size-capped temporary file while being hashed;
+extraction runs in a process pool and is cached by content hash
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Optional
+
+from app.ingest.extract import detect_document_type, extract_text
+from app.utils.logger import logger
+from app.utils.lru import LRUCache
+from app.utils.metrics import CACHE_LOOKUPS
+from app.utils.single_flight import SingleFlight
+from app.utils.tracing import start_span
+
+
+# Room for the text fields and part headers sent alongside the resume file
+MULTIPART_OVERHEAD_BYTES = 256 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """The upload exceeds UPLOAD_MAX_BYTES"""
+
+
+class MultipartError(ValueError):
+    """The request body is not well-formed multipart/form-data"""
+
+
+def get_upload_max_bytes() -> int:
+    """Largest accepted resume file in bytes (UPLOAD_MAX_BYTES, default 5 MB)"""
+    return int(os.getenv("UPLOAD_MAX_BYTES", 5 * 1024 * 1024))
+
+
+@dataclass
+class UploadedFile:
+    """A file part spooled to memory (or disk once it outgrows the spool size)"""
+    filename: Optional[str]
+    content_type: Optional[str]
+    file: "tempfile.SpooledTemporaryFile"
+    size: int = 0
+    sha256: str = ""
+    
+    def read(self) -> bytes:
+        self.file.seek(0)
+        return self.file.read()
+    
+    def close(self) -> None:
+        self.file.close()
+
+
+@dataclass
+class MultipartForm:
+    """Text fields and files of a parsed multipart body"""
+    fields: Dict[str, str] = field(default_factory=dict)
+    files: Dict[str, UploadedFile] = field(default_factory=dict)
+    
+    def close(self) -> None:
+        for upload in self.files.values():
+            upload.close()
+
+
+_BOUNDARY_RE = re.compile(r'boundary=(?:"([^"]+)"|([^;\s]+))', re.IGNORECASE)
+_PARAM_RE = re.compile(r'(\w+)\*?=(?:"((?:[^"\\]|\\.)*)"|([^;\s]+))')
+
+
+def parse_boundary(content_type: Optional[str]) -> bytes:
+    """
+    Boundary of a multipart/form-data Content-Type header
+    
+    Raises:
+        MultipartError: If the header is not multipart/form-data with a boundary
+    """
+    if not content_type or not content_type.lower().startswith("multipart/form-data"):
+        raise MultipartError("Expected a multipart/form-data request body")
+    match = _BOUNDARY_RE.search(content_type)
+    if match is None:
+        raise MultipartError("multipart/form-data Content-Type has no boundary")
+    return (match.group(1) or match.group(2)).encode("latin-1")
+
+
+def _parse_part_headers(raw: bytes) -> Dict[str, Optional[str]]:
+    headers = {}
+    for line in raw.decode("utf-8", errors="replace").split("\r\n"):
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    
+    disposition = {}
+    for match in _PARAM_RE.finditer(headers.get("content-disposition", "")):
+        disposition[match.group(1).lower()] = match.group(2) if match.group(2) is not None else match.group(3)
+    if "name" not in disposition:
+        raise MultipartError("Multipart part without a Content-Disposition name")
+    return {
+        "name": disposition["name"],
+        "filename": disposition.get("filename"),
+        "content_type": headers.get("content-type"),
+    }
+
+
+async def read_multipart(
+    chunks: AsyncIterator[bytes],
+    boundary: bytes,
+    max_file_bytes: int,
+    max_field_bytes: int = 256 * 1024,
+    spool_bytes: int = 1024 * 1024,
+    max_total_bytes: Optional[int] = None,
+    max_parts: int = 16
+) -> MultipartForm:
+    """
+    Parse a multipart/form-data body as it streams in
+    
+    File parts are written to SpooledTemporaryFiles (in memory up to
+    `spool_bytes`, then on disk) and hashed on the way, so the body is
+    never held in memory twice and oversized uploads are rejected as soon
+    as they cross the limit rather than after they have been received.
+    
+    Args:
+        chunks: Request body chunks (e.g. Starlette's request.stream())
+        boundary: Multipart boundary from the Content-Type header
+        max_file_bytes: Size limit of each file part
+        max_field_bytes: Size limit of each text field
+        spool_bytes: File bytes kept in memory before spilling to disk
+        max_total_bytes: Size limit of the whole body (defaults to
+            max_file_bytes plus MULTIPART_OVERHEAD_BYTES)
+        max_parts: Most parts accepted in one body
+    
+    Returns:
+        The parsed fields and files (call close() to release the files)
+    
+    Raises:
+        UploadTooLargeError: If a part or the whole body exceeds its limit
+        MultipartError: If the body is malformed or truncated, has too many
+            parts or repeats a file field
+    """
+    if max_total_bytes is None:
+        max_total_bytes = max_file_bytes + MULTIPART_OVERHEAD_BYTES
+    delimiter = b"--" + boundary
+    body_end = b"\r\n" + delimiter
+    form = MultipartForm()
+    buffer = b""
+    stream = chunks.__aiter__()
+    exhausted = False
+    received = 0
+    parts = 0
+    
+    async def fill() -> None:
+        nonlocal buffer, exhausted, received
+        try:
+            chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            exhausted = True
+            return
+        # Chunked bodies carry no Content-Length, so the cap is enforced here
+        received += len(chunk)
+        if received > max_total_bytes:
+            raise UploadTooLargeError(f"Request body exceeds {max_total_bytes} bytes")
+        buffer += chunk
+    
+    try:
+        # Preamble up to the first delimiter
+        while delimiter not in buffer:
+            if exhausted:
+                raise MultipartError("Multipart body has no parts")
+            await fill()
+        buffer = buffer[buffer.index(delimiter) + len(delimiter):]
+        
+        while True:
+            while len(buffer) < 2 and not exhausted:
+                await fill()
+            if buffer.startswith(b"--"):
+                return form
+            if not buffer.startswith(b"\r\n"):
+                raise MultipartError("Malformed multipart delimiter")
+            buffer = buffer[2:]
+            
+            while b"\r\n\r\n" not in buffer:
+                if exhausted or len(buffer) > 16 * 1024:
+                    raise MultipartError("Malformed multipart part headers")
+                await fill()
+            raw_headers, buffer = buffer.split(b"\r\n\r\n", 1)
+            headers = _parse_part_headers(raw_headers)
+            parts += 1
+            if parts > max_parts:
+                raise MultipartError(f"Multipart body has more than {max_parts} parts")
+            
+            is_file = headers["filename"] is not None
+            if is_file and headers["name"] in form.files:
+                raise MultipartError(f"Duplicate file field '{headers['name']}'")
+            limit = max_file_bytes if is_file else max_field_bytes
+            digest = hashlib.sha256()
+            size = 0
+            if is_file:
+                sink = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+                upload = UploadedFile(headers["filename"], headers["content_type"], sink)
+                form.files[headers["name"]] = upload
+            else:
+                value = bytearray()
+            
+            while True:
+                end = buffer.find(body_end)
+                # Everything before a possible partial delimiter is body data
+                ready = end if end != -1 else max(len(buffer) - len(body_end) + 1, 0)
+                if ready:
+                    size += ready
+                    if size > limit:
+                        raise UploadTooLargeError(f"Part '{headers['name']}' exceeds {limit} bytes")
+                    data = buffer[:ready]
+                    if is_file:
+                        sink.write(data)
+                        digest.update(data)
+                    else:
+                        value += data
+                    buffer = buffer[ready:]
+                if end != -1:
+                    buffer = buffer[len(body_end):]
+                    break
+                if exhausted:
+                    raise MultipartError("Multipart body ended before the closing delimiter")
+                await fill()
+            
+            if is_file:
+                upload.size = size
+                upload.sha256 = digest.hexdigest()
+            else:
+                form.fields[headers["name"]] = value.decode("utf-8", errors="replace")
+    except BaseException:
+        form.close()
+        raise
+
+
+# Extraction worker processes, created on first use
+_pool: Optional[ProcessPoolExecutor] = None
+
+_text_cache: Optional[LRUCache] = None
+
+# Concurrent uploads of the same file share one extraction
+_extract_flight = SingleFlight("extract_text")
+
+
+def get_ingest_workers() -> int:
+    """Extraction processes (INGEST_WORKERS; 0 extracts in a thread instead)"""
+    return int(os.getenv("INGEST_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    
+    if _pool is None:
+        # spawn, not fork: the parent runs an event loop and other threads
+        _pool = ProcessPoolExecutor(
+            max_workers=get_ingest_workers(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"Started {get_ingest_workers()} text extraction processes")
+    return _pool
+
+
+def _get_text_cache() -> LRUCache:
+    global _text_cache
+    
+    if _text_cache is None:
+        _text_cache = LRUCache(
+            max_entries=int(os.getenv("INGEST_CACHE_SIZE", 512)),
+            max_bytes=int(os.getenv("INGEST_CACHE_MAX_CHARS", 32 * 1024 * 1024)),
+        )
+    return _text_cache
+
+
+async def extract_upload_text(upload: UploadedFile) -> str:
+    """
+    Extract the text of an uploaded resume
+    
+    Results are cached by the file's detected type and SHA-256, so
+    re-uploading the same file skips parsing entirely. The bytes are read
+    before joining a shared extraction, so the shared work never touches
+    a caller's file after that caller's request has closed it.
+    
+    Args:
+        upload: Spooled upload from read_multipart
+    
+    Returns:
+        Extracted resume text
+    
+    Raises:
+        UnsupportedDocumentError: If the format is not supported
+        DocumentExtractionError: If the document is unreadable or has no text
+    """
+    data = await asyncio.to_thread(upload.read)
+    # The same bytes named .txt and .pdf extract differently (or not at all)
+    key = f"{detect_document_type(data, upload.filename, upload.content_type)}:{upload.sha256}"
+    cache = _get_text_cache()
+    text = cache.get(key)
+    if text is not None:
+        CACHE_LOOKUPS.labels("ingest", "hit").inc()
+        logger.info(f"Extracted text cache hit for upload {upload.sha256[:12]}")
+        return text
+    CACHE_LOOKUPS.labels("ingest", "miss").inc()
+    
+    async def extract() -> str:
+        with start_span("ingest.extract_text", {"upload.bytes": upload.size, "upload.filename": upload.filename}):
+            if get_ingest_workers() > 0:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    _get_pool(), extract_text, data, upload.filename, upload.content_type
+                )
+            else:
+                result = await asyncio.to_thread(extract_text, data, upload.filename, upload.content_type)
+        cache.set(key, result)
+        logger.info(f"Extracted {len(result)} characters from {upload.size}-byte upload")
+        return result
+    
+    return await _extract_flight.do(key, extract)
+
+
+def close_ingest() -> None:
+    """Shut down the extraction processes and drop the text cache"""
+    global _pool, _text_cache
+    
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+    _text_cache = None
@@ -0,0 +1,3 @@
+"""
+Asynchronous tailoring jobs: SQLite-backed queue and worker processes
+"""
@@ -0,0 +1,77 @@
+"""
+Callback URL policy
+Client-supplied callback URLs are limited to configured prefixes and public
+addresses so jobs cannot be used to reach internal services
+"""
+
+import asyncio
+import ipaddress
+import os
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+
+def get_callback_prefixes() -> List[str]:
+    """URL prefixes client callbacks must start with (JOB_CALLBACK_ALLOWED_PREFIXES, comma-separated)"""
+    return [prefix.strip() for prefix in os.getenv("JOB_CALLBACK_ALLOWED_PREFIXES", "").split(",") if prefix.strip()]
+
+
+def _private_callbacks_allowed() -> bool:
+    """Whether callbacks may target non-public hosts (JOB_CALLBACK_ALLOW_PRIVATE, for development)"""
+    return os.getenv("JOB_CALLBACK_ALLOW_PRIVATE", "false").lower() in ("1", "true", "yes")
+
+
+def _is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    return ip.is_global and not ip.is_multicast
+
+
+async def _host_addresses(host: str) -> List[str]:
+    """IP addresses a callback host resolves to"""
+    infos = await asyncio.get_running_loop().getaddrinfo(host, None)
+    return [info[4][0] for info in infos]
+
+
+def check_callback_url(url: str) -> Optional[str]:
+    """
+    Why a client-supplied callback URL is refused (None if it is allowed)
+    
+    The URL must start with one of JOB_CALLBACK_ALLOWED_PREFIXES, when set,
+    and must not point at a loopback, private or link-local address unless
+    JOB_CALLBACK_ALLOW_PRIVATE is enabled. Only literal hosts are checked
+    here; callback_refusal() also checks what hostnames resolve to.
+    
+    Args:
+        url: The callback URL
+    """
+    prefixes = get_callback_prefixes()
+    if prefixes and not any(url.startswith(prefix) for prefix in prefixes):
+        return "callback_url does not match an allowed prefix"
+    host = urlsplit(url).hostname
+    if not host:
+        return "callback_url has no host"
+    if _private_callbacks_allowed():
+        return None
+    if host == "localhost" or host.endswith(".localhost"):
+        return f"callback host {host} is not public"
+    try:
+        if not _is_public_address(host):
+            return f"callback host {host} is not public"
+    except ValueError:
+        pass
+    return None
+
+
+async def callback_refusal(url: str) -> Optional[str]:
+    """check_callback_url() plus the addresses the host resolves to (checked before each delivery)"""
+    refusal = check_callback_url(url)
+    if refusal or _private_callbacks_allowed():
+        return refusal
+    host = urlsplit(url).hostname
+    try:
+        addresses = await _host_addresses(host)
+    except OSError as e:
+        return f"cannot resolve {host}: {e}"
+    if not all(_is_public_address(address) for address in addresses):
+        return f"callback host {host} resolves to a non-public address"
+    return None
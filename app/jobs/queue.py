@@ -0,0 +1,344 @@
+"""
+SQLite-backed job queue
+Jobs are leased to workers for a visibility timeout; a lease that is not
+completed or renewed in time (e.g. the worker crashed) returns the job to
+the queue
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from app.storage.sqlite import connect, get_database_path
+from app.utils.logger import logger
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class JobQueue:
+    """
+    Persistent queue of tailoring jobs shared by the API and worker processes
+    
+    Every method is a short SQLite transaction, so several processes can use
+    the same database file. Claiming uses BEGIN IMMEDIATE, which serialises
+    concurrent claimers and guarantees a job is leased to one worker at a time.
+    """
+    
+    def __init__(self, db_path: str):
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                callback_url TEXT,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                callback_status TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, available_at)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def _to_job(row) -> Dict[str, Any]:
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+    
+    def enqueue(
+        self,
+        payload: Dict[str, Any],
+        callback_url: Optional[str] = None,
+        max_attempts: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Add a job to the queue
+        
+        Args:
+            payload: Pipeline inputs (resume_text, job_description)
+            callback_url: URL notified when the job finishes
+            max_attempts: Attempts before the job is marked failed
+        
+        Returns:
+            The stored job
+        """
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO jobs
+                    (job_id, status, payload, callback_url, max_attempts,
+                     available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, JOB_QUEUED, json.dumps(payload), callback_url, max_attempts, now, now, now)
+            )
+            self._conn.commit()
+        logger.info(f"Enqueued job {job_id}")
+        return self.get(job_id)
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a job by id (None if unknown)"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row is not None else None
+    
+    def claim(self, worker_id: str, visibility_timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Lease the oldest available job to a worker
+        
+        Queued jobs whose retry delay has passed are available, and so are
+        running jobs whose lease has expired (crash recovery) while they
+        have attempts left; expire_leases() fails the others.
+        
+        Args:
+            worker_id: Identifier of the claiming worker
+            visibility_timeout: Seconds the job stays leased without renewal
+        
+        Returns:
+            The leased job, or None if nothing is available
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute(
+                    """
+                    SELECT job_id FROM jobs
+                    WHERE (status = ? AND available_at <= ?)
+                       OR (status = ? AND lease_expires_at <= ? AND attempts < max_attempts)
+                    ORDER BY available_at
+                    LIMIT 1
+                    """,
+                    (JOB_QUEUED, now, JOB_RUNNING, now)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        """
+                        UPDATE jobs
+                        SET status = ?, attempts = attempts + 1, lease_owner = ?,
+                            lease_expires_at = ?, updated_at = ?
+                        WHERE job_id = ?
+                        """,
+                        (JOB_RUNNING, worker_id, now + visibility_timeout, now, row["job_id"])
+                    )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        
+        if row is None:
+            return None
+        job = self.get(row["job_id"])
+        if job["attempts"] > 1:
+            logger.warning(f"Job {job['job_id']} reclaimed by {worker_id} (attempt {job['attempts']})")
+        return job
+    
+    def expire_leases(self) -> List[Dict[str, Any]]:
+        """
+        Fail running jobs whose lease expired after their last attempt
+        
+        Returns:
+            The jobs just marked failed (their callbacks are still due)
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                rows = self._conn.execute(
+                    """
+                    SELECT job_id FROM jobs
+                    WHERE status = ? AND lease_expires_at <= ? AND attempts >= max_attempts
+                    """,
+                    (JOB_RUNNING, now)
+                ).fetchall()
+                self._conn.executemany(
+                    """
+                    UPDATE jobs
+                    SET status = ?, error = COALESCE(error, 'Visibility timeout expired'),
+                        lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                    WHERE job_id = ?
+                    """,
+                    [(JOB_FAILED, now, row["job_id"]) for row in rows]
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        
+        expired = [self.get(row["job_id"]) for row in rows]
+        for job in expired:
+            logger.warning(f"Job {job['job_id']} failed: lease expired after attempt {job['attempts']}")
+        return expired
+    
+    def _update_leased(self, job_id: str, worker_id: str, sql: str, params: tuple) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                sql + " WHERE job_id = ? AND status = ? AND lease_owner = ?",
+                params + (job_id, JOB_RUNNING, worker_id)
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+    
+    def extend_lease(self, job_id: str, worker_id: str, visibility_timeout: float) -> bool:
+        """Renew a lease; False if the worker no longer owns the job"""
+        now = time.time()
+        return self._update_leased(
+            job_id, worker_id,
+            "UPDATE jobs SET lease_expires_at = ?, updated_at = ?",
+            (now + visibility_timeout, now)
+        )
+    
+    def complete(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> bool:
+        """Store a job's result; False if the lease was lost meanwhile"""
+        return self._update_leased(
+            job_id, worker_id,
+            """
+            UPDATE jobs SET status = ?, result = ?, error = NULL,
+                lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+            """,
+            (JOB_SUCCEEDED, json.dumps(result), time.time())
+        )
+    
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: float) -> Optional[str]:
+        """
+        Record a failed attempt, requeueing the job if attempts remain
+        
+        Returns:
+            The job's new status, or None if the lease was lost meanwhile
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs
+                SET status = CASE WHEN attempts < max_attempts THEN ? ELSE ? END,
+                    error = ?, available_at = ?, lease_owner = NULL,
+                    lease_expires_at = NULL, updated_at = ?
+                WHERE job_id = ? AND status = ? AND lease_owner = ?
+                """,
+                (JOB_QUEUED, JOB_FAILED, error, now + retry_delay, now, job_id, JOB_RUNNING, worker_id)
+            )
+            self._conn.commit()
+        if cursor.rowcount != 1:
+            return None
+        return self.get(job_id)["status"]
+    
+    def record_callback(self, job_id: str, callback_status: str) -> None:
+        """Remember the outcome of the completion callback"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET callback_status = ?, updated_at = ? WHERE job_id = ?",
+                (callback_status, time.time(), job_id)
+            )
+            self._conn.commit()
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+    
+    async def aenqueue(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """enqueue() without blocking the event loop"""
+        return await asyncio.to_thread(self.enqueue, *args, **kwargs)
+    
+    async def aget(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """get() without blocking the event loop"""
+        return await asyncio.to_thread(self.get, job_id)
+    
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+def public_job_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job fields exposed by the API and sent to callbacks"""
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "result": job["result"],
+        "error": job["error"] if job["status"] == JOB_FAILED else None,
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+    }
+
+
+def get_worker_count() -> int:
+    """
+    Number of worker processes started with the API (JOB_WORKERS, default 0)
+    
+    Off by default: in-process workers take their share of the Groq budget
+    from the API process even while the queue is idle, and every
+    `uvicorn --workers` process would start its own. Run
+    `python -m app.jobs.worker` to consume jobs separately instead.
+    """
+    return int(os.getenv("JOB_WORKERS") or 0)
+
+
+def get_worker_rate_share(worker_count: int) -> float:
+    """
+    Fraction of the Groq budget reserved for all job workers together
+    
+    JOB_WORKER_RATE_SHARE overrides the default, which gives the API
+    process and each worker an equal share. Set it in both the API and a
+    standalone worker pool so they split the budget the same way.
+    
+    Args:
+        worker_count: Number of worker processes
+    """
+    configured = os.getenv("JOB_WORKER_RATE_SHARE")
+    if configured:
+        return min(max(float(configured), 0.0), 1.0)
+    return worker_count / (worker_count + 1)
+
+
+def get_job_queue_path() -> str:
+    """Database file of the job queue (JOB_QUEUE_PATH, defaults to DATABASE_PATH)"""
+    return os.getenv("JOB_QUEUE_PATH") or get_database_path()
+
+
+_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue, creating it on first use"""
+    global _queue
+    
+    if _queue is None:
+        _queue = JobQueue(get_job_queue_path())
+    return _queue
+
+
+def close_job_queue() -> None:
+    """Close the process-wide job queue if it was opened"""
+    global _queue
+    
+    if _queue is not None:
+        _queue.close()
+        _queue = None
@@ -0,0 +1,261 @@
+"""
+Job worker processes
+Each worker claims jobs from the SQLite queue, runs the tailoring pipeline
+and reports the outcome (optionally to a callback URL)
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import multiprocessing
+import os
+import signal
+import socket
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.jobs.callbacks import callback_refusal
+from app.jobs.queue import (
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    JobQueue,
+    get_job_queue_path,
+    get_worker_count,
+    get_worker_rate_share,
+    public_job_view,
+)
+from app.llm.rate_limiter import PRIORITY_BATCH, request_priority, set_rate_budget_share
+from app.utils.logger import bind_request_id, logger
+from app.utils.tracing import shutdown_tracing, start_span
+
+
+def get_visibility_timeout() -> float:
+    """Seconds a claimed job stays leased without a heartbeat (JOB_VISIBILITY_TIMEOUT)"""
+    return float(os.getenv("JOB_VISIBILITY_TIMEOUT", 120))
+
+
+def get_retry_delay(attempt: int) -> float:
+    """Delay before re-running a failed job: JOB_RETRY_DELAY_SECONDS doubling per attempt"""
+    return float(os.getenv("JOB_RETRY_DELAY_SECONDS", 5)) * (2 ** max(attempt - 1, 0))
+
+
+async def deliver_callback(job: Dict[str, Any], attempts: int = 3) -> str:
+    """
+    POST the finished job to its callback URL
+    
+    The body is the public job view. When JOB_CALLBACK_SECRET is set, an
+    X-Signature header carries its HMAC-SHA256 of the body so receivers can
+    verify the sender. URLs other than the operator's JOB_CALLBACK_URL are
+    refused unless callback_refusal() allows them.
+    
+    Returns:
+        "delivered" or a short failure description
+    """
+    if job["callback_url"] != os.getenv("JOB_CALLBACK_URL"):
+        refusal = await callback_refusal(job["callback_url"])
+        if refusal:
+            logger.warning(f"Callback for job {job['job_id']} blocked: {refusal}")
+            return f"blocked: {refusal}"
+    
+    body = json.dumps(public_job_view(job)).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    secret = os.getenv("JOB_CALLBACK_SECRET")
+    if secret:
+        signature = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        headers["X-Signature"] = f"sha256={signature}"
+    
+    outcome = "not attempted"
+    async with httpx.AsyncClient(timeout=float(os.getenv("JOB_CALLBACK_TIMEOUT", 10))) as client:
+        for attempt in range(attempts):
+            try:
+                response = await client.post(job["callback_url"], content=body, headers=headers)
+                if response.status_code < 400:
+                    return "delivered"
+                outcome = f"HTTP {response.status_code}"
+                if response.status_code < 500:
+                    break
+            except httpx.HTTPError as e:
+                outcome = f"{e.__class__.__name__}: {e}"
+            if attempt < attempts - 1:
+                await asyncio.sleep(2 ** attempt)
+    
+    logger.warning(f"Callback for job {job['job_id']} failed: {outcome}")
+    return outcome
+
+
+async def _heartbeat(queue: JobQueue, job_id: str, worker_id: str, visibility_timeout: float) -> None:
+    """Renew the job's lease while the pipeline runs"""
+    while True:
+        await asyncio.sleep(visibility_timeout / 3)
+        renewed = await asyncio.to_thread(queue.extend_lease, job_id, worker_id, visibility_timeout)
+        if not renewed:
+            logger.warning(f"Worker {worker_id} lost the lease on job {job_id}")
+            return
+
+
+async def _notify(queue: JobQueue, job: Dict[str, Any]) -> None:
+    """Deliver a finished job's callback, if it has one, and record the outcome"""
+    if job["callback_url"]:
+        await asyncio.to_thread(queue.record_callback, job["job_id"], await deliver_callback(job))
+
+
+async def process_next_job(queue: JobQueue, worker_id: str) -> bool:
+    """
+    Claim and run one job
+    
+    Jobs whose last attempt's lease expired are failed (and their callbacks
+    sent) first.
+    
+    Args:
+        queue: Job queue to consume
+        worker_id: Identifier recorded as the lease owner
+    
+    Returns:
+        True if a job was processed, False if the queue had nothing ready
+    """
+    # Imported here so the API process can load this module without LangGraph
+    from app.graph.pipeline import run_resume_tailor_pipeline
+    
+    for expired in await asyncio.to_thread(queue.expire_leases):
+        await _notify(queue, expired)
+    
+    visibility_timeout = get_visibility_timeout()
+    job = await asyncio.to_thread(queue.claim, worker_id, visibility_timeout)
+    if job is None:
+        return False
+    
+    job_id = job["job_id"]
+    logger.info(f"Worker {worker_id} running job {job_id} (attempt {job['attempts']})")
+    heartbeat = asyncio.create_task(_heartbeat(queue, job_id, worker_id, visibility_timeout))
+    
+    try:
+        with request_priority(PRIORITY_BATCH), bind_request_id(job_id), start_span(
+            "job", {"job.id": job_id, "job.attempt": job["attempts"], "job.worker": worker_id}
+        ):
+            result = await run_resume_tailor_pipeline(
+                job["payload"]["resume_text"],
+                job["payload"]["job_description"]
+            )
+        status = JOB_SUCCEEDED if await asyncio.to_thread(queue.complete, job_id, worker_id, result) else None
+    except Exception as e:
+        logger.error(f"Job {job_id} attempt {job['attempts']} failed: {e}")
+        status = await asyncio.to_thread(
+            queue.fail, job_id, worker_id, str(e), get_retry_delay(job["attempts"])
+        )
+    finally:
+        heartbeat.cancel()
+    
+    if status is None:
+        # Lease expired and another worker took over; it owns the outcome now
+        logger.warning(f"Worker {worker_id} discarded outcome of job {job_id}: lease lost")
+    elif status in (JOB_SUCCEEDED, JOB_FAILED):
+        logger.info(f"Job {job_id} {status}")
+        await _notify(queue, await asyncio.to_thread(queue.get, job_id))
+    return True
+
+
+async def run_worker(
+    worker_id: str,
+    queue: Optional[JobQueue] = None,
+    stop: Optional[asyncio.Event] = None
+) -> None:
+    """
+    Consume jobs until `stop` is set
+    
+    Args:
+        worker_id: Identifier recorded as the lease owner
+        queue: Job queue (defaults to one opened on JOB_QUEUE_PATH)
+        stop: Event that ends the loop after the current job
+    """
+    queue = queue or JobQueue(get_job_queue_path())
+    stop = stop or asyncio.Event()
+    poll_interval = float(os.getenv("JOB_POLL_INTERVAL", 1.0))
+    logger.info(f"Job worker {worker_id} started")
+    
+    while not stop.is_set():
+        try:
+            processed = await process_next_job(queue, worker_id)
+        except Exception as e:
+            logger.error(f"Job worker {worker_id} error: {e}", exc_info=True)
+            processed = False
+        if not processed:
+            try:
+                await asyncio.wait_for(stop.wait(), poll_interval)
+            except asyncio.TimeoutError:
+                pass
+    
+    logger.info(f"Job worker {worker_id} stopped")
+
+
+def _worker_main(index: int, worker_count: int) -> None:
+    """Entry point of a worker process"""
+    # Each process has its own rate limiter: the workers split their share of
+    # the Groq budget, and the API process keeps the rest
+    set_rate_budget_share(get_worker_rate_share(worker_count) / worker_count)
+    
+    worker_id = f"{socket.gethostname()}-{os.getpid()}-{index}"
+    
+    async def main() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        await run_worker(worker_id, stop=stop)
+    
+    asyncio.run(main())
+    shutdown_tracing()
+
+
+class WorkerPool:
+    """Fixed-size pool of worker processes consuming the job queue"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._processes: List[multiprocessing.Process] = []
+    
+    def start(self) -> None:
+        """Spawn the worker processes"""
+        # spawn, not fork: the parent runs an event loop and holds SQLite handles
+        context = multiprocessing.get_context("spawn")
+        for index in range(self.size):
+            process = context.Process(
+                target=_worker_main,
+                args=(index, self.size),
+                name=f"job-worker-{index}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+        logger.info(f"Started {self.size} job worker processes")
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """Ask workers to finish their current job, then terminate stragglers"""
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+        self._processes.clear()
+        logger.info("Stopped job worker processes")
+
+
+if __name__ == "__main__":
+    # Standalone workers: python -m app.jobs.worker
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    pool = WorkerPool(get_worker_count() or 1)
+    pool.start()
+    # Block after spawning so the workers keep their own signal handling
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+    try:
+        signal.sigwait({signal.SIGINT, signal.SIGTERM})
+    finally:
+        pool.stop()
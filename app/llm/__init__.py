@@ -0,0 +1,3 @@
+"""
+Groq LLM client management and call helpers
+"""
@@ -0,0 +1,325 @@
+"""
+Shared async Groq client
+Owns the process-wide AsyncGroq instance and its pooled HTTP/2 connections
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+from groq import APIConnectionError, AsyncGroq, InternalServerError, RateLimitError
+
+from app.llm.rate_limiter import backoff_delay, get_rate_limiter, parse_retry_after
+from app.utils.deadline import DeadlineExceeded, remaining, within_deadline
+from app.utils.logger import logger, preview
+from app.utils.metrics import LLM_REQUEST_DURATION, LLM_RETRIES, LLM_TOKENS
+from app.utils.text import estimate_tokens
+from app.utils.tracing import KIND_CLIENT, set_current_attributes, start_span
+
+
+SYSTEM_PROMPT = (
+    "You are an expert resume writer and career consultant. "
+    "Provide accurate, professional, and actionable insights."
+)
+
+# Process-wide client, created in the FastAPI lifespan (or lazily on first use)
+_client: Optional[AsyncGroq] = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Build the pooled httpx client shared by all Groq calls"""
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("GROQ_MAX_CONNECTIONS", 100)),
+        max_keepalive_connections=int(os.getenv("GROQ_MAX_KEEPALIVE", 20)),
+        keepalive_expiry=float(os.getenv("GROQ_KEEPALIVE_EXPIRY", 60)),
+    )
+    return httpx.AsyncClient(
+        http2=True,
+        limits=limits,
+        timeout=httpx.Timeout(float(os.getenv("GROQ_TIMEOUT", 60)), connect=10.0),
+    )
+
+
+def init_groq_client() -> AsyncGroq:
+    """
+    Create the shared AsyncGroq client if it does not exist yet
+    
+    Returns:
+        The process-wide AsyncGroq client
+    
+    Raises:
+        ValueError: If GROQ_API_KEY is not set
+    """
+    global _client
+    
+    if _client is None:
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise ValueError("GROQ_API_KEY environment variable is not set")
+        # Retries are handled by _create_completion so they respect the
+        # shared rate limiter instead of the SDK's own backoff
+        _client = AsyncGroq(api_key=api_key, http_client=_build_http_client(), max_retries=0)
+        logger.info("Initialized shared Groq client (HTTP/2, keep-alive pool)")
+    
+    return _client
+
+
+def get_groq_client() -> AsyncGroq:
+    """Get the shared Groq client, creating it on first use"""
+    return _client if _client is not None else init_groq_client()
+
+
+async def close_groq_client() -> None:
+    """Close the shared Groq client and its connection pool"""
+    global _client
+    
+    if _client is not None:
+        await _client.close()
+        _client = None
+        logger.info("Closed shared Groq client")
+
+
+def get_model_name() -> str:
+    """Get model name from environment or use default"""
+    return os.getenv("MODEL_NAME", "llama-3.3-70b-versatile")
+
+
+def json_mode_enabled() -> bool:
+    """Whether JSON-mode requests are enabled (GROQ_JSON_MODE, default on)"""
+    return os.getenv("GROQ_JSON_MODE", "true").lower() in ("1", "true", "yes")
+
+
+def record_usage(model: str, usage: Any) -> None:
+    """Count the prompt and completion tokens of a response's usage field"""
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    LLM_TOKENS.labels(model, "prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels(model, "completion").inc(completion_tokens)
+    set_current_attributes({
+        "llm.usage.prompt_tokens": prompt_tokens,
+        "llm.usage.completion_tokens": completion_tokens,
+    })
+
+
+def _span_attributes(model: str, prompt: str, temperature: float, max_tokens: int) -> Dict[str, Any]:
+    return {
+        "llm.model": model,
+        "llm.temperature": temperature,
+        "llm.max_tokens": max_tokens,
+        "llm.prompt_chars": len(prompt),
+        "llm.prompt_tokens_estimate": estimate_tokens(prompt),
+    }
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying a failed call, or None if not retryable
+    
+    A 429 also pauses the shared rate limiter so every queued call backs off,
+    not just the one that was rejected.
+    """
+    if isinstance(error, RateLimitError):
+        retry_after = parse_retry_after(error.response.headers.get("retry-after"))
+        delay = backoff_delay(attempt, retry_after)
+        get_rate_limiter().pause(delay)
+        return delay
+    if isinstance(error, (APIConnectionError, InternalServerError)):
+        return backoff_delay(attempt)
+    return None
+
+
+async def _create_completion(prompt: str, max_tokens: int, **kwargs: Any) -> Any:
+    """
+    Create a chat completion through the rate limiter, retrying transient
+    failures (429, 5xx, connection errors) up to GROQ_MAX_RETRIES times
+    
+    Rate-limiter waits, attempts and backoff sleeps all count against the
+    current deadline; no retry is started that could not finish before it.
+    
+    Args:
+        prompt: The user prompt
+        max_tokens: Maximum tokens in response (reserved against the TPM budget)
+        **kwargs: Extra arguments for chat.completions.create
+    
+    Returns:
+        The completion (or stream) returned by the Groq SDK
+    
+    Raises:
+        DeadlineExceeded: If the current deadline passes first
+    """
+    client = get_groq_client()
+    limiter = get_rate_limiter()
+    estimate = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt) + max_tokens
+    max_retries = int(os.getenv("GROQ_MAX_RETRIES", 3))
+    
+    model = kwargs.get("model", "")
+    
+    attempt = 0
+    while True:
+        # Waiting for rate-limiter budget counts against the deadline too
+        reserved = await within_deadline(limiter.acquire(estimate))
+        start = time.perf_counter()
+        try:
+            set_current_attributes({"llm.attempts": attempt + 1})
+            completion = await within_deadline(client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                max_tokens=max_tokens,
+                **kwargs,
+            ))
+        except (DeadlineExceeded, asyncio.CancelledError) as e:
+            # The request may have been processed: keep the full reservation
+            outcome = "deadline" if isinstance(e, DeadlineExceeded) else "cancelled"
+            LLM_REQUEST_DURATION.labels(model, outcome).observe(time.perf_counter() - start)
+            raise
+        except Exception as e:
+            LLM_REQUEST_DURATION.labels(model, e.__class__.__name__).observe(time.perf_counter() - start)
+            limiter.release(reserved, 0)
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt >= max_retries:
+                raise
+            left = remaining()
+            if left is not None and delay >= left:
+                logger.warning(f"Groq API call failed ({e.__class__.__name__}); no time left to retry")
+                raise
+            logger.warning(f"Groq API call failed ({e.__class__.__name__}), retrying in {delay:.1f}s")
+            LLM_RETRIES.labels(e.__class__.__name__).inc()
+            attempt += 1
+            if not isinstance(e, RateLimitError):
+                await asyncio.sleep(delay)
+            continue
+        
+        LLM_REQUEST_DURATION.labels(model, "ok").observe(time.perf_counter() - start)
+        usage = getattr(completion, "usage", None)
+        record_usage(model, usage)
+        limiter.release(reserved, getattr(usage, "total_tokens", None))
+        return completion
+
+
+async def call_groq_api(
+    prompt: str,
+    temperature: float = 0.3,
+    max_tokens: int = 2000,
+    json_mode: bool = False,
+    model: Optional[str] = None
+) -> str:
+    """
+    Call the Groq chat completions API on the shared client
+    
+    Calls are scheduled by the shared rate limiter, transient failures
+    are retried with jittered exponential backoff, and the whole call is
+    bounded by the current deadline (see app.utils.deadline).
+    
+    Args:
+        prompt: The prompt to send to the model
+        temperature: Temperature for response generation
+        max_tokens: Maximum tokens in response
+        json_mode: Ask the model for a single JSON object
+            (response_format json_object; the prompt must mention JSON)
+        model: Model to call (default MODEL_NAME)
+    
+    Returns:
+        Generated text response
+    """
+    model_name = model or get_model_name()
+    
+    extra_args = {}
+    if json_mode and json_mode_enabled():
+        extra_args["response_format"] = {"type": "json_object"}
+    
+    attributes = _span_attributes(model_name, prompt, temperature, max_tokens)
+    attributes["llm.json_mode"] = "response_format" in extra_args
+    
+    try:
+        logger.info(f"Calling Groq API with model: {model_name}")
+        
+        with start_span("llm.chat_completion", attributes, kind=KIND_CLIENT) as span:
+            chat_completion = await _create_completion(
+                prompt,
+                max_tokens,
+                model=model_name,
+                temperature=temperature,
+                **extra_args,
+            )
+            
+            response = chat_completion.choices[0].message.content
+            span.set_attribute("llm.response_chars", len(response or ""))
+        
+        logger.info("Groq API call successful")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Groq response: {preview(response)}")
+        return response
+    
+    except Exception as e:
+        logger.error(f"Groq API call failed: {str(e)}")
+        raise
+
+
+async def stream_groq_api(
+    prompt: str,
+    temperature: float = 0.3,
+    max_tokens: int = 2000,
+    model: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Stream a Groq chat completion as text deltas
+    
+    Args:
+        prompt: The prompt to send to the model
+        temperature: Temperature for response generation
+        max_tokens: Maximum tokens in response
+        model: Model to call (default MODEL_NAME)
+    
+    Yields:
+        Content deltas in generation order
+    """
+    model_name = model or get_model_name()
+    
+    attributes = _span_attributes(model_name, prompt, temperature, max_tokens)
+    attributes["llm.stream"] = True
+    
+    try:
+        logger.info(f"Streaming Groq API with model: {model_name}")
+        
+        with start_span("llm.chat_completion", attributes, kind=KIND_CLIENT) as span:
+            stream = await _create_completion(
+                prompt,
+                max_tokens,
+                model=model_name,
+                temperature=temperature,
+                stream=True,
+            )
+            
+            response_chars = 0
+            chunks = stream.__aiter__()
+            while True:
+                # A stalled stream is abandoned once the deadline passes
+                try:
+                    chunk = await within_deadline(chunks.__anext__())
+                except StopAsyncIteration:
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    response_chars += len(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+                # Groq reports usage on the final chunk of a stream
+                record_usage(model_name, getattr(getattr(chunk, "x_groq", None), "usage", None))
+            span.set_attribute("llm.response_chars", response_chars)
+        
+        logger.info("Groq API stream completed")
+    
+    except Exception as e:
+        logger.error(f"Groq API stream failed: {str(e)}")
+        raise
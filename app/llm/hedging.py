@@ -0,0 +1,185 @@
+"""
+Per-node deadlines and hedged LLM requests
+A call still running past its node's observed p95 latency gets a duplicate;
+the first response wins and the other is cancelled
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from app.llm.rate_limiter import get_rate_limiter
+from app.utils.logger import logger
+from app.utils.metrics import LLM_HEDGES
+from app.utils.tracing import set_current_attributes
+
+T = TypeVar("T")
+
+# Default time budget of each LLM-calling node in seconds (NODE_DEADLINE_<NODE>)
+NODE_DEADLINES = {
+    "extract_keywords": 20.0,
+    "match_skills": 20.0,
+    "rewrite_resume": 45.0,
+    "rewrite_section": 30.0,
+    "write_summary": 20.0,
+}
+
+
+def get_request_deadline() -> Optional[float]:
+    """Overall time budget of one pipeline run (REQUEST_DEADLINE_SECONDS, 0 disables)"""
+    seconds = float(os.getenv("REQUEST_DEADLINE_SECONDS", 60))
+    return seconds if seconds > 0 else None
+
+
+def get_node_deadline(node: str) -> Optional[float]:
+    """Time budget of one node's LLM calls (NODE_DEADLINE_<NODE>, 0 disables)"""
+    seconds = float(os.getenv(f"NODE_DEADLINE_{node.upper()}", NODE_DEADLINES.get(node, 0)))
+    return seconds if seconds > 0 else None
+
+
+def hedging_enabled() -> bool:
+    """Whether slow calls are hedged (LLM_HEDGING, default on)"""
+    return os.getenv("LLM_HEDGING", "true").lower() in ("1", "true", "yes")
+
+
+class LatencyTracker:
+    """
+    Recent call latencies per key, for quantile estimates
+    
+    Keeps a sliding window of the last `window` samples per key, so the
+    hedging threshold follows the upstream's current behaviour.
+    """
+    
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+    
+    def record(self, key: str, seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+    
+    def count(self, key: str) -> int:
+        return len(self._samples.get(key, ()))
+    
+    def quantile(self, key: str, q: float) -> Optional[float]:
+        """The q-quantile of the recorded latencies (None without samples)"""
+        samples = self._samples.get(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Hedger:
+    """
+    Sends a duplicate of calls that run past their key's latency quantile
+    
+    Hedges are sent only once a key has HEDGE_MIN_SAMPLES latencies, only
+    while the shared rate limiter could grant the duplicate without
+    queueing (so hedging never competes with waiting calls for budget), and
+    at most for HEDGE_MAX_FRACTION of calls.
+    """
+    
+    def __init__(self):
+        self.latencies = LatencyTracker(int(os.getenv("HEDGE_WINDOW", 200)))
+        self.quantile = float(os.getenv("HEDGE_QUANTILE", 0.95))
+        self.min_samples = int(os.getenv("HEDGE_MIN_SAMPLES", 20))
+        self.min_delay = float(os.getenv("HEDGE_MIN_DELAY", 0.5))
+        self.max_fraction = float(os.getenv("HEDGE_MAX_FRACTION", 0.1))
+        self.calls = 0
+        self.hedges = 0
+    
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds after which a call for `key` is hedged (None: not yet)"""
+        if self.latencies.count(key) < self.min_samples:
+            return None
+        return max(self.latencies.quantile(key, self.quantile), self.min_delay)
+    
+    def _may_hedge(self, tokens: int) -> bool:
+        if self.hedges + 1 > self.max_fraction * self.calls:
+            return False
+        return get_rate_limiter().has_capacity(tokens)
+    
+    async def call(self, key: str, func: Callable[[], Awaitable[T]], tokens: int = 0) -> T:
+        """
+        Run `func`, hedging it with a second `func()` if it is slow
+        
+        Args:
+            key: Latency class of the call (e.g. the node name)
+            func: Zero-argument coroutine function making the call
+            tokens: Estimated token cost of one call (for the limiter check)
+        
+        Returns:
+            The result of whichever attempt succeeds first
+        
+        Calls that fail or are cancelled (e.g. by the node deadline) record
+        their elapsed time too, capped at the node deadline, so a slowing
+        upstream raises the hedging threshold instead of only the fast
+        successes being counted.
+        """
+        self.calls += 1
+        delay = self.hedge_delay(key) if hedging_enabled() else None
+        start = time.monotonic()
+        primary = asyncio.ensure_future(func())
+        hedge = None
+        tasks = {primary}
+        recorded = False
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    if self._may_hedge(tokens):
+                        self.hedges += 1
+                        LLM_HEDGES.labels(key, "sent").inc()
+                        set_current_attributes({"llm.hedged": True})
+                        logger.info(f"{key}: call exceeded p{int(self.quantile * 100)} ({delay:.2f}s), sending hedge")
+                        hedge = asyncio.ensure_future(func())
+                        tasks.add(hedge)
+                    else:
+                        LLM_HEDGES.labels(key, "skipped").inc()
+            
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if hedge is not None:
+                            LLM_HEDGES.labels(key, "won" if task is hedge else "lost").inc()
+                        self.latencies.record(key, time.monotonic() - start)
+                        recorded = True
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                # Let cancelled attempts unwind (and record their outcome)
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if not recorded:
+                elapsed = time.monotonic() - start
+                cap = get_node_deadline(key)
+                self.latencies.record(key, min(elapsed, cap) if cap else elapsed)
+
+
+# Process-wide hedger, built from the environment on first use
+_hedger: Optional[Hedger] = None
+
+
+def get_hedger() -> Hedger:
+    """Get the shared hedger"""
+    global _hedger
+    
+    if _hedger is None:
+        _hedger = Hedger()
+    return _hedger
+
+
+def reset_hedger() -> None:
+    """Drop the shared hedger (and its latency history)"""
+    global _hedger
+    _hedger = None
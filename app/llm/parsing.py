@@ -0,0 +1,246 @@
+"""
+Tolerant JSON parsing for LLM responses
+One shared parser for every node: an orjson fast path, then a single-pass
+repair scanner for the ways models commonly break JSON
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+import orjson
+
+from app.utils.metrics import JSON_PARSE
+from app.utils.tracing import set_current_attributes
+
+
+# Parse paths, reported for metrics and tracing
+PARSE_FAST = "fast"
+PARSE_EXTRACTED = "extracted"
+PARSE_REPAIRED = "repaired"
+# Repaired by closing a string/object cut off by max_tokens: the content is incomplete
+PARSE_TRUNCATED = "truncated"
+PARSE_FAILED = "failed"
+
+_VALID_ESCAPES = set('"\\/bfnrtu')
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+# Characters the repair scanner stops at outside strings. Inside strings it
+# only stops at quotes and backslashes (found with str.find, which is far
+# faster than a regex character class), and raw control characters are
+# escaped per segment rather than one by one
+_STRUCTURAL_RE = re.compile(r'["{}\[\]]')
+_CONTROL_RE = re.compile(r"[\x00-\x1f]")
+_COMMON_CONTROLS = (("\n", "\\n"), ("\r", "\\r"), ("\t", "\\t"))
+_RARE_CONTROLS = tuple(chr(code) for code in range(0x20) if chr(code) not in "\n\r\t")
+
+# Below this length a segment is checked with isprintable() and escaped with
+# one regex pass; above it, C-level find/replace per character is cheaper
+_SHORT_SEGMENT = 128
+
+
+def _extract_object(text: str) -> str:
+    """Cut the text down to the outermost JSON object (drops fences and prose)"""
+    start = text.find("{")
+    if start == -1:
+        return text.strip()
+    end = text.rfind("}")
+    # No closing brace at all: the response was truncated, keep the tail
+    return text[start:end + 1] if end > start else text[start:]
+
+
+def _escape_control(match: "re.Match[str]") -> str:
+    return _CONTROL_ESCAPES.get(match.group(), f"\\u{ord(match.group()):04x}")
+
+
+def _escape_controls(segment: str) -> str:
+    """Escape the raw control characters of a string segment in bulk"""
+    if len(segment) < _SHORT_SEGMENT:
+        return segment if segment.isprintable() else _CONTROL_RE.sub(_escape_control, segment)
+    for raw, escaped in _COMMON_CONTROLS:
+        if raw in segment:
+            segment = segment.replace(raw, escaped)
+    if any(raw in segment for raw in _RARE_CONTROLS):
+        segment = _CONTROL_RE.sub(_escape_control, segment)
+    return segment
+
+
+def _closes_string(text: str, i: int) -> bool:
+    """Decide whether the quote at text[i] ends a string or is an unescaped inner quote"""
+    j = i + 1
+    n = len(text)
+    while j < n and text[j] in " \t\r\n":
+        j += 1
+    return j >= n or text[j] in ",:}]"
+
+
+def _drop_trailing_comma(out: List[str]) -> None:
+    """Remove whitespace and one trailing comma from the end of the output"""
+    while out:
+        last = out[-1].rstrip(" \t\r\n")
+        if last:
+            out[-1] = last[:-1] if last.endswith(",") else last
+            return
+        out.pop()
+
+
+def repair_json(text: str) -> str:
+    """
+    Repair common LLM JSON defects in a single left-to-right pass
+    
+    Fixes raw control characters and unescaped quotes inside strings,
+    invalid backslash escapes, trailing commas, and output truncated by
+    max_tokens (unterminated string, unclosed objects/arrays). Runs of
+    ordinary characters are copied in one slice, so the Python-level loop
+    only visits structurally interesting characters.
+    
+    Args:
+        text: Candidate JSON object text
+    
+    Returns:
+        Text that orjson is much more likely to accept
+    """
+    return repair_json_with_status(text)[0]
+
+
+def repair_json_with_status(text: str) -> Tuple[str, bool]:
+    """
+    Repair JSON like repair_json, also reporting truncation
+    
+    Returns:
+        Tuple of (repaired text, whether an unterminated string or unclosed
+        object/array had to be closed)
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    i = 0
+    n = len(text)
+    # Position of the next backslash, found once and reused across strings
+    backslash = -1
+    
+    while i < n:
+        if in_string:
+            if backslash < i:
+                backslash = text.find("\\", i)
+                if backslash == -1:
+                    backslash = n
+            quote = text.find('"', i)
+            j = min(quote if quote != -1 else n, backslash)
+        else:
+            match = _STRUCTURAL_RE.search(text, i)
+            j = match.start() if match is not None else n
+        if j > i:
+            out.append(_escape_controls(text[i:j]) if in_string else text[i:j])
+        if j == n:
+            break
+        ch = text[j]
+        i = j + 1
+        
+        if in_string:
+            if ch == "\\":
+                nxt = text[i] if i < n else ""
+                if nxt and nxt in _VALID_ESCAPES:
+                    out.append(ch + nxt)
+                    i += 1
+                else:
+                    # Invalid escape such as "\-": keep the backslash literally
+                    out.append("\\\\")
+            elif _closes_string(text, j):
+                in_string = False
+                out.append(ch)
+            else:
+                out.append('\\"')
+            continue
+        
+        if ch == '"':
+            in_string = True
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+        else:
+            _drop_trailing_comma(out)
+            if stack and stack[-1] == ch:
+                stack.pop()
+        out.append(ch)
+    
+    # Truncated output: close whatever is still open
+    truncated = in_string or bool(stack)
+    if in_string:
+        if out and out[-1].endswith("\\") and not out[-1].endswith("\\\\"):
+            out[-1] = out[-1][:-1]
+        out.append('"')
+    else:
+        dangling_key = False
+        while out and out[-1].rstrip(" \t\r\n,:") != out[-1]:
+            dangling_key = dangling_key or out[-1].rstrip(" \t\r\n,").endswith(":")
+            out[-1] = out[-1].rstrip(" \t\r\n,:")
+            if not out[-1]:
+                out.pop()
+        if dangling_key:
+            out.append(":null")
+    out.extend(reversed(stack))
+    
+    return "".join(out), truncated
+
+
+def parse_llm_json_with_path(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Parse a JSON object from a model response, reporting how it was parsed
+    
+    Args:
+        text: Raw model response
+    
+    Returns:
+        Tuple of (parsed object, parse path: fast, extracted, repaired, or
+        truncated when the repair had to close output cut off mid-value)
+    
+    Raises:
+        json.JSONDecodeError: If the response cannot be parsed or is not an object
+    """
+    path = PARSE_FAST
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        candidate = _extract_object(text)
+        path = PARSE_EXTRACTED
+        data = None
+        # Only retry as-is if fences or prose were cut away
+        if len(candidate) < len(text.strip()):
+            try:
+                data = orjson.loads(candidate)
+            except orjson.JSONDecodeError:
+                pass
+        if data is None:
+            repaired, truncated = repair_json_with_status(candidate)
+            path = PARSE_TRUNCATED if truncated else PARSE_REPAIRED
+            try:
+                data = orjson.loads(repaired)
+            except orjson.JSONDecodeError:
+                JSON_PARSE.labels(PARSE_FAILED).inc()
+                set_current_attributes({"llm.json_parse_path": PARSE_FAILED})
+                raise
+    
+    if not isinstance(data, dict):
+        JSON_PARSE.labels(PARSE_FAILED).inc()
+        set_current_attributes({"llm.json_parse_path": PARSE_FAILED})
+        raise json.JSONDecodeError("Expected a JSON object", text, 0)
+    JSON_PARSE.labels(path).inc()
+    set_current_attributes({"llm.json_parse_path": path})
+    return data, path
+
+
+def parse_llm_json(text: str) -> Dict[str, Any]:
+    """
+    Parse a JSON object from a model response
+    
+    Args:
+        text: Raw model response (may be fenced, wrapped in prose or malformed)
+    
+    Returns:
+        Parsed object
+    
+    Raises:
+        json.JSONDecodeError: If the response cannot be parsed or is not an object
+    """
+    return parse_llm_json_with_path(text)[0]
@@ -0,0 +1,286 @@
+"""
+Process-wide rate limiting for Groq calls
+Token buckets for requests/minute and tokens/minute with priority queuing
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import os
+import random
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Iterator, List, Optional
+
+from app.utils.logger import logger
+
+
+# Priority classes: lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "groq_request_priority", default=PRIORITY_INTERACTIVE
+)
+
+
+def get_request_priority() -> int:
+    """Priority class of LLM calls made from the current context"""
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """
+    Run LLM calls in this block (and tasks spawned from it) at a priority
+    
+    Args:
+        priority: PRIORITY_INTERACTIVE, PRIORITY_BATCH or any integer
+            (lower is served first)
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to its capacity"""
+    
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._level = capacity
+        self._updated = time.monotonic()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+    
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` can be consumed (0 if available now)"""
+        self._refill()
+        missing = amount - self._level
+        return 0.0 if missing <= 0 else missing / self.refill_per_second
+    
+    def consume(self, amount: float) -> None:
+        """Take `amount` from the bucket (callers check time_until first)"""
+        self._refill()
+        self._level -= amount
+    
+    def refund(self, amount: float) -> None:
+        """Give back over-reserved capacity"""
+        self._refill()
+        self._level = min(self.capacity, self._level + amount)
+
+
+class RateLimiter:
+    """
+    Schedules LLM calls against requests-per-minute and tokens-per-minute
+    budgets
+    
+    Callers reserve their estimated token cost (prompt plus max_tokens)
+    before sending. Waiters are granted strictly by (priority, arrival), so
+    interactive requests overtake queued batch work, and a 429 pauses every
+    caller until its Retry-After has elapsed.
+    """
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        """
+        Args:
+            requests_per_minute: Request budget (0 disables the limit)
+            tokens_per_minute: Token budget (0 disables the limit)
+        """
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+            if requests_per_minute > 0 else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute > 0 else None
+        )
+        self._waiters: List[list] = []
+        self._sequence = itertools.count()
+        self._paused_until = 0.0
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    @property
+    def queued(self) -> int:
+        """Number of callers waiting for budget"""
+        return sum(1 for entry in self._waiters if not entry[3].done())
+    
+    def has_capacity(self, tokens: int) -> bool:
+        """Whether a call costing `tokens` would be granted now without queueing"""
+        return not self.queued and self._wait_time(self._clamp(tokens)) == 0
+    
+    def _clamp(self, tokens: int) -> int:
+        if self._tokens is not None and tokens > self._tokens.capacity:
+            logger.warning(f"LLM call estimate of {tokens} tokens exceeds the TPM budget; clamping")
+            return int(self._tokens.capacity)
+        return tokens
+    
+    def _wait_time(self, tokens: int) -> float:
+        wait = self._paused_until - time.monotonic()
+        if self._requests is not None:
+            wait = max(wait, self._requests.time_until(1))
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.time_until(tokens))
+        return max(wait, 0.0)
+    
+    def _grant(self, tokens: int) -> None:
+        if self._requests is not None:
+            self._requests.consume(1)
+        if self._tokens is not None:
+            self._tokens.consume(tokens)
+    
+    async def acquire(self, tokens: int, priority: Optional[int] = None) -> int:
+        """
+        Wait until a call costing `tokens` fits within the budgets
+        
+        Args:
+            tokens: Estimated tokens for the call (prompt plus max_tokens)
+            priority: Priority class (defaults to the context's priority)
+        
+        Returns:
+            Tokens actually reserved (pass to release() once usage is known)
+        """
+        tokens = self._clamp(tokens)
+        if priority is None:
+            priority = get_request_priority()
+        
+        # Fast path: nobody queued and budget available
+        if not self.queued and self._wait_time(tokens) == 0:
+            self._grant(tokens)
+            return tokens
+        
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [priority, next(self._sequence), tokens, future])
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled: hand the budget back
+                self.release(tokens, 0)
+            future.cancel()
+            raise
+        return tokens
+    
+    async def _drain(self) -> None:
+        """Grant queued callers in priority order as budget frees up"""
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            
+            wait = self._wait_time(tokens)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            
+            heapq.heappop(self._waiters)
+            self._grant(tokens)
+            future.set_result(None)
+    
+    def release(self, reserved: int, used: Optional[int]) -> None:
+        """
+        Reconcile a reservation with the tokens the API reported using
+        
+        Args:
+            reserved: Tokens returned by acquire()
+            used: Tokens actually used, or None if unknown
+        """
+        if self._tokens is not None and used is not None and used < reserved:
+            self._tokens.refund(reserved - used)
+    
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` (after the API returns a 429)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date
+    
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Delay before retry number `attempt` (0-based)
+    
+    Uses full-jitter exponential backoff (GROQ_BACKOFF_BASE seconds doubling
+    up to GROQ_BACKOFF_MAX), never shorter than the server's Retry-After.
+    """
+    base = float(os.getenv("GROQ_BACKOFF_BASE", 1.0))
+    cap = float(os.getenv("GROQ_BACKOFF_MAX", 30.0))
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay += retry_after
+    return delay
+
+
+# Process-wide limiter, built from the environment on first use
+_limiter: Optional[RateLimiter] = None
+# Fraction of the GROQ_RPM / GROQ_TPM budget this process may use
+_budget_share = 1.0
+
+
+def _scaled_limit(name: str, default: int) -> int:
+    limit = int(os.getenv(name, default))
+    if limit <= 0:
+        return limit
+    return max(int(limit * _budget_share), 1)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the shared rate limiter (GROQ_RPM / GROQ_TPM scaled by this process's share, 0 disables)"""
+    global _limiter
+    
+    if _limiter is None:
+        _limiter = RateLimiter(
+            requests_per_minute=_scaled_limit("GROQ_RPM", 30),
+            tokens_per_minute=_scaled_limit("GROQ_TPM", 30000),
+        )
+    return _limiter
+
+
+def set_rate_budget_share(share: float) -> None:
+    """
+    Limit this process to a fraction of the account-wide Groq budget
+    
+    Every process has its own limiter, so processes sharing one API key
+    (the API and its job workers) must split GROQ_RPM / GROQ_TPM between
+    them. The shared limiter is rebuilt on next use.
+    
+    Args:
+        share: Fraction of the budget, between 0 and 1
+    """
+    global _budget_share
+    _budget_share = min(max(share, 0.0), 1.0)
+    reset_rate_limiter()
+
+
+def reset_rate_limiter() -> None:
+    """Drop the shared limiter so the next call rebuilds it from the environment"""
+    global _limiter
+    _limiter = None
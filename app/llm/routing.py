@@ -0,0 +1,103 @@
+"""
+Per-node model routing and the fast/large model cascade
+Each graph node may use its own model; structured outputs of a fast model
+that fail schema validation can be escalated to the large model
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, Field, ValidationError
+
+from app.llm.client import get_model_name
+
+
+# Nodes whose model can be set with MODEL_<NODE> (e.g. MODEL_EXTRACT_KEYWORDS)
+ROUTED_NODES = ("extract_keywords", "match_skills", "rewrite_resume", "rewrite_section", "write_summary")
+
+
+class KeywordAnalysis(BaseModel):
+    technical_skills: List[str]
+    soft_skills: List[str]
+    qualifications: List[str] = []
+    keywords: List[str] = []
+
+
+class SkillMatch(BaseModel):
+    matched_skills: List[str]
+    missing_skills: List[str] = []
+
+
+class TailoredResume(BaseModel):
+    tailored_resume: str = Field(..., min_length=1)
+    professional_summary: str = ""
+
+
+class SectionRewrite(BaseModel):
+    rewritten_section: str = Field(..., min_length=1)
+
+
+class ProfessionalSummary(BaseModel):
+    professional_summary: str = Field(..., min_length=1)
+
+
+# Expected shape of each node's JSON output
+OUTPUT_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "extract_keywords": KeywordAnalysis,
+    "match_skills": SkillMatch,
+    "rewrite_resume": TailoredResume,
+    "rewrite_section": SectionRewrite,
+    "write_summary": ProfessionalSummary,
+}
+
+
+def get_node_model(node: str) -> str:
+    """Model for a graph node (MODEL_<NODE>, falling back to MODEL_NAME)"""
+    return os.getenv(f"MODEL_{node.upper()}") or get_model_name()
+
+
+def cascade_enabled() -> bool:
+    """Whether invalid fast-model outputs are retried on MODEL_NAME (MODEL_CASCADE, default off)"""
+    return os.getenv("MODEL_CASCADE", "false").lower() in ("1", "true", "yes")
+
+
+def escalation_model(node: str) -> Optional[str]:
+    """
+    Model to retry a node's invalid output on, or None when there is no cascade
+    
+    Only nodes routed to a model other than MODEL_NAME escalate, and only
+    when MODEL_CASCADE is on.
+    """
+    if not cascade_enabled():
+        return None
+    large = get_model_name()
+    return large if get_node_model(node) != large else None
+
+
+def validate_output(node: str, data: Any) -> Optional[str]:
+    """
+    Check a node's parsed output against its schema
+    
+    Returns:
+        None if the output is valid (or the node has no schema), otherwise
+        a short description of the first problem
+    """
+    schema = OUTPUT_SCHEMAS.get(node)
+    if schema is None:
+        return None
+    try:
+        schema.model_validate(data)
+    except ValidationError as e:
+        error = e.errors()[0]
+        return f"{'.'.join(str(part) for part in error['loc']) or 'response'}: {error['msg']}"
+    return None
+
+
+def routing_fingerprint() -> str:
+    """Describe the effective routing, for cache keys that depend on the models used"""
+    models = [get_node_model(node) for node in ROUTED_NODES]
+    if len(set(models)) == 1 and models[0] == get_model_name():
+        # Unrouted configuration: keep the historical cache keys
+        return get_model_name()
+    routes = ",".join(f"{node}={model}" for node, model in zip(ROUTED_NODES, models))
+    return f"{get_model_name()};{routes};cascade={cascade_enabled()}"
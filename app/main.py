@@ -3,26 +3,76 @@ FastAPI main application
 Production-grade Resume Tailor AI backend
 """
 
+import json
 import os
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, status
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, Header, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
 from app.schemas import (
     HealthResponse,
+    ReadinessResponse,
     TailorRequest,
     TailorResponse,
-    ErrorResponse
+    ErrorResponse,
+    BatchTailorItem,
+    BatchTailorRequest,
+    BatchTailorResponse,
+    JobDescriptionRequest,
+    JobDescriptionResponse,
+    JobRequest,
+    JobResponse,
+    RankRequest,
+    RankResponse,
+    SessionUpdateRequest,
+    SessionUpdateResponse
 )
-from app.graph.pipeline import run_resume_tailor_pipeline
-from app.utils.logger import logger
+from app.ingest.extract import DocumentExtractionError, UnsupportedDocumentError
+from app.ingest.upload import (
+    MULTIPART_OVERHEAD_BYTES,
+    MultipartError,
+    UploadTooLargeError,
+    close_ingest,
+    extract_upload_text,
+    get_upload_max_bytes,
+    parse_boundary,
+    read_multipart
+)
+from app.jobs.callbacks import check_callback_url
+from app.jobs.queue import (
+    close_job_queue,
+    get_job_queue,
+    get_worker_count,
+    get_worker_rate_share,
+    public_job_view
+)
+from app.llm.rate_limiter import get_rate_limiter, set_rate_budget_share
+from app.storage.jd_registry import close_jd_registry, get_jd_registry
+from app.storage.result_cache import close_result_cache
+from app.storage.sessions import close_session_store, get_session_store
+from app.utils.deadline import DeadlineExceeded
+from app.utils.logger import RequestIdMiddleware, logger, setup_logger_from_env
+from app.utils.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsMiddleware,
+    gauge,
+    render_metrics,
+    route_template
+)
+from app.utils.tracing import TracingMiddleware, get_tracer, shutdown_tracing
+from app.warmup import WARMUP_READY, readiness, start_warmup, stop_warmup
 
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Re-apply LOG_* settings that may have come from .env
+setup_logger_from_env()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,13 +89,39 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("GROQ_API_KEY configured successfully")
     
-    model_name = os.getenv("MODEL_NAME", "llama-3.1-70b-versatile")
-    logger.info(f"Using model: {model_name}")
+    # Start the span exporter (TRACE_EXPORTER / OTEL_EXPORTER_OTLP_ENDPOINT)
+    get_tracer()
+    
+    # Import the pipeline, create the Groq client and compile the graphs in
+    # the background; /health answers immediately and /ready once this is done
+    start_warmup()
+    
+    # Worker processes consuming POST /jobs (JOB_WORKERS, off by default);
+    # this process keeps the part of the Groq budget they do not use
+    set_rate_budget_share(1.0 - get_worker_rate_share(get_worker_count()))
+    worker_pool = None
+    if get_worker_count() > 0:
+        from app.jobs.worker import WorkerPool
+        worker_pool = WorkerPool(get_worker_count())
+        worker_pool.start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Resume Tailor AI application")
+    await stop_warmup()
+    if worker_pool is not None:
+        worker_pool.stop()
+    from app.llm.client import close_groq_client
+    await close_groq_client()
+    close_jd_registry()
+    close_job_queue()
+    await close_result_cache()
+    close_ingest()
+    close_session_store()
+    from app.storage.checkpoints import close_checkpoint_saver
+    close_checkpoint_saver()
+    shutdown_tracing()
 
 
 # Initialize FastAPI app
@@ -68,6 +144,61 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route request counts, latency histograms and in-flight gauges
+app.add_middleware(MetricsMiddleware)
+
+# Root trace span per request
+app.add_middleware(TracingMiddleware, route_template=route_template)
+
+# Request id bound to every log record (added last, so it wraps everything else)
+app.add_middleware(RequestIdMiddleware)
+
+# Sampled when /metrics is scraped
+gauge(
+    "llm_rate_limiter_queued", "Groq calls waiting for rate limiter capacity"
+).set_function(lambda: get_rate_limiter().queued)
+gauge(
+    "jobs", "Asynchronous jobs by status", ("status",)
+).set_function(lambda: {(job_status,): n for job_status, n in get_job_queue().counts().items()})
+
+
+async def resolve_job_description(request: TailorRequest):
+    """
+    Resolve the job description text and any stored analysis for a request
+    
+    Args:
+        request: TailorRequest carrying job_description or jd_id
+    
+    Returns:
+        Tuple of (job_description, registry entry or None)
+    
+    Raises:
+        HTTPException: If jd_id is not in the registry
+    """
+    if not request.jd_id:
+        return request.job_description, None
+    
+    entry = await get_jd_registry().get(request.jd_id)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown jd_id: {request.jd_id}"
+        )
+    return entry["job_description"], entry
+
+
+def cache_allowed(cache_control: Optional[str]) -> bool:
+    """Whether a request may be answered from the result cache (no `Cache-Control: no-cache`)"""
+    if not cache_control:
+        return True
+    directives = {directive.strip().lower() for directive in cache_control.split(",")}
+    return "no-cache" not in directives
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Serialize a pipeline event as a Server-Sent Events message"""
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
 
 @app.get(
     "/health",
@@ -87,6 +218,57 @@ async def health_check():
     return HealthResponse(status="ok")
 
 
+@app.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness Check",
+    description="Report whether the background warmup (pipeline imports, graph compilation) has finished",
+    responses={
+        200: {
+            "description": "Warmup finished; requests run at full speed",
+            "model": ReadinessResponse
+        },
+        503: {
+            "description": "Still warming up, or warmup failed",
+            "model": ReadinessResponse
+        }
+    },
+    tags=["Health"]
+)
+async def readiness_check():
+    """
+    Readiness probe endpoint
+    
+    /health only says the process is up. This returns 503 until the
+    pipeline's dependencies are imported and its graphs compiled, so load
+    balancers hold traffic from a fresh replica until then.
+    
+    Returns:
+        ReadinessResponse: Warmup status
+    """
+    state = readiness()
+    if state["status"] != WARMUP_READY:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=state)
+    return ReadinessResponse(**state)
+
+
+@app.get(
+    "/metrics",
+    summary="Prometheus Metrics",
+    description="Request, node, LLM, parser and cache metrics in the Prometheus text format",
+    response_class=Response,
+    tags=["Health"]
+)
+async def metrics():
+    """
+    Prometheus scrape endpoint
+    
+    Returns:
+        Response: All registered metrics in the text exposition format
+    """
+    return Response(content=render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.post(
     "/tailor",
     response_model=TailorResponse,
@@ -104,11 +286,18 @@ async def health_check():
         500: {
             "description": "Internal server error",
             "model": ErrorResponse
+        },
+        504: {
+            "description": "The request deadline (REQUEST_DEADLINE_SECONDS) passed",
+            "model": ErrorResponse
         }
     },
     tags=["Resume Tailoring"]
 )
-async def tailor_resume(request: TailorRequest):
+async def tailor_resume(
+    request: TailorRequest,
+    cache_control: Optional[str] = Header(None)
+):
     """
     Tailor a resume to a job description
     
@@ -118,8 +307,12 @@ async def tailor_resume(request: TailorRequest):
     3. Rewrites the resume to better align with the job
     4. Generates a professional summary
     
+    Repeat submissions are answered from the result cache; send
+    `Cache-Control: no-cache` to force a fresh run.
+    
     Args:
         request: TailorRequest containing resume_text and job_description
+        cache_control: Optional Cache-Control request header
     
     Returns:
         TailorResponse: Tailored resume with analysis
@@ -127,6 +320,8 @@ async def tailor_resume(request: TailorRequest):
     Raises:
         HTTPException: If processing fails
     """
+    from app.graph.pipeline import run_resume_tailor_pipeline
+    
     logger.info("Resume tailoring request received")
     
     try:
@@ -138,11 +333,17 @@ async def tailor_resume(request: TailorRequest):
                 detail="API configuration error: GROQ_API_KEY not set"
             )
         
+        job_description, jd_analysis = await resolve_job_description(request)
+        
         # Run the LangGraph pipeline
-        result = run_resume_tailor_pipeline(
+        result = await run_resume_tailor_pipeline(
             resume_text=request.resume_text,
-            job_description=request.job_description
+            job_description=job_description,
+            jd_analysis=jd_analysis,
+            use_cache=cache_allowed(cache_control),
+            include_session_state=True
         )
+        session_state = result.pop("session_state", None)
         
         # Validate result has required fields
         if not result.get("tailored_resume"):
@@ -152,19 +353,33 @@ async def tailor_resume(request: TailorRequest):
                 detail="Failed to generate tailored resume"
             )
         
+        # Keep the run's intermediate outputs for cheap follow-up edits
+        session_id = None
+        if session_state is not None:
+            session = await get_session_store().create(session_state)
+            session_id = session["session_id"]
+        
         logger.info("Resume tailoring completed successfully")
         
         return TailorResponse(
             tailored_resume=result["tailored_resume"],
             summary=result.get("summary", ""),
             matched_skills=result.get("matched_skills", []),
-            missing_skills=result.get("missing_skills", [])
+            missing_skills=result.get("missing_skills", []),
+            session_id=session_id
         )
     
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     
+    except DeadlineExceeded:
+        logger.error("Resume tailoring exceeded its deadline")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Resume tailoring timed out; please try again"
+        )
+    
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         raise HTTPException(
@@ -180,6 +395,623 @@ async def tailor_resume(request: TailorRequest):
         )
 
 
+@app.post(
+    "/tailor/{session_id}/update",
+    response_model=SessionUpdateResponse,
+    summary="Update Tailoring Session",
+    description="Re-tailor an edited resume, re-running only the sections that changed",
+    responses={
+        200: {
+            "description": "Successfully re-tailored resume",
+            "model": SessionUpdateResponse
+        },
+        404: {
+            "description": "Unknown or expired session",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        },
+        504: {
+            "description": "The request deadline (REQUEST_DEADLINE_SECONDS) passed",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Resume Tailoring"]
+)
+async def update_tailoring_session(session_id: str, request: SessionUpdateRequest):
+    """
+    Re-tailor an edited resume within a session started by POST /tailor
+    
+    The edited resume is diffed section by section against the session:
+    unchanged sections keep their stored rewrite, only new or edited ones
+    are rewritten, and the LLM only re-checks skills against changed text.
+    
+    Args:
+        session_id: Session id returned by POST /tailor
+        request: SessionUpdateRequest containing the edited resume_text
+    
+    Returns:
+        SessionUpdateResponse: Tailored resume plus what was reused
+    
+    Raises:
+        HTTPException: If the session is unknown or processing fails
+    """
+    from app.graph.incremental import run_session_update
+    
+    logger.info(f"Session update request received for {session_id}")
+    
+    try:
+        if not os.getenv("GROQ_API_KEY"):
+            logger.error("GROQ_API_KEY not configured")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="API configuration error: GROQ_API_KEY not set"
+            )
+        
+        store = get_session_store()
+        session = await store.get(session_id)
+        if session is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Tailoring session {session_id} not found or expired"
+            )
+        
+        result = await run_session_update(session, request.resume_text)
+        await store.save(session)
+        
+        return SessionUpdateResponse(**result, session_id=session_id)
+    
+    except HTTPException:
+        raise
+    
+    except DeadlineExceeded:
+        logger.error(f"Session update {session_id} exceeded its deadline")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Resume tailoring timed out; please try again"
+        )
+    
+    except Exception as e:
+        logger.error(f"Unexpected error in update_tailoring_session: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while processing your request: {str(e)}"
+        )
+
+
+@app.post(
+    "/tailor/upload",
+    response_model=TailorResponse,
+    summary="Tailor Uploaded Resume",
+    description="Tailor a resume uploaded as a PDF, DOCX or plain-text file (multipart/form-data)",
+    responses={
+        200: {
+            "description": "Successfully tailored resume",
+            "model": TailorResponse
+        },
+        400: {
+            "description": "Malformed multipart body",
+            "model": ErrorResponse
+        },
+        413: {
+            "description": "Resume file larger than UPLOAD_MAX_BYTES",
+            "model": ErrorResponse
+        },
+        415: {
+            "description": "Unsupported file type",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "Unreadable document or invalid form fields",
+            "model": ErrorResponse
+        }
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["resume"],
+                        "properties": {
+                            "resume": {"type": "string", "format": "binary"},
+                            "job_description": {"type": "string"},
+                            "jd_id": {"type": "string"}
+                        }
+                    }
+                }
+            }
+        }
+    },
+    tags=["Resume Tailoring"]
+)
+async def tailor_resume_upload(
+    request: Request,
+    cache_control: Optional[str] = Header(None)
+):
+    """
+    Tailor an uploaded resume file to a job description
+    
+    The body is streamed into a size-capped spooled temporary file, the
+    text is extracted in a worker process (and cached by content hash),
+    and the request then follows the same path as POST /tailor.
+    
+    Args:
+        request: Raw request carrying `resume` (file) and `job_description` or `jd_id` fields
+        cache_control: Optional Cache-Control request header
+    
+    Returns:
+        TailorResponse: Tailored resume with analysis
+    
+    Raises:
+        HTTPException: If the upload is invalid or processing fails
+    """
+    max_bytes = get_upload_max_bytes()
+    declared = request.headers.get("content-length")
+    # Fail fast on declared sizes; the multipart reader enforces the cap while streaming
+    if declared and declared.isdigit() and int(declared) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Upload exceeds the {max_bytes}-byte limit"
+        )
+    
+    try:
+        form = await read_multipart(
+            request.stream(),
+            parse_boundary(request.headers.get("content-type")),
+            max_file_bytes=max_bytes
+        )
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Upload exceeds the {max_bytes}-byte limit"
+        )
+    except MultipartError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    try:
+        upload = form.files.get("resume")
+        if upload is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Missing 'resume' file field"
+            )
+        logger.info(f"Resume upload received: {upload.filename} ({upload.size} bytes)")
+        
+        try:
+            resume_text = await extract_upload_text(upload)
+        except UnsupportedDocumentError as e:
+            raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e))
+        except DocumentExtractionError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    finally:
+        form.close()
+    
+    try:
+        tailor_request = TailorRequest(
+            resume_text=resume_text,
+            job_description=form.fields.get("job_description") or None,
+            jd_id=form.fields.get("jd_id") or None
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[{"loc": error["loc"], "msg": error["msg"]} for error in e.errors()]
+        )
+    
+    return await tailor_resume(tailor_request, cache_control=cache_control)
+
+
+@app.post(
+    "/tailor/stream",
+    summary="Tailor Resume (Streaming)",
+    description="Tailor a resume and stream progress as Server-Sent Events",
+    responses={
+        200: {
+            "description": "Event stream of node, token, result and error events",
+            "content": {"text/event-stream": {}}
+        },
+        404: {
+            "description": "Unknown jd_id",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Resume Tailoring"]
+)
+async def tailor_resume_stream(request: TailorRequest):
+    """
+    Tailor a resume, streaming results as they become available
+    
+    Emits a `node` event after each graph node (keywords after extraction,
+    matched/missing skills after matching), `token` events carrying the
+    tailored resume text as it is generated, then a final `result` event.
+    Failures after the stream has started are reported as an `error` event.
+    
+    Args:
+        request: TailorRequest containing resume_text and job_description or jd_id
+    
+    Returns:
+        StreamingResponse: text/event-stream of pipeline events
+    
+    Raises:
+        HTTPException: If the request cannot be started
+    """
+    from app.graph.pipeline import stream_resume_tailor_pipeline
+    
+    logger.info("Streaming resume tailoring request received")
+    
+    if not os.getenv("GROQ_API_KEY"):
+        logger.error("GROQ_API_KEY not configured")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="API configuration error: GROQ_API_KEY not set"
+        )
+    
+    job_description, jd_analysis = await resolve_job_description(request)
+    
+    async def event_stream():
+        async for event in stream_resume_tailor_pipeline(
+            resume_text=request.resume_text,
+            job_description=job_description,
+            jd_analysis=jd_analysis
+        ):
+            yield format_sse(event)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+@app.post(
+    "/tailor/batch",
+    response_model=BatchTailorResponse,
+    summary="Tailor Resumes in Batch",
+    description="Tailor many resumes against one job description",
+    responses={
+        200: {
+            "description": "Batch processed; check each item for errors",
+            "model": BatchTailorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Resume Tailoring"]
+)
+async def tailor_resume_batch(
+    request: BatchTailorRequest,
+    cache_control: Optional[str] = Header(None)
+):
+    """
+    Tailor a list of resumes to a single job description
+    
+    The job description is analysed once and the per-resume work runs with
+    bounded concurrency. A failing resume is reported in its own item
+    instead of failing the whole batch.
+    
+    Args:
+        request: BatchTailorRequest containing job_description and resumes
+    
+    Returns:
+        BatchTailorResponse: Per-resume results in request order
+    
+    Raises:
+        HTTPException: If the batch cannot be processed at all
+    """
+    from app.graph.pipeline import run_batch_tailor_pipeline
+    
+    logger.info(f"Batch tailoring request received for {len(request.resumes)} resumes")
+    
+    if not os.getenv("GROQ_API_KEY"):
+        logger.error("GROQ_API_KEY not configured")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="API configuration error: GROQ_API_KEY not set"
+        )
+    
+    try:
+        outcomes = await run_batch_tailor_pipeline(
+            resumes=request.resumes,
+            job_description=request.job_description,
+            use_cache=cache_allowed(cache_control)
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error in tailor_resume_batch: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while processing your request: {str(e)}"
+        )
+    
+    items = []
+    for index, outcome in enumerate(outcomes):
+        result = outcome["result"]
+        if result is None:
+            items.append(BatchTailorItem(index=index, error=outcome["error"]))
+        elif not result.get("tailored_resume"):
+            items.append(BatchTailorItem(index=index, error="Failed to generate tailored resume"))
+        else:
+            items.append(BatchTailorItem(index=index, result=TailorResponse(**result)))
+    
+    return BatchTailorResponse(results=items)
+
+
+@app.post(
+    "/rank",
+    response_model=RankResponse,
+    summary="Rank Resumes",
+    description="Shortlist many resumes against many job descriptions without calling the LLM",
+    responses={
+        200: {
+            "description": "Top matches per job description and per resume",
+            "model": RankResponse
+        },
+        404: {
+            "description": "Unknown jd_id",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Resume Tailoring"]
+)
+async def rank(request: RankRequest):
+    """
+    Score every resume against every job description and shortlist both ways
+    
+    Scores blend taxonomy skill coverage with text similarity and need no
+    LLM calls, so large pools can be narrowed down before tailoring.
+    
+    Args:
+        request: RankRequest containing resumes, job_descriptions/jd_ids and top_k
+    
+    Returns:
+        RankResponse: Top resumes per job description and top job
+        descriptions per resume
+    
+    Raises:
+        HTTPException: If a jd_id is unknown or ranking fails
+    """
+    from app.graph.pipeline import rank_resumes
+    
+    logger.info(
+        f"Rank request received for {len(request.resumes)} resumes and "
+        f"{len(request.job_descriptions) + len(request.jd_ids)} job descriptions"
+    )
+    
+    job_descriptions = list(request.job_descriptions)
+    registry = get_jd_registry()
+    for jd_id in request.jd_ids:
+        entry = await registry.get(jd_id)
+        if entry is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Unknown jd_id: {jd_id}"
+            )
+        job_descriptions.append(entry["job_description"])
+    
+    try:
+        ranking = await rank_resumes(request.resumes, job_descriptions, top_k=request.top_k)
+    except Exception as e:
+        logger.error(f"Unexpected error in rank: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while processing your request: {str(e)}"
+        )
+    
+    return RankResponse(**ranking)
+
+
+@app.post(
+    "/jobs-descriptions",
+    response_model=JobDescriptionResponse,
+    summary="Store Job Description",
+    description="Analyze a job description once and store it for reuse by /tailor",
+    responses={
+        200: {
+            "description": "Job description stored (or already present)",
+            "model": JobDescriptionResponse
+        },
+        400: {
+            "description": "Bad request - analysis could not be parsed",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Job Descriptions"]
+)
+async def create_job_description(request: JobDescriptionRequest):
+    """
+    Store a job description and its keyword analysis
+    
+    Identical (normalised) job descriptions map to the same jd_id, so the
+    extraction LLM call only runs the first time a posting is seen.
+    
+    Args:
+        request: JobDescriptionRequest containing job_description
+    
+    Returns:
+        JobDescriptionResponse: Registry id and extracted analysis
+    
+    Raises:
+        HTTPException: If processing fails
+    """
+    from app.graph.pipeline import register_job_description
+    
+    logger.info("Job description registration request received")
+    
+    try:
+        if not os.getenv("GROQ_API_KEY"):
+            logger.error("GROQ_API_KEY not configured")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="API configuration error: GROQ_API_KEY not set"
+            )
+        
+        entry = await register_job_description(request.job_description)
+        
+        return JobDescriptionResponse(
+            jd_id=entry["jd_id"],
+            jd_keywords=entry["jd_keywords"],
+            all_required_skills=entry["all_required_skills"]
+        )
+    
+    except HTTPException:
+        raise
+    
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        logger.error(f"Unexpected error in create_job_description: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while processing your request: {str(e)}"
+        )
+
+
+@app.get(
+    "/jobs-descriptions/{jd_id}",
+    response_model=JobDescriptionResponse,
+    summary="Get Job Description",
+    description="Fetch the stored analysis for a job description",
+    responses={
+        404: {
+            "description": "Unknown jd_id",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Job Descriptions"]
+)
+async def get_job_description(jd_id: str):
+    """
+    Fetch a stored job description analysis
+    
+    Args:
+        jd_id: Registry id returned by POST /jobs-descriptions
+    
+    Returns:
+        JobDescriptionResponse: Stored analysis
+    """
+    entry = await get_jd_registry().get(jd_id)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown jd_id: {jd_id}"
+        )
+    
+    return JobDescriptionResponse(
+        jd_id=entry["jd_id"],
+        jd_keywords=entry["jd_keywords"],
+        all_required_skills=entry["all_required_skills"]
+    )
+
+
+@app.post(
+    "/jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Enqueue Tailoring Job",
+    description="Queue a resume for tailoring and return a job id immediately",
+    responses={
+        202: {
+            "description": "Job queued",
+            "model": JobResponse
+        },
+        404: {
+            "description": "Unknown jd_id",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "callback_url is not allowed",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Jobs"]
+)
+async def create_job(request: JobRequest):
+    """
+    Enqueue an asynchronous tailoring job
+    
+    The job is persisted and picked up by a worker process; poll
+    GET /jobs/{job_id} or pass callback_url to be notified when it finishes.
+    
+    Args:
+        request: JobRequest with the TailorRequest fields and an optional callback_url
+    
+    Returns:
+        JobResponse: The queued job
+    """
+    if request.callback_url:
+        refusal = check_callback_url(request.callback_url)
+        if refusal:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=refusal)
+    
+    job_description, _ = await resolve_job_description(request)
+    
+    job = await get_job_queue().aenqueue(
+        {"resume_text": request.resume_text, "job_description": job_description},
+        callback_url=request.callback_url or os.getenv("JOB_CALLBACK_URL") or None,
+        max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+    )
+    
+    return JobResponse(**public_job_view(job))
+
+
+@app.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    summary="Get Job Status",
+    description="Fetch the status and, once finished, the result of a tailoring job",
+    responses={
+        404: {
+            "description": "Unknown job_id",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Jobs"]
+)
+async def get_job(job_id: str):
+    """
+    Fetch an asynchronous tailoring job
+    
+    Args:
+        job_id: Id returned by POST /jobs
+    
+    Returns:
+        JobResponse: Current status, with the result or error once finished
+    """
+    job = await get_job_queue().aget(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown job_id: {job_id}"
+        )
+    
+    return JobResponse(**public_job_view(job))
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
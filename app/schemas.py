@@ -2,8 +2,8 @@
 Pydantic schemas for request/response validation
 """
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Dict, List, Optional
+from pydantic import BaseModel, Field, model_validator
 
 
 class HealthResponse(BaseModel):
@@ -11,6 +11,16 @@ class HealthResponse(BaseModel):
     status: str = Field(..., example="ok")
 
 
+class ReadinessResponse(BaseModel):
+    """Readiness probe response"""
+    status: str = Field(..., description="warming_up, ready or failed", example="ready")
+    warmup_seconds: Optional[float] = Field(
+        None,
+        description="How long the background warmup took, once finished"
+    )
+    error: Optional[str] = Field(None, description="Why warmup failed, if it did")
+
+
 class TailorRequest(BaseModel):
     """Request schema for resume tailoring"""
     resume_text: str = Field(
@@ -19,13 +29,25 @@ class TailorRequest(BaseModel):
         min_length=50,
         example="John Doe\\nSoftware Engineer\\n\\nExperience:\\n- 5 years in Python development..."
     )
-    job_description: str = Field(
-        ...,
+    job_description: Optional[str] = Field(
+        None,
         description="The job description to tailor the resume against",
         min_length=50,
         example="We are seeking a Senior Python Developer with experience in FastAPI..."
     )
-
+    jd_id: Optional[str] = Field(
+        None,
+        description="Id of a job description stored via POST /jobs-descriptions (alternative to job_description)",
+        example="3f2a9c0e4b1d7a6e5c8b9d0a1f2e3c4b"
+    )
+    
+    @model_validator(mode="after")
+    def check_job_description_source(self):
+        """Require either the raw job description or a registry id"""
+        if not self.job_description and not self.jd_id:
+            raise ValueError("Either job_description or jd_id must be provided")
+        return self
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -53,7 +75,11 @@ class TailorResponse(BaseModel):
         ...,
         description="Skills mentioned in the job description but missing from the resume"
     )
-
+    session_id: Optional[str] = Field(
+        None,
+        description="Tailoring session for cheap follow-up edits via POST /tailor/{session_id}/update"
+    )
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -65,11 +91,208 @@ class TailorResponse(BaseModel):
         }
 
 
+class BatchTailorRequest(BaseModel):
+    """Request schema for tailoring many resumes against one job description"""
+    job_description: str = Field(
+        ...,
+        description="The job description to tailor every resume against",
+        min_length=50,
+        example="We are seeking a Senior Python Developer with experience in FastAPI..."
+    )
+    resumes: List[Annotated[str, Field(min_length=50)]] = Field(
+        ...,
+        description="Resume texts to tailor",
+        min_length=1,
+        max_length=100
+    )
+
+
+class SessionUpdateRequest(BaseModel):
+    """Request schema for re-tailoring an edited resume within a session"""
+    resume_text: str = Field(
+        ...,
+        description="The edited resume; only sections that changed are re-tailored",
+        min_length=50
+    )
+
+
+class SessionUpdateResponse(TailorResponse):
+    """Response schema for a session update"""
+    rewritten_sections: int = Field(
+        ...,
+        description="Sections rewritten because they were new or edited"
+    )
+    reused_sections: int = Field(
+        ...,
+        description="Unchanged sections whose stored rewrite was reused"
+    )
+    rematched_skills: int = Field(
+        ...,
+        description="Skills re-checked by the LLM"
+    )
+
+
+class BatchTailorItem(BaseModel):
+    """Outcome for one resume in a batch"""
+    index: int = Field(..., description="Position of the resume in the request")
+    result: Optional[TailorResponse] = Field(
+        None,
+        description="Tailored resume, if this item succeeded"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Error message, if this item failed"
+    )
+
+
+class BatchTailorResponse(BaseModel):
+    """Response schema for batch tailoring"""
+    results: List[BatchTailorItem] = Field(
+        ...,
+        description="Per-resume outcomes in request order"
+    )
+
+
+class RankRequest(BaseModel):
+    """Request schema for ranking many resumes against many job descriptions"""
+    resumes: List[Annotated[str, Field(min_length=1)]] = Field(
+        ...,
+        description="Resume texts to rank",
+        min_length=1,
+        max_length=20000
+    )
+    job_descriptions: List[Annotated[str, Field(min_length=50)]] = Field(
+        default_factory=list,
+        description="Job description texts to rank against",
+        max_length=500
+    )
+    jd_ids: List[str] = Field(
+        default_factory=list,
+        description="Ids of stored job descriptions to rank against (indexed after job_descriptions)",
+        max_length=500
+    )
+    top_k: int = Field(
+        10,
+        description="Matches to return per resume and per job description",
+        ge=1,
+        le=100
+    )
+    
+    @model_validator(mode="after")
+    def check_jobs(self):
+        """Require at least one job description"""
+        if not self.job_descriptions and not self.jd_ids:
+            raise ValueError("Either job_descriptions or jd_ids must be provided")
+        return self
+
+
+class RankMatch(BaseModel):
+    """One shortlisted resume or job description"""
+    index: int = Field(..., description="Position in the request (job descriptions first, then jd_ids)")
+    score: float = Field(..., description="Fit score between 0 and 1")
+
+
+class RankResponse(BaseModel):
+    """Response schema for ranking"""
+    resumes_by_job: List[List[RankMatch]] = Field(
+        ...,
+        description="For each job description, its best resumes in descending score order"
+    )
+    jobs_by_resume: List[List[RankMatch]] = Field(
+        ...,
+        description="For each resume, its best job descriptions in descending score order"
+    )
+    jd_ids: List[Optional[str]] = Field(
+        ...,
+        description="Registry id of each job description whose extracted skills were used, else null"
+    )
+
+
+class JobDescriptionRequest(BaseModel):
+    """Request schema for storing a job description in the registry"""
+    job_description: str = Field(
+        ...,
+        description="The job description to analyze and store",
+        min_length=50,
+        example="We are seeking a Senior Python Developer with experience in FastAPI..."
+    )
+
+
+class JobDescriptionResponse(BaseModel):
+    """Response schema for a stored job description"""
+    jd_id: str = Field(..., description="Registry id to pass as jd_id to /tailor")
+    jd_keywords: Dict[str, Any] = Field(
+        ...,
+        description="Extracted technical skills, soft skills, qualifications and keywords"
+    )
+    all_required_skills: List[str] = Field(
+        ...,
+        description="Flattened list of skills required by the job description"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "jd_id": "3f2a9c0e4b1d7a6e5c8b9d0a1f2e3c4b",
+                "jd_keywords": {
+                    "technical_skills": ["Python", "FastAPI", "Docker"],
+                    "soft_skills": ["Communication"],
+                    "qualifications": [],
+                    "keywords": ["backend", "APIs"]
+                },
+                "all_required_skills": ["Python", "FastAPI", "Docker", "Communication"]
+            }
+        }
+
+
+class JobRequest(TailorRequest):
+    """Request schema for enqueueing an asynchronous tailoring job"""
+    callback_url: Optional[str] = Field(
+        None,
+        description=(
+            "URL that receives a POST with the job once it finishes (defaults to JOB_CALLBACK_URL); "
+            "must be a public host matching JOB_CALLBACK_ALLOWED_PREFIXES when set"
+        ),
+        pattern=r"^https?://",
+        example="https://example.com/hooks/resume-tailor"
+    )
+
+
+class JobResponse(BaseModel):
+    """Status (and, once finished, outcome) of an asynchronous tailoring job"""
+    job_id: str = Field(..., description="Id to poll with GET /jobs/{job_id}")
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    attempts: int = Field(..., description="Attempts started so far")
+    result: Optional[TailorResponse] = Field(
+        None,
+        description="Tailored resume, once the job has succeeded"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Error message, if the job has failed"
+    )
+    created_at: float = Field(..., description="Enqueue time (Unix seconds)")
+    updated_at: float = Field(..., description="Last status change (Unix seconds)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "9b1f0c2d3e4a5b6c7d8e9f0a1b2c3d4e",
+                "status": "queued",
+                "attempts": 0,
+                "result": None,
+                "error": None,
+                "created_at": 1760000000.0,
+                "updated_at": 1760000000.0
+            }
+        }
+
+
 class ErrorResponse(BaseModel):
     """Error response schema"""
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
-
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -0,0 +1,3 @@
+"""
+Skill taxonomy and deterministic resume skill matching
+"""
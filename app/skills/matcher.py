@@ -0,0 +1,183 @@
+"""
+Deterministic skill matcher
+Classifies required skills against a resume with a token-level
+Aho-Corasick index built from the skill taxonomy
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.skills.taxonomy import (
+    canonicalize_skill,
+    is_case_sensitive_alias,
+    normalize_skill_text,
+    skill_aliases,
+)
+from app.utils.lru import LRUCache
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher over token sequences
+    
+    Patterns are tuples of tokens, each carrying a set of labels; a single
+    pass over the text tokens reports every label whose pattern occurs.
+    Matching on tokens rather than characters gives word boundaries for free.
+    """
+    
+    def __init__(self, patterns: Dict[Tuple[str, ...], Set[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Set[str]] = [set()]
+        
+        for tokens, labels in patterns.items():
+            state = 0
+            for token in tokens:
+                nxt = self._goto[state].get(token)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][token] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(set())
+                state = nxt
+            self._out[state] |= labels
+        
+        # Breadth-first construction of failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(token, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+    
+    def search(self, tokens: Iterable[str]) -> Set[str]:
+        """Return the labels of all patterns found in the token stream"""
+        found: Set[str] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+
+
+class SkillIndex:
+    """
+    Compiled matcher for one list of required skills
+    
+    Taxonomy skills match through any of their aliases; skills outside the
+    taxonomy match only their own normalised text.
+    """
+    
+    def __init__(self, skills: Tuple[str, ...]):
+        self.skills = skills
+        self.in_taxonomy: Set[str] = set()
+        patterns: Dict[Tuple[str, ...], Set[str]] = {}
+        self._case_sensitive: List[Tuple[str, re.Pattern, str]] = []
+        
+        for skill in skills:
+            canonical = canonicalize_skill(skill)
+            if canonical is not None:
+                self.in_taxonomy.add(skill)
+                aliases = skill_aliases(canonical)
+            else:
+                aliases = [skill]
+            
+            for alias in aliases:
+                if is_case_sensitive_alias(alias):
+                    pattern = re.compile(rf"(?<![\w&-]){re.escape(alias)}(?![\w&-])")
+                    self._case_sensitive.append((alias, pattern, skill))
+                    continue
+                tokens = tuple(normalize_skill_text(alias).split())
+                if tokens:
+                    patterns.setdefault(tokens, set()).add(skill)
+        
+        self._automaton = AhoCorasick(patterns)
+    
+    def find(self, resume_text: str, tokens: Optional[List[str]] = None) -> Set[str]:
+        """
+        Return the required skills present in the resume
+        
+        Args:
+            resume_text: Resume content
+            tokens: normalize_skill_text(resume_text).split(), if the caller
+                already has it
+        """
+        if tokens is None:
+            tokens = normalize_skill_text(resume_text).split()
+        found = self._automaton.search(tokens)
+        for alias, pattern, skill in self._case_sensitive:
+            # Substring check first: the boundary regex is far slower to reject
+            if skill not in found and alias in resume_text and pattern.search(resume_text):
+                found.add(skill)
+        return found
+
+
+# Batches tailor many resumes against the same skill list; reuse the index
+_index_cache = LRUCache(max_entries=128)
+
+
+def get_skill_index(skills: Iterable[str]) -> SkillIndex:
+    """Get the compiled index for a skill list, building it on first use"""
+    key = tuple(skills)
+    index = _index_cache.get(key)
+    if index is None:
+        index = SkillIndex(key)
+        _index_cache.set(key, index)
+    return index
+
+
+def match_skills_locally(
+    resume_text: str,
+    required_skills: List[str]
+) -> Dict[str, List[str]]:
+    """
+    Classify required skills against a resume without calling the LLM
+    
+    Skills found in the resume are matched. Taxonomy skills that are not
+    found are missing as far as string matching can tell, since all their
+    known aliases were checked (hybrid mode still asks the LLM about them).
+    Other unfound skills (soft skills, free-form qualifications) are
+    ambiguous: they may be expressed in words a string matcher cannot
+    recognise.
+    
+    Args:
+        resume_text: Resume content
+        required_skills: Skills extracted from the job description
+    
+    Returns:
+        Dictionary with matched_skills, missing_skills and ambiguous_skills,
+        each preserving the order of required_skills
+    """
+    index = get_skill_index(required_skills)
+    found = index.find(resume_text)
+    
+    result: Dict[str, List[str]] = {
+        "matched_skills": [],
+        "missing_skills": [],
+        "ambiguous_skills": [],
+    }
+    for skill in dict.fromkeys(required_skills):
+        if skill in found:
+            result["matched_skills"].append(skill)
+        elif skill in index.in_taxonomy:
+            result["missing_skills"].append(skill)
+        else:
+            result["ambiguous_skills"].append(skill)
+    
+    return result
+
+
+def unmatched_skills(required_skills: List[str], matched_skills: List[str]) -> List[str]:
+    """Required skills (deduplicated, in order) that are not in matched_skills"""
+    matched = set(matched_skills)
+    return [skill for skill in dict.fromkeys(required_skills) if skill not in matched]
@@ -0,0 +1,220 @@
+"""
+Bulk resume/job ranking
+Scores many resumes against many job descriptions at once with sparse
+skill and hashed n-gram vectors, without calling the LLM
+"""
+
+import os
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from app.skills.matcher import get_skill_index
+from app.skills.taxonomy import SKILL_TAXONOMY, canonicalize_skill, normalize_skill_text
+
+
+# One vector column per canonical taxonomy skill
+TAXONOMY_SKILLS: Tuple[str, ...] = tuple(SKILL_TAXONOMY)
+_SKILL_COLUMNS: Dict[str, int] = {skill: column for column, skill in enumerate(TAXONOMY_SKILLS)}
+
+
+def get_hash_features() -> int:
+    """Number of hashed n-gram buckets (RANK_HASH_FEATURES)"""
+    return int(os.getenv("RANK_HASH_FEATURES", 2 ** 18))
+
+
+def get_skill_weight() -> float:
+    """Weight of skill coverage versus text similarity in the fit score (RANK_SKILL_WEIGHT)"""
+    return min(max(float(os.getenv("RANK_SKILL_WEIGHT", 0.7)), 0.0), 1.0)
+
+
+def _term_matrix(token_lists: Sequence[List[str]], n_features: int) -> sparse.csr_matrix:
+    """
+    Sublinear term frequencies of hashed unigrams and bigrams, one row per
+    token list
+    
+    Tokens are interned in a per-call vocabulary so each distinct one is
+    hashed once; bigram hashes are combined from their tokens' hashes in
+    NumPy rather than built as strings.
+    """
+    vocabulary: Dict[str, int] = {}
+    ids: List[int] = []
+    lengths: List[int] = []
+    for tokens in token_lists:
+        ids.extend([vocabulary.setdefault(token, len(vocabulary)) for token in tokens])
+        lengths.append(len(tokens))
+    
+    hashes = np.fromiter(
+        (zlib.crc32(token.encode()) for token in vocabulary),
+        dtype=np.uint64,
+        count=len(vocabulary)
+    )
+    token_hashes = hashes[np.asarray(ids, dtype=np.int64)]
+    rows = np.repeat(np.arange(len(token_lists)), lengths)
+    
+    # Bigrams pair adjacent tokens of the same document
+    same_document = rows[1:] == rows[:-1]
+    bigram_hashes = (token_hashes[:-1] * np.uint64(1000003) ^ token_hashes[1:])[same_document]
+    columns = np.concatenate([token_hashes, bigram_hashes]) % np.uint64(n_features)
+    rows = np.concatenate([rows, rows[1:][same_document]])
+    
+    # Duplicate (row, bucket) entries are summed into counts
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, columns.astype(np.int64))),
+        shape=(len(token_lists), n_features)
+    )
+    matrix.data = 1.0 + np.log(matrix.data)
+    return matrix
+
+
+def _skill_matrix(skill_sets: Sequence[Sequence[str]]) -> sparse.csr_matrix:
+    """Binary presence of canonical taxonomy skills, one row per skill set"""
+    rows, columns = [], []
+    for row, skills in enumerate(skill_sets):
+        for column in {_SKILL_COLUMNS[skill] for skill in skills}:
+            rows.append(row)
+            columns.append(column)
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, columns)),
+        shape=(len(skill_sets), len(TAXONOMY_SKILLS))
+    )
+
+
+def _normalize_rows(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    """Scale each row to unit L2 norm (empty rows stay empty)"""
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ matrix
+
+
+def _job_skills(job_description: str, required_skills: Optional[Sequence[str]]) -> Tuple[List[str], str]:
+    """
+    Taxonomy skills a job requires, plus text for its term vector
+    
+    With an extracted required-skill list, its taxonomy skills are the
+    requirements and the rest (soft skills, qualifications) are added to
+    the job text. Without one, taxonomy skills found in the text are used.
+    """
+    if required_skills is None:
+        return sorted(get_skill_index(TAXONOMY_SKILLS).find(job_description)), job_description
+    
+    skills, extra = [], []
+    for skill in required_skills:
+        canonical = canonicalize_skill(skill)
+        if canonical is not None:
+            skills.append(canonical)
+        else:
+            extra.append(skill)
+    return skills, "\n".join([job_description, *extra])
+
+
+def score_matrix(
+    resumes: Sequence[str],
+    job_descriptions: Sequence[str],
+    required_skills: Optional[Sequence[Optional[Sequence[str]]]] = None
+) -> np.ndarray:
+    """
+    Fit score of every resume against every job description
+    
+    Each score blends skill coverage (the share of the job's taxonomy
+    skills found in the resume) with the cosine similarity of IDF-weighted
+    hashed unigram/bigram vectors, weighted by RANK_SKILL_WEIGHT. Jobs with
+    no taxonomy skills are scored on similarity alone.
+    
+    Args:
+        resumes: Resume texts (M)
+        job_descriptions: Job description texts (N)
+        required_skills: Optional extracted all_required_skills per job
+            (None entries fall back to skills found in the job text)
+    
+    Returns:
+        M x N float32 array of scores in [0, 1]
+    """
+    if required_skills is None:
+        required_skills = [None] * len(job_descriptions)
+    jobs = [
+        _job_skills(text, skills)
+        for text, skills in zip(job_descriptions, required_skills)
+    ]
+    
+    # Normalise each text once for both the skill index and the n-grams
+    resume_tokens = [normalize_skill_text(text).split() for text in resumes]
+    index = get_skill_index(TAXONOMY_SKILLS)
+    resume_skills = _skill_matrix([
+        index.find(text, tokens) for text, tokens in zip(resumes, resume_tokens)
+    ])
+    job_skills = _skill_matrix([skills for skills, _ in jobs])
+    
+    n_features = get_hash_features()
+    resume_terms = _term_matrix(resume_tokens, n_features)
+    job_terms = _term_matrix([normalize_skill_text(text).split() for _, text in jobs], n_features)
+    
+    # Smoothed IDF over every document in the request
+    document_frequency = np.bincount(
+        np.concatenate([resume_terms.indices, job_terms.indices]), minlength=n_features
+    )
+    documents = resume_terms.shape[0] + job_terms.shape[0]
+    idf = sparse.diags((np.log((1 + documents) / (1 + document_frequency)) + 1).astype(np.float32))
+    similarity = (
+        _normalize_rows(resume_terms @ idf) @ _normalize_rows(job_terms @ idf).T
+    ).toarray()
+    
+    required = np.asarray(job_skills.sum(axis=1)).ravel()
+    overlap = (resume_skills @ job_skills.T).toarray()
+    coverage = np.divide(overlap, required, out=np.zeros_like(overlap), where=required > 0)
+    
+    weight = np.where(required > 0, get_skill_weight(), 0.0)
+    return np.clip(weight * coverage + (1 - weight) * similarity, 0.0, 1.0).astype(np.float32)
+
+
+def top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Best `k` columns of every row, highest score first
+    
+    Returns:
+        (indices, scores), each of shape rows x min(k, columns)
+    """
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        empty = np.zeros((scores.shape[0], 0))
+        return empty.astype(np.int64), empty
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    values = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-values, axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+
+def _matches(indices: np.ndarray, values: np.ndarray) -> List[List[Dict[str, Any]]]:
+    return [
+        [{"index": int(index), "score": round(float(score), 4)} for index, score in zip(row_indices, row_values)]
+        for row_indices, row_values in zip(indices, values)
+    ]
+
+
+def rank_matches(
+    resumes: Sequence[str],
+    job_descriptions: Sequence[str],
+    required_skills: Optional[Sequence[Optional[Sequence[str]]]] = None,
+    k: int = 10
+) -> Dict[str, List[List[Dict[str, Any]]]]:
+    """
+    Shortlist resumes per job and jobs per resume
+    
+    Args:
+        resumes: Resume texts
+        job_descriptions: Job description texts
+        required_skills: Optional extracted all_required_skills per job
+        k: Matches to keep per resume and per job
+    
+    Returns:
+        Dictionary with resumes_by_job (for each job, its top resumes) and
+        jobs_by_resume (for each resume, its top jobs); each match is
+        {"index", "score"}
+    """
+    scores = score_matrix(resumes, job_descriptions, required_skills)
+    return {
+        "resumes_by_job": _matches(*top_k(scores.T, k)),
+        "jobs_by_resume": _matches(*top_k(scores, k)),
+    }
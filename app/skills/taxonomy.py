@@ -0,0 +1,172 @@
+"""
+Skill taxonomy
+Canonical skill names with the synonyms and aliases that mean the same thing
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+
+# Canonical name -> aliases (the canonical name itself is always an alias)
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    # Languages
+    "Python": ["python3"],
+    "JavaScript": ["JS", "ecmascript", "es6"],
+    "TypeScript": ["TS"],
+    "Java": ["java se", "java ee", "j2ee"],
+    "Go": ["golang"],
+    "C++": ["cpp", "c plus plus"],
+    "C#": ["csharp", "c sharp"],
+    "Ruby": [],
+    "Rust": [],
+    "Kotlin": [],
+    "Swift": [],
+    "PHP": [],
+    "Scala": [],
+    "R": ["r language", "rstats"],
+    "SQL": ["structured query language"],
+    "Bash": ["shell scripting", "shell script", "bash scripting"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    # Frameworks and libraries
+    "FastAPI": ["fast api"],
+    "Django": ["django rest framework", "drf"],
+    "Flask": [],
+    "Spring Boot": ["spring framework", "springboot"],
+    "Node.js": ["nodejs", "node js"],
+    "Express": ["express.js", "expressjs"],
+    "React": ["react.js", "reactjs", "react js"],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs"],
+    "Next.js": ["nextjs", "next js"],
+    ".NET": ["dotnet", "dot net", "asp.net", ".net core"],
+    "GraphQL": [],
+    "REST APIs": ["restful", "rest api", "restful api", "restful apis", "rest apis"],
+    "gRPC": [],
+    "Pandas": [],
+    "NumPy": [],
+    "TensorFlow": [],
+    "PyTorch": ["torch"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "LangChain": [],
+    "LangGraph": [],
+    # Data stores
+    "PostgreSQL": ["postgres", "psql"],
+    "MySQL": ["my sql"],
+    "SQLite": [],
+    "MongoDB": ["mongo", "mongo db"],
+    "Redis": [],
+    "Elasticsearch": ["elastic search", "elk", "opensearch"],
+    "Cassandra": ["apache cassandra"],
+    "DynamoDB": ["dynamo db", "dynamo"],
+    "Snowflake": [],
+    "Kafka": ["apache kafka"],
+    "RabbitMQ": ["rabbit mq"],
+    "Spark": ["apache spark", "pyspark"],
+    "Airflow": ["apache airflow"],
+    # Cloud and infrastructure
+    "AWS": ["amazon web services", "amazon aws"],
+    "Google Cloud": ["gcp", "google cloud platform"],
+    "Azure": ["microsoft azure"],
+    "Docker": ["docker compose", "docker-compose"],
+    "Kubernetes": ["k8s", "eks", "gke", "aks"],
+    "Terraform": ["hcl"],
+    "Ansible": [],
+    "Helm": ["helm charts"],
+    "Linux": ["unix", "ubuntu", "debian", "centos", "rhel"],
+    "Nginx": [],
+    "Serverless": ["aws lambda", "cloud functions"],
+    "Microservices": ["microservice", "micro services", "microservices architecture"],
+    "CI/CD": [
+        "ci cd", "cicd", "continuous integration", "continuous delivery",
+        "continuous deployment", "ci/cd pipelines", "ci/cd pipeline"
+    ],
+    "Jenkins": [],
+    "GitHub Actions": ["gh actions"],
+    "GitLab CI": ["gitlab ci/cd"],
+    "Git": ["github"],
+    "Prometheus": [],
+    "Grafana": [],
+    "Datadog": [],
+    # Practices
+    "Agile": ["scrum", "kanban", "agile methodologies", "agile environment"],
+    "Test-Driven Development": ["tdd", "test driven development"],
+    "Unit Testing": ["unit tests", "pytest", "jest", "junit"],
+    "Machine Learning": ["ML"],
+    "Deep Learning": ["DL", "neural networks"],
+    "Natural Language Processing": ["nlp"],
+    "Large Language Models": ["LLM", "LLMs"],
+    "Data Structures": ["data structures and algorithms", "dsa"],
+    "System Design": ["systems design"],
+    "Object-Oriented Programming": ["oop", "object oriented programming", "object-oriented design"],
+}
+
+# Words that qualify a skill without changing it ("Python programming" == "Python")
+FILLER_WORDS = {
+    "programming", "language", "languages", "framework", "frameworks",
+    "experience", "development", "developer", "skills", "skill",
+    "knowledge", "proficiency", "proficient", "expertise", "tools",
+    "platform", "platforms", "database", "databases", "in", "with", "of",
+}
+
+# Plain spaces are left alone (split() collapses them); matching each one is slow
+_NON_TOKEN_RE = re.compile(r"[^a-z0-9+#. ]+")
+_TRAILING_PUNCT_RE = re.compile(r"\.+(?=\s|$)")
+
+
+def normalize_skill_text(text: str) -> str:
+    """
+    Normalise text for skill matching
+    
+    Lowercases, keeps characters that carry meaning in skill names
+    (+ # .), turns everything else into single spaces and drops
+    sentence-ending periods.
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _NON_TOKEN_RE.sub(" ", text)
+    text = _TRAILING_PUNCT_RE.sub(" ", text)
+    return " ".join(text.split())
+
+
+def is_case_sensitive_alias(alias: str) -> bool:
+    """
+    Very short aliases ("Go", "R", "ML") collide with ordinary words, so
+    they only match when written exactly as in the taxonomy
+    """
+    return len(alias) <= 2 and alias.isalpha() and not alias.islower()
+
+
+def _build_alias_index() -> Dict[str, str]:
+    index = {}
+    for canonical, aliases in SKILL_TAXONOMY.items():
+        for alias in [canonical, *aliases]:
+            index.setdefault(normalize_skill_text(alias), canonical)
+    return index
+
+
+# Normalised alias -> canonical name
+ALIAS_INDEX: Dict[str, str] = _build_alias_index()
+
+
+def canonicalize_skill(skill: str) -> Optional[str]:
+    """
+    Map a skill phrase to its canonical taxonomy name
+    
+    Args:
+        skill: Skill as written in a job description (e.g. "Postgres")
+    
+    Returns:
+        Canonical name, or None if the skill is not in the taxonomy
+    """
+    normalized = normalize_skill_text(skill)
+    if normalized in ALIAS_INDEX:
+        return ALIAS_INDEX[normalized]
+    
+    stripped = " ".join(word for word in normalized.split() if word not in FILLER_WORDS)
+    return ALIAS_INDEX.get(stripped)
+
+
+def skill_aliases(canonical: str) -> List[str]:
+    """Get all aliases of a canonical skill as written, including itself"""
+    return [canonical, *SKILL_TAXONOMY.get(canonical, [])]
@@ -0,0 +1,3 @@
+"""
+Persistent storage backends (SQLite) for registries and caches
+"""
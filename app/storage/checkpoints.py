@@ -0,0 +1,338 @@
+"""
+LangGraph checkpoint store
+Persists graph state after every step so a failed tailoring run resumes
+from its last completed node instead of paying for the earlier ones again
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from app.storage.sqlite import connect, get_database_path
+from app.utils.logger import logger
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """
+    SQLite-backed LangGraph checkpointer
+    
+    Checkpoints are keyed by (thread_id, checkpoint_ns, checkpoint_id) and
+    stored whole, channel values included. The writes of tasks that
+    finished inside a step that later failed (e.g. the parallel section
+    rewrites that succeeded next to one that timed out) are stored too,
+    so resuming only re-runs the tasks that did not finish. Threads
+    expire `ttl_seconds` after they were checkpointed; put() deletes
+    expired threads at most once every `purge_interval` seconds rather
+    than scanning for them on every step.
+    """
+    
+    def __init__(self, db_path: str, ttl_seconds: float = 86400, purge_interval: float = 300):
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS graph_checkpoints (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                checkpoint_id TEXT NOT NULL,
+                parent_checkpoint_id TEXT,
+                type TEXT NOT NULL,
+                checkpoint BLOB NOT NULL,
+                metadata_type TEXT NOT NULL,
+                metadata BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+            );
+            CREATE INDEX IF NOT EXISTS graph_checkpoints_created_at ON graph_checkpoints (created_at);
+            CREATE TABLE IF NOT EXISTS graph_checkpoint_writes (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                checkpoint_id TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                channel TEXT NOT NULL,
+                type TEXT NOT NULL,
+                value BLOB NOT NULL,
+                task_path TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+            );
+            """
+        )
+        self._conn.commit()
+    
+    def _to_tuple(self, row: Any) -> CheckpointTuple:
+        """Build a CheckpointTuple from a graph_checkpoints row"""
+        thread_id, checkpoint_ns, checkpoint_id = row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"]
+        writes = self._conn.execute(
+            """
+            SELECT task_id, channel, type, value FROM graph_checkpoint_writes
+            WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+            ORDER BY task_id, idx
+            """,
+            (thread_id, checkpoint_ns, checkpoint_id)
+        ).fetchall()
+        parent_id = row["parent_checkpoint_id"]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((row["type"], row["checkpoint"])),
+            metadata=self.serde.loads_typed((row["metadata_type"], row["metadata"])),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (write["task_id"], write["channel"], self.serde.loads_typed((write["type"], write["value"])))
+                for write in writes
+            ],
+        )
+    
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get the checkpoint named by `config`, or the thread's latest one"""
+        configurable = config["configurable"]
+        query = "SELECT * FROM graph_checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        params: List[Any] = [configurable["thread_id"], configurable.get("checkpoint_ns", "")]
+        checkpoint_id = get_checkpoint_id(config)
+        if checkpoint_id:
+            query += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        # Checkpoint ids are time-ordered (UUIDv6)
+        query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+            return self._to_tuple(row) if row is not None else None
+    
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints, newest first, optionally filtered by thread, metadata and `before`"""
+        query = "SELECT * FROM graph_checkpoints WHERE 1 = 1"
+        params: List[Any] = []
+        if config:
+            configurable = config["configurable"]
+            query += " AND thread_id = ?"
+            params.append(configurable["thread_id"])
+            if configurable.get("checkpoint_ns") is not None:
+                query += " AND checkpoint_ns = ?"
+                params.append(configurable["checkpoint_ns"])
+            if get_checkpoint_id(config):
+                query += " AND checkpoint_id = ?"
+                params.append(get_checkpoint_id(config))
+        if before and get_checkpoint_id(before):
+            query += " AND checkpoint_id < ?"
+            params.append(get_checkpoint_id(before))
+        query += " ORDER BY checkpoint_id DESC"
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            results = []
+            for row in rows:
+                if limit is not None and len(results) >= limit:
+                    break
+                item = self._to_tuple(row)
+                if filter and any(item.metadata.get(key) != value for key, value in filter.items()):
+                    continue
+                results.append(item)
+        yield from results
+    
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        """Store a checkpoint, purging expired threads if the interval has passed"""
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_data = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_data = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        now = time.time()
+        
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO graph_checkpoints
+                    (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint,
+                     metadata_type, metadata, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    thread_id, checkpoint_ns, checkpoint["id"], configurable.get("checkpoint_id"),
+                    checkpoint_type, checkpoint_data, metadata_type, metadata_data, now
+                )
+            )
+            if now >= self._next_purge:
+                self._purge_expired(now)
+                self._next_purge = now + self.purge_interval
+            self._conn.commit()
+        
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+    
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        """Store the writes of a finished task against its checkpoint"""
+        configurable = config["configurable"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, value_data = self.serde.dumps_typed(value)
+            rows.append((
+                configurable["thread_id"], configurable.get("checkpoint_ns", ""), configurable["checkpoint_id"],
+                task_id, WRITES_IDX_MAP.get(channel, idx), channel, value_type, value_data, task_path
+            ))
+        
+        # Special channels (errors, interrupts) replace earlier writes; regular
+        # writes are kept from the first time a task finished
+        verb = "INSERT OR REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "INSERT OR IGNORE"
+        with self._lock:
+            self._conn.executemany(
+                f"""
+                {verb} INTO graph_checkpoint_writes
+                    (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value, task_path)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            self._conn.commit()
+    
+    def delete_thread(self, thread_id: str) -> None:
+        """Drop every checkpoint and write of a thread"""
+        with self._lock:
+            self._conn.execute("DELETE FROM graph_checkpoints WHERE thread_id = ?", (thread_id,))
+            self._conn.execute("DELETE FROM graph_checkpoint_writes WHERE thread_id = ?", (thread_id,))
+            self._conn.commit()
+    
+    def _purge_expired(self, now: float) -> None:
+        """Delete threads with checkpoints older than the TTL (caller holds the lock)"""
+        expired = [
+            row["thread_id"]
+            for row in self._conn.execute(
+                "SELECT DISTINCT thread_id FROM graph_checkpoints WHERE created_at <= ?",
+                (now - self.ttl_seconds,)
+            )
+        ]
+        for thread_id in expired:
+            self._conn.execute("DELETE FROM graph_checkpoints WHERE thread_id = ?", (thread_id,))
+            self._conn.execute("DELETE FROM graph_checkpoint_writes WHERE thread_id = ?", (thread_id,))
+        if expired:
+            logger.info(f"Purged {len(expired)} expired graph checkpoint threads")
+    
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+    
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+    
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+    
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+    
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+    
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+_saver: Optional[SQLiteCheckpointSaver] = None
+
+
+def checkpoints_enabled() -> bool:
+    """Whether tailoring runs are checkpointed (PIPELINE_CHECKPOINTS, default on)"""
+    return os.getenv("PIPELINE_CHECKPOINTS", "true").lower() in ("1", "true", "yes")
+
+
+def get_checkpoint_saver() -> SQLiteCheckpointSaver:
+    """Get the process-wide checkpoint saver, creating it on first use"""
+    global _saver
+    
+    if _saver is None:
+        _saver = SQLiteCheckpointSaver(
+            db_path=os.getenv("CHECKPOINT_DB_PATH") or get_database_path(),
+            ttl_seconds=float(os.getenv("CHECKPOINT_TTL_SECONDS", 86400)),
+        )
+    return _saver
+
+
+def close_checkpoint_saver() -> None:
+    """Close the process-wide checkpoint saver if it was opened"""
+    global _saver
+    
+    if _saver is not None:
+        _saver.close()
+        _saver = None
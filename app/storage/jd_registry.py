@@ -0,0 +1,169 @@
+"""
+Job-description registry
+Stores each job description with its extracted keyword analysis so the
+extraction LLM call runs once per posting instead of once per request
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from app.storage.sqlite import connect, get_database_path
+from app.utils.logger import logger
+from app.utils.lru import LRUCache
+from app.utils.text import content_hash, normalize_for_hash
+
+
+def compute_jd_id(job_description: str) -> str:
+    """Derive the registry id for a job description from its normalised text"""
+    return content_hash(normalize_for_hash(job_description))[:32]
+
+
+class JobDescriptionRegistry:
+    """
+    Two-tier store of analysed job descriptions
+    
+    Lookups hit an in-memory LRU+TTL tier first and fall back to SQLite.
+    Entries are dictionaries with jd_id, job_description, jd_keywords,
+    all_required_skills and created_at.
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        cache_size: int = 256,
+        cache_ttl_seconds: Optional[float] = 3600
+    ):
+        self._memory = LRUCache(max_entries=cache_size, ttl_seconds=cache_ttl_seconds)
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_descriptions (
+                jd_id TEXT PRIMARY KEY,
+                job_description TEXT NOT NULL,
+                jd_keywords TEXT NOT NULL,
+                all_required_skills TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+    
+    def _load(self, jd_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM job_descriptions WHERE jd_id = ?", (jd_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "jd_id": row["jd_id"],
+            "job_description": row["job_description"],
+            "jd_keywords": json.loads(row["jd_keywords"]),
+            "all_required_skills": json.loads(row["all_required_skills"]),
+            "created_at": row["created_at"],
+        }
+    
+    def _store(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO job_descriptions
+                    (jd_id, job_description, jd_keywords, all_required_skills, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    entry["jd_id"],
+                    entry["job_description"],
+                    json.dumps(entry["jd_keywords"]),
+                    json.dumps(entry["all_required_skills"]),
+                    entry["created_at"],
+                )
+            )
+            self._conn.commit()
+    
+    async def get(self, jd_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry by id
+        
+        Args:
+            jd_id: Registry id returned when the job description was stored
+        
+        Returns:
+            The stored entry, or None if unknown
+        """
+        entry = self._memory.get(jd_id)
+        if entry is not None:
+            return entry
+        
+        entry = await asyncio.to_thread(self._load, jd_id)
+        if entry is not None:
+            self._memory.set(jd_id, entry)
+        return entry
+    
+    async def find_by_text(self, job_description: str) -> Optional[Dict[str, Any]]:
+        """Look up an entry by the (normalised) job description text"""
+        return await self.get(compute_jd_id(job_description))
+    
+    async def put(
+        self,
+        job_description: str,
+        jd_keywords: Dict[str, Any],
+        all_required_skills: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Store the analysis for a job description
+        
+        Args:
+            job_description: Raw job description text
+            jd_keywords: Structured keyword analysis from extraction
+            all_required_skills: Flattened list of required skills
+        
+        Returns:
+            The stored entry
+        """
+        entry = {
+            "jd_id": compute_jd_id(job_description),
+            "job_description": job_description,
+            "jd_keywords": jd_keywords,
+            "all_required_skills": all_required_skills,
+            "created_at": time.time(),
+        }
+        await asyncio.to_thread(self._store, entry)
+        self._memory.set(entry["jd_id"], entry)
+        logger.info(f"Stored job description analysis: {entry['jd_id']}")
+        return entry
+    
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+_registry: Optional[JobDescriptionRegistry] = None
+
+
+def get_jd_registry() -> JobDescriptionRegistry:
+    """Get the process-wide job-description registry, creating it on first use"""
+    global _registry
+    
+    if _registry is None:
+        _registry = JobDescriptionRegistry(
+            db_path=os.getenv("JD_REGISTRY_PATH", get_database_path()),
+            cache_size=int(os.getenv("JD_CACHE_SIZE", 256)),
+            cache_ttl_seconds=float(os.getenv("JD_CACHE_TTL_SECONDS", 3600)),
+        )
+    return _registry
+
+
+def close_jd_registry() -> None:
+    """Close the process-wide registry if it was opened"""
+    global _registry
+    
+    if _registry is not None:
+        _registry.close()
+        _registry = None
@@ -0,0 +1,130 @@
+"""
+Minimal asyncio Redis client
+Speaks RESP2 over one connection; enough for GET/SET/DEL without a
+third-party driver
+"""
+
+import asyncio
+from typing import Any, Optional, Union
+from urllib.parse import unquote, urlsplit
+
+from app.utils.logger import logger
+
+
+class RedisError(Exception):
+    """Error reply from the server or a broken connection"""
+
+
+def _encode_command(*args: Union[str, bytes, int, float]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise RedisError("Connection closed by server")
+    
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode("utf-8")
+    if prefix == b"-":
+        raise RedisError(payload.decode("utf-8"))
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Unexpected reply prefix: {prefix!r}")
+
+
+class RedisClient:
+    """
+    Single-connection Redis client for redis://[:password@]host[:port][/db]
+    
+    Commands are serialised over one connection with a lock; the connection
+    is (re)opened lazily, so a server restart costs one failed command.
+    """
+    
+    def __init__(self, url: str, timeout: float = 5.0):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+    
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            await self._roundtrip("AUTH", self.password)
+        if self.db:
+            await self._roundtrip("SELECT", self.db)
+        logger.info(f"Connected to Redis at {self.host}:{self.port}/{self.db}")
+    
+    async def _roundtrip(self, *args: Union[str, bytes, int, float]) -> Any:
+        self._writer.write(_encode_command(*args))
+        await self._writer.drain()
+        return await _read_reply(self._reader)
+    
+    async def execute(self, *args: Union[str, bytes, int, float]) -> Any:
+        """
+        Send one command and return its decoded reply
+        
+        Raises:
+            RedisError: On an error reply, timeout or connection failure
+        """
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await asyncio.wait_for(self._connect(), self.timeout)
+                return await asyncio.wait_for(self._roundtrip(*args), self.timeout)
+            except RedisError as e:
+                if str(e).startswith("Connection closed"):
+                    await self._reset()
+                raise
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                await self._reset()
+                raise RedisError(f"Redis connection failed: {e}") from e
+    
+    async def _reset(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.execute("GET", key)
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        if ttl_seconds:
+            await self.execute("SET", key, value, "EX", int(ttl_seconds))
+        else:
+            await self.execute("SET", key, value)
+    
+    async def delete(self, key: str) -> None:
+        await self.execute("DEL", key)
+    
+    async def ping(self) -> bool:
+        return await self.execute("PING") == "PONG"
+    
+    async def close(self) -> None:
+        async with self._lock:
+            await self._reset()
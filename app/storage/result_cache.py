@@ -0,0 +1,359 @@
+"""
+Full-result cache for the tailoring pipeline
+Pluggable backends (memory, SQLite, Redis) behind versioned content keys
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.graph.compaction import normalize_whitespace
+from app.storage.redis_client import RedisClient
+from app.storage.sqlite import connect, get_database_path
+from app.utils.logger import logger
+from app.utils.lru import LRUCache
+from app.utils.metrics import CACHE_LOOKUPS
+from app.utils.text import content_hash
+
+
+# Modules whose source determines the prompts (and so the cached output):
+# the graph's prompt templates and temperatures, the system prompt sent with
+# every call, and how responses are parsed
+_PROMPT_SOURCES = (
+    "graph/nodes.py",
+    "graph/compaction.py",
+    "graph/sections.py",
+    "graph/pipeline.py",
+    "llm/client.py",
+    "llm/parsing.py",
+)
+
+_prompt_template_version: Optional[str] = None
+
+
+def get_prompt_template_version() -> str:
+    """
+    Fingerprint of the modules that build prompts and parse responses
+    
+    Any edit to a prompt template (or the code around it) changes the
+    version, so stale cached results stop matching without a manual bump.
+    PROMPT_TEMPLATE_VERSION overrides it, e.g. to share a cache across
+    deployments built from different checkouts.
+    """
+    global _prompt_template_version
+    
+    override = os.getenv("PROMPT_TEMPLATE_VERSION")
+    if override:
+        return override
+    
+    if _prompt_template_version is None:
+        app_dir = Path(__file__).resolve().parent.parent
+        sources = [(app_dir / name).read_text(encoding="utf-8") for name in _PROMPT_SOURCES]
+        _prompt_template_version = content_hash(*sources)[:16]
+    return _prompt_template_version
+
+
+def compute_result_key(
+    resume_text: str,
+    job_description: str,
+    model_name: str,
+    variant: str
+) -> str:
+    """
+    Cache key for one tailoring request
+    
+    Inputs are whitespace-normalised the same way the pipeline compacts them
+    first, so copies that only differ in spacing share an entry. Settings
+    that change the prompts or their sampling (model, graph variant, skill
+    match mode, token budgets, prompt template version) are part of the key;
+    temperatures are fixed in the node source and the system prompt in the
+    client source, both covered by the template version.
+    """
+    return content_hash(
+        normalize_whitespace(resume_text),
+        normalize_whitespace(job_description),
+        model_name,
+        variant,
+        os.getenv("SKILL_MATCH_MODE", "hybrid"),
+        os.getenv("RESUME_TOKEN_BUDGET", ""),
+        os.getenv("JD_TOKEN_BUDGET", ""),
+        get_prompt_template_version(),
+    )
+
+
+class CacheBackend:
+    """Byte store interface implemented by every result cache backend"""
+    
+    name = "base"
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        raise NotImplementedError
+    
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+    
+    async def close(self) -> None:
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU bounded by entry count and total value bytes"""
+    
+    name = "memory"
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self._entries = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+        self._expiry: Dict[str, float] = {}
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        value = self._entries.get(key)
+        if value is not None and self._expiry.get(key, float("inf")) <= time.monotonic():
+            await self.delete(key)
+            return None
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        self._entries.set(key, value)
+        if ttl_seconds:
+            self._expiry[key] = time.monotonic() + ttl_seconds
+        else:
+            self._expiry.pop(key, None)
+        if len(self._expiry) > 2 * self._entries.max_entries:
+            # Drop expiry stamps of entries the LRU already evicted
+            self._expiry = {k: v for k, v in self._expiry.items() if k in self._entries}
+    
+    async def delete(self, key: str) -> None:
+        self._entries.delete(key)
+        self._expiry.pop(key, None)
+
+
+class SQLiteBackend(CacheBackend):
+    """On-disk cache in the shared SQLite database"""
+    
+    name = "sqlite"
+    
+    def __init__(self, db_path: str):
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS result_cache (
+                cache_key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+    
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM result_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row["expires_at"] is not None and row["expires_at"] <= time.time():
+                self._conn.execute("DELETE FROM result_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                return None
+        return bytes(row["value"])
+    
+    def _set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO result_cache (cache_key, value, expires_at, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, value, now + ttl_seconds if ttl_seconds else None, now),
+            )
+            self._conn.commit()
+    
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM result_cache WHERE cache_key = ?", (key,))
+            self._conn.commit()
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._get, key)
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        await asyncio.to_thread(self._set, key, value, ttl_seconds)
+    
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._delete, key)
+    
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisBackend(CacheBackend):
+    """Shared cache on a Redis-protocol server"""
+    
+    name = "redis"
+    
+    def __init__(self, url: str, prefix: str = "resume-tailor:result:"):
+        self._client = RedisClient(url)
+        self._prefix = prefix
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._prefix + key)
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        await self._client.set(self._prefix + key, value, math.ceil(ttl_seconds) if ttl_seconds else None)
+    
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._prefix + key)
+    
+    async def close(self) -> None:
+        await self._client.close()
+
+
+# Stored values start with a format byte
+_RAW = b"j"
+_ZLIB = b"z"
+
+
+class ResultCache:
+    """
+    Cache of pipeline results on top of a CacheBackend
+    
+    Results are serialised with orjson and zlib-compressed when that makes
+    them smaller. Backend failures are logged and treated as misses: the
+    cache can make a request faster but never make it fail.
+    """
+    
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl_seconds: Optional[float] = None,
+        compress_level: int = 6
+    ):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.compress_level = compress_level
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+    
+    def _encode(self, result: Dict[str, Any]) -> bytes:
+        raw = orjson.dumps(result)
+        if self.compress_level > 0:
+            compressed = zlib.compress(raw, self.compress_level)
+            if len(compressed) < len(raw):
+                return _ZLIB + compressed
+        return _RAW + raw
+    
+    @staticmethod
+    def _decode(value: bytes) -> Dict[str, Any]:
+        if value[:1] == _ZLIB:
+            return orjson.loads(zlib.decompress(value[1:]))
+        return orjson.loads(value[1:])
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a key, or None on a miss"""
+        try:
+            value = await self.backend.get(key)
+            result = self._decode(value) if value is not None else None
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Result cache ({self.backend.name}) read failed: {e}")
+            result = None
+        
+        if result is None:
+            self.misses += 1
+            CACHE_LOOKUPS.labels("result", "miss").inc()
+        else:
+            self.hits += 1
+            CACHE_LOOKUPS.labels("result", "hit").inc()
+        return result
+    
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result, ignoring backend failures"""
+        try:
+            await self.backend.set(key, self._encode(result), self.ttl_seconds)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Result cache ({self.backend.name}) write failed: {e}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/error counters and the hit ratio"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+    
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+RESULT_CACHE_BACKENDS = ("memory", "sqlite", "redis", "none")
+
+# Process-wide cache, created on first use
+_cache: Optional[ResultCache] = None
+_cache_disabled = False
+
+
+def _build_backend(name: str) -> CacheBackend:
+    if name == "memory":
+        return MemoryBackend(
+            max_entries=int(os.getenv("RESULT_CACHE_MAX_ENTRIES", 1024)),
+            max_bytes=int(os.getenv("RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+        )
+    if name == "sqlite":
+        return SQLiteBackend(os.getenv("RESULT_CACHE_PATH") or get_database_path())
+    if name == "redis":
+        return RedisBackend(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    raise ValueError(f"Unknown RESULT_CACHE_BACKEND '{name}'. Use one of: {', '.join(RESULT_CACHE_BACKENDS)}")
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    Get the shared result cache, or None when RESULT_CACHE_BACKEND=none
+    
+    Configured by RESULT_CACHE_BACKEND (memory, sqlite, redis or none;
+    default memory), RESULT_CACHE_TTL_SECONDS and RESULT_CACHE_COMPRESS_LEVEL.
+    """
+    global _cache, _cache_disabled
+    
+    if _cache is None and not _cache_disabled:
+        name = os.getenv("RESULT_CACHE_BACKEND", "memory").lower()
+        if name == "none":
+            _cache_disabled = True
+            return None
+        ttl = float(os.getenv("RESULT_CACHE_TTL_SECONDS", 86400))
+        _cache = ResultCache(
+            _build_backend(name),
+            ttl_seconds=ttl if ttl > 0 else None,
+            compress_level=int(os.getenv("RESULT_CACHE_COMPRESS_LEVEL", 6)),
+        )
+        logger.info(f"Initialized result cache ({name})")
+    return _cache
+
+
+async def close_result_cache() -> None:
+    """Close the shared result cache (the next call re-reads the environment)"""
+    global _cache, _cache_disabled
+    
+    if _cache is not None:
+        await _cache.close()
+    _cache = None
+    _cache_disabled = False
@@ -0,0 +1,119 @@
+"""
+Tailoring sessions
+Keeps the sections, job-description analysis, skill verdicts and per-section
+rewrites of a tailoring run so a follow-up edit only redoes what changed
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from app.storage.sqlite import connect, get_database_path
+from app.utils.logger import logger
+
+
+class SessionStore:
+    """
+    SQLite-backed store of tailoring sessions
+    
+    A session is a JSON document with the compacted resume and job
+    description, jd_keywords, all_required_skills, sections (each with its
+    rewrite), llm_verdicts, matched/missing skills, summary and the
+    tailored resume. Sessions expire `ttl_seconds` after their last update.
+    """
+    
+    def __init__(self, db_path: str, ttl_seconds: float = 86400):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = connect(db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tailor_sessions (
+                session_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+    
+    def _load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM tailor_sessions WHERE session_id = ? AND expires_at > ?",
+                (session_id, time.time())
+            ).fetchone()
+        return json.loads(row["data"]) if row is not None else None
+    
+    def _store(self, session: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO tailor_sessions (session_id, data, created_at, expires_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (session["session_id"], json.dumps(session), session["created_at"], now + self.ttl_seconds)
+            )
+            # Expired sessions are purged as new ones are written
+            self._conn.execute("DELETE FROM tailor_sessions WHERE expires_at <= ?", (now,))
+            self._conn.commit()
+    
+    async def create(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a new session
+        
+        Args:
+            state: Session fields captured from a pipeline run
+        
+        Returns:
+            The stored session, including its new session_id
+        """
+        session = {**state, "session_id": uuid.uuid4().hex, "created_at": time.time()}
+        session["updated_at"] = session["created_at"]
+        await asyncio.to_thread(self._store, session)
+        logger.info(f"Created tailoring session {session['session_id']}")
+        return session
+    
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a session (None if unknown or expired)"""
+        return await asyncio.to_thread(self._load, session_id)
+    
+    async def save(self, session: Dict[str, Any]) -> None:
+        """Write back an updated session, extending its lifetime"""
+        session["updated_at"] = time.time()
+        await asyncio.to_thread(self._store, session)
+    
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Get the process-wide session store, creating it on first use"""
+    global _store
+    
+    if _store is None:
+        _store = SessionStore(
+            db_path=os.getenv("SESSION_DB_PATH") or get_database_path(),
+            ttl_seconds=float(os.getenv("SESSION_TTL_SECONDS", 86400)),
+        )
+    return _store
+
+
+def close_session_store() -> None:
+    """Close the process-wide session store if it was opened"""
+    global _store
+    
+    if _store is not None:
+        _store.close()
+        _store = None
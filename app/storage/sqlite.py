@@ -0,0 +1,33 @@
+"""
+SQLite connection helpers shared by the storage modules
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+
+def get_database_path() -> str:
+    """Get the SQLite database path from environment or use default"""
+    return os.getenv("DATABASE_PATH", "data/resume_tailor.db")
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """
+    Open a SQLite connection configured for concurrent access
+    
+    Args:
+        path: Database file path (":memory:" for a private in-memory DB)
+    
+    Returns:
+        Connection usable from worker threads (callers serialise access)
+    """
+    if path != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    
+    conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+    conn.row_factory = sqlite3.Row
+    if path != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
@@ -0,0 +1,75 @@
+"""
+Request deadlines carried in a context variable
+Nested scopes can only shorten the deadline; awaits made within one are
+cancelled once it passes
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() deadline of the current request, if any
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request (or node) ran out of its time budget"""
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Bound the work in this block (and tasks spawned from it) to `seconds`
+    
+    An enclosing deadline that expires sooner still applies. None or a
+    non-positive value adds no limit of its own.
+    
+    Yields:
+        The effective absolute deadline (time.monotonic() based), or None
+    """
+    current = _deadline.get()
+    if seconds is not None and seconds > 0:
+        proposed = time.monotonic() + seconds
+        current = proposed if current is None else min(current, proposed)
+    token = _deadline.set(current)
+    try:
+        yield current
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline (None when there is none)"""
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+def check_deadline() -> None:
+    """Raise DeadlineExceeded if the current deadline has passed"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+
+
+async def within_deadline(awaitable: Awaitable[T]) -> T:
+    """
+    Await `awaitable`, cancelling it if the current deadline passes first
+    
+    Raises:
+        DeadlineExceeded: If the deadline passes (or already has)
+    """
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded("Deadline exceeded")
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(f"Deadline exceeded after waiting {left:.1f}s")
@@ -0,0 +1,116 @@
+"""
+Incremental extraction of a JSON string field from a streamed LLM response
+"""
+
+from typing import Optional
+
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class JsonStringFieldStreamer:
+    """
+    Decode the value of one top-level string field as its chunks arrive
+    
+    Feed raw response chunks in order; each call returns the newly decoded
+    text of the field (possibly empty). Escape sequences split across chunk
+    boundaries are held back until complete. Raw control characters inside
+    the string (invalid JSON, but common in LLM output) are passed through.
+    """
+    
+    def __init__(self, field: str):
+        self._key = f'"{field}"'
+        self._buffer = ""
+        self._in_value = False
+        self._done = False
+        self._pending = ""
+    
+    @property
+    def done(self) -> bool:
+        """True once the closing quote of the field has been seen"""
+        return self._done
+    
+    def _find_value_start(self) -> Optional[int]:
+        """Return the index just past the opening quote of the value, if seen"""
+        start = self._buffer.find(self._key)
+        while start != -1:
+            i = start + len(self._key)
+            while i < len(self._buffer) and self._buffer[i].isspace():
+                i += 1
+            if i < len(self._buffer) and self._buffer[i] == ":":
+                i += 1
+                while i < len(self._buffer) and self._buffer[i].isspace():
+                    i += 1
+                if i >= len(self._buffer):
+                    return None
+                if self._buffer[i] == '"':
+                    return i + 1
+            elif i >= len(self._buffer):
+                return None
+            start = self._buffer.find(self._key, start + 1)
+        return None
+    
+    def feed(self, chunk: str) -> str:
+        """
+        Consume the next chunk of the response
+        
+        Args:
+            chunk: Raw text delta from the model
+        
+        Returns:
+            Newly decoded characters of the field value
+        """
+        if self._done:
+            return ""
+        
+        if not self._in_value:
+            self._buffer += chunk
+            value_start = self._find_value_start()
+            if value_start is None:
+                return ""
+            self._in_value = True
+            chunk = self._buffer[value_start:]
+            self._buffer = ""
+        
+        text = self._pending + chunk
+        self._pending = ""
+        out = []
+        i = 0
+        while i < len(text):
+            ch = text[i]
+            if ch == '"':
+                self._done = True
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            
+            # Escape sequence; hold it back if it is cut off by the chunk
+            if i + 1 >= len(text):
+                self._pending = text[i:]
+                break
+            code = text[i + 1]
+            if code == "u":
+                if i + 6 > len(text):
+                    self._pending = text[i:]
+                    break
+                try:
+                    out.append(chr(int(text[i + 2:i + 6], 16)))
+                except ValueError:
+                    out.append(text[i:i + 6])
+                i += 6
+                continue
+            out.append(_SIMPLE_ESCAPES.get(code, code))
+            i += 2
+        
+        return "".join(out)
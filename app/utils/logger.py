@@ -1,16 +1,235 @@
 """
 Logging configuration for the application
+Text or JSON records, written synchronously or from a background queue listener
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
-from typing import Optional
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import orjson
+
+
+LOG_FORMATS = ("text", "json")
+
+# Request id of the current request or job, attached to every record
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Extra per-record context (e.g. trace ids) registered by other modules
+_context_providers: List[Callable[[], Dict[str, Any]]] = []
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+# Background listeners of queued loggers, by logger name
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+# Source file logging uses to find the caller (None disables the stack walk)
+_SRCFILE = logging._srcfile
+
+
+def get_request_id() -> Optional[str]:
+    """Request id bound to the current context, if any"""
+    return _request_id.get()
+
+
+@contextmanager
+def bind_request_id(request_id: Optional[str] = None) -> Iterator[str]:
+    """Attach a request id (generated when not given) to records logged in this block"""
+    request_id = request_id or uuid.uuid4().hex
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+def register_log_context(provider: Callable[[], Dict[str, Any]]) -> None:
+    """Add fields, computed in the caller's context for each record, to JSON output"""
+    _context_providers.append(provider)
+
+
+def preview(text: Optional[str], limit: Optional[int] = None) -> str:
+    """
+    Size-capped preview of a (possibly huge) LLM response for log messages
+    
+    Args:
+        text: Text to preview
+        limit: Maximum characters kept (default LOG_PREVIEW_CHARS, 200)
+    
+    Returns:
+        The text, or its head followed by the number of characters dropped
+    """
+    if text is None:
+        return ""
+    limit = limit if limit is not None else int(os.getenv("LOG_PREVIEW_CHARS", 200))
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... (+{len(text) - limit} chars)"
+
+
+class ContextFilter(logging.Filter):
+    """
+    Attach the request id and registered context to each record
+    
+    Runs in the thread that logs, where the request's context variables
+    are visible, before the record is handed to the queue.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        for provider in _context_providers:
+            for key, value in provider().items():
+                setattr(record, key, value)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of INFO-and-below records; warnings and errors always pass
+    
+    Records of a request are kept or dropped together (the decision hashes
+    the request id), so a sampled request still has its whole story.
+    """
+    
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or record.levelno > logging.INFO:
+            return True
+        request_id = getattr(record, "request_id", None) or _request_id.get()
+        if request_id:
+            return (zlib.crc32(request_id.encode()) % 10000) < self.rate * 10000
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One orjson-serialised object per record"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        if record.funcName and record.funcName != "(unknown function)":
+            entry["func"] = record.funcName
+            entry["line"] = record.lineno
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode("utf-8")
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the caller
+    
+    Formatting happens on the listener thread; the caller only resolves the
+    message. When the bounded queue is full the record is dropped and
+    counted instead of stalling the event loop.
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BlockingStopListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for room in a full queue instead of raising"""
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware binding a request id to every record logged for a request
+    
+    Reuses a well-formed incoming X-Request-ID header (so ids can be
+    followed across services) or generates one, and echoes it back.
+    """
+    
+    def __init__(self, app: Any):
+        self.app = app
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        incoming = dict(scope.get("headers") or ()).get(b"x-request-id", b"").decode("latin-1")
+        valid = 0 < len(incoming) <= 128 and incoming.isprintable()
+        
+        with bind_request_id(incoming if valid else None) as request_id:
+            async def send_wrapper(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-request-id", request_id.encode("latin-1"))
+                    ]
+                await send(message)
+            
+            await self.app(scope, receive, send_wrapper)
+
+
+def dropped_log_records() -> int:
+    """Records discarded because the background log queue was full"""
+    return sum(
+        handler.dropped for handler in logging.getLogger("resume_tailor").handlers
+        if isinstance(handler, NonBlockingQueueHandler)
+    )
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    # An empty value (as shipped in .env.example) means "use the default"
+    value = os.getenv(name) or str(default)
+    return value.lower() in ("1", "true", "yes")
+
+
+def shutdown_logging(name: Optional[str] = None) -> None:
+    """Stop background listeners (all, or one logger's), writing out every queued record"""
+    for listener_name in [name] if name is not None else list(_listeners):
+        listener = _listeners.pop(listener_name, None)
+        if listener is not None:
+            listener.stop()
 
 
 def setup_logger(
     name: str = "resume_tailor",
     level: str = "INFO",
-    format_string: Optional[str] = None
+    format_string: Optional[str] = None,
+    log_format: str = "text",
+    use_queue: bool = False,
+    sample_rate: float = 1.0,
+    caller_info: bool = True
 ) -> logging.Logger:
     """
     Set up and configure a logger instance
@@ -18,11 +237,19 @@ def setup_logger(
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        format_string: Custom format string for log messages
+        format_string: Custom format string for text log messages
+        log_format: "text" or "json" (orjson, one object per line)
+        use_queue: Hand records to a background QueueListener thread that
+            formats and writes them, so a slow stdout never blocks callers
+        sample_rate: Fraction of INFO-and-below records kept
+        caller_info: Record funcName/lineno (walks the stack on every call)
     
     Returns:
         Configured logger instance
     """
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Invalid log format: {log_format}")
+    
     if format_string is None:
         format_string = (
             "%(asctime)s - %(name)s - %(levelname)s - "
@@ -36,21 +263,59 @@ def setup_logger(
     # Remove existing handlers to avoid duplicates
     if logger.handlers:
         logger.handlers.clear()
+    shutdown_logging(name)
+    
+    # Stack inspection for funcName/lineno is the most expensive part of a
+    # log call; the logging module documents clearing _srcfile to skip it
+    logging._srcfile = _SRCFILE if caller_info else None
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
     
     # Create formatter
-    formatter = logging.Formatter(format_string)
+    formatter = JsonFormatter() if log_format == "json" else logging.Formatter(format_string)
     console_handler.setFormatter(formatter)
     
+    if use_queue:
+        handler = NonBlockingQueueHandler(queue.Queue(int(os.getenv("LOG_QUEUE_SIZE", 10000))))
+        listener = _BlockingStopListener(
+            handler.queue, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        _listeners[name] = listener
+    else:
+        handler = console_handler
+    
+    handler.addFilter(ContextFilter())
+    if sample_rate < 1.0:
+        handler.addFilter(SamplingFilter(sample_rate))
+    
     # Add handler to logger
-    logger.addHandler(console_handler)
+    logger.addHandler(handler)
     
     return logger
 
 
-# Create default logger instance
-logger = setup_logger()
+def setup_logger_from_env(name: str = "resume_tailor") -> logging.Logger:
+    """
+    Configure a logger from LOG_LEVEL, LOG_FORMAT, LOG_QUEUE,
+    LOG_INFO_SAMPLE_RATE and LOG_CALLER_INFO
+    """
+    log_format = (os.getenv("LOG_FORMAT") or "text").lower()
+    return setup_logger(
+        name,
+        level=os.getenv("LOG_LEVEL") or "INFO",
+        log_format=log_format,
+        use_queue=_env_flag("LOG_QUEUE", False),
+        sample_rate=float(os.getenv("LOG_INFO_SAMPLE_RATE") or 1.0),
+        # The text format prints funcName:lineno; JSON skips it unless asked
+        caller_info=_env_flag("LOG_CALLER_INFO", log_format == "text"),
+    )
+
 
+# Write out queued records when the process exits
+atexit.register(shutdown_logging)
+
+# Create default logger instance
+logger = setup_logger_from_env()
@@ -0,0 +1,89 @@
+"""
+In-memory LRU cache with optional time-to-live
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with optional per-entry TTL
+    
+    With max_bytes set, values must support len() (e.g. bytes) and the
+    cache also evicts until their total length fits the limit.
+    Not thread-safe; intended for use from a single event loop.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def _size(self, value: Any) -> int:
+        return len(value) if self.max_bytes is not None else 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.delete(key)
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert or refresh a value, evicting the oldest entries when full"""
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else None
+        )
+        size = self._size(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Would evict everything and still not fit
+            self.delete(key)
+            return
+        
+        self.delete(key)
+        self._data[key] = (value, expires_at)
+        self.total_bytes += size
+        
+        while len(self._data) > self.max_entries or (
+            self.max_bytes is not None and self.total_bytes > self.max_bytes
+        ):
+            _, (evicted, _) = self._data.popitem(last=False)
+            self.total_bytes -= self._size(evicted)
+    
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present"""
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.total_bytes -= self._size(item[0])
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+        self.total_bytes = 0
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        return len(self._data)
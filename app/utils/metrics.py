@@ -0,0 +1,423 @@
+"""
+Prometheus metrics without a client library
+Counters, gauges and histograms rendered in the text exposition format
+"""
+
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.utils.logger import dropped_log_records
+from app.utils.tracing import start_span
+
+
+# Latency buckets in seconds: sub-millisecond node overhead up to slow LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+    
+    def __init__(self):
+        self.value = 0.0
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+    
+    def __init__(self):
+        self.value = 0.0
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+    
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+    
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum")
+    
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        # One slot per bucket plus the +Inf overflow; cumulated at render time
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+
+
+class Metric:
+    """
+    Base class of a named metric family with optional labels
+    
+    Recording is a dictionary lookup plus an in-place increment, without
+    locks: the API serves requests on one event loop thread, and the rare
+    lost update from a helper thread is acceptable for monitoring. Hot
+    paths can bind a labelled child once with labels() and reuse it.
+    """
+    
+    type_name = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._callback: Optional[Callable[[], Any]] = None
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+    
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+    
+    def labels(self, *values: Any) -> Any:
+        """Get the child for a combination of label values, creating it on first use"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            child = self._children.setdefault(key, self._new_child())
+        return child
+    
+    def set_function(self, callback: Callable[[], Any]) -> None:
+        """
+        Compute the metric at scrape time instead of recording it
+        
+        The callback returns a number (unlabelled metrics) or a mapping of
+        label value tuples to numbers.
+        """
+        self._callback = callback
+    
+    def _samples(self) -> Iterable[Tuple[str, Tuple[str, ...], float]]:
+        if self._callback is not None:
+            value = self._callback()
+            if isinstance(value, dict):
+                for key, sample in value.items():
+                    key = key if isinstance(key, tuple) else (key,)
+                    yield "", tuple(str(part) for part in key), float(sample)
+            elif value is not None:
+                yield "", (), float(value)
+            return
+        for key, child in list(self._children.items()):
+            yield "", key, child.value
+    
+    def render(self) -> List[str]:
+        """Lines of this family in the Prometheus text format"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for suffix, key, value in self._samples():
+            names = self.labelnames
+            if len(key) > len(names):
+                names = names + ("le",)
+            lines.append(f"{self.name}{suffix}{_format_labels(names, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+    
+    type_name = "counter"
+    
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+    
+    type_name = "gauge"
+    
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+    
+    def dec(self, amount: float = 1.0) -> None:
+        self._children[()].dec(amount)
+    
+    def set(self, value: float) -> None:
+        self._children[()].set(value)
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets"""
+    
+    type_name = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+    
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.upper_bounds)
+    
+    def observe(self, value: float) -> None:
+        self._children[()].observe(value)
+    
+    def _samples(self) -> Iterable[Tuple[str, Tuple[str, ...], float]]:
+        for key, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.upper_bounds + (float("inf"),), list(child.counts)):
+                cumulative += count
+                yield "_bucket", key + (_format_value(bound),), cumulative
+            yield "_sum", key, child.sum
+            yield "_count", key, cumulative
+
+
+_registry: Dict[str, Metric] = {}
+
+
+def _register(metric: Metric) -> Any:
+    existing = _registry.get(metric.name)
+    if existing is not None:
+        return existing
+    _registry[metric.name] = metric
+    return metric
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    """Get or create a registered counter"""
+    return _register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    """Get or create a registered gauge"""
+    return _register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    """Get or create a registered histogram"""
+    return _register(Histogram(name, documentation, labelnames, buckets))
+
+
+def render_metrics() -> str:
+    """Render every registered metric in the Prometheus text format (0.0.4)"""
+    lines: List[str] = []
+    for metric in list(_registry.values()):
+        try:
+            lines.extend(metric.render())
+        except Exception:
+            # A failing scrape-time callback must not break the whole scrape
+            continue
+    return "\n".join(lines) + "\n"
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# Application metrics
+
+HTTP_REQUESTS = counter(
+    "http_requests_total", "HTTP requests by route and status code", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = histogram(
+    "http_request_duration_seconds", "HTTP request latency by route (until the body is sent)", ("method", "route")
+)
+HTTP_IN_FLIGHT = gauge(
+    "http_requests_in_flight", "HTTP requests currently being served", ("route",)
+)
+NODE_DURATION = histogram(
+    "pipeline_node_duration_seconds", "Latency of each graph node", ("node",)
+)
+NODE_ERRORS = counter(
+    "pipeline_node_errors_total", "Graph node executions that raised", ("node",)
+)
+PIPELINE_IN_FLIGHT = gauge(
+    "pipeline_runs_in_flight", "Tailoring pipeline executions currently running"
+)
+PIPELINE_RESUMES = counter(
+    "pipeline_resumed_runs_total", "Tailoring runs resumed from a checkpoint of an earlier failed attempt"
+)
+LLM_REQUEST_DURATION = histogram(
+    "llm_request_duration_seconds",
+    "Latency of each Groq API request (time to the full response, or to the first byte when streaming)",
+    ("model", "outcome")
+)
+LLM_TOKENS = counter(
+    "llm_tokens_total", "Tokens reported by the Groq API usage field", ("model", "kind")
+)
+LLM_RETRIES = counter(
+    "llm_retries_total", "Groq API requests retried after a transient failure", ("reason",)
+)
+MODEL_ROUTING = counter(
+    "llm_model_routing_total",
+    "Structured LLM outputs by node, model and routing outcome (accepted, escalated, invalid)",
+    ("node", "model", "outcome")
+)
+LLM_HEDGES = counter(
+    "llm_hedged_requests_total",
+    "Hedged LLM calls by node and outcome (sent, won, lost, skipped)",
+    ("node", "outcome")
+)
+DEADLINES_EXCEEDED = counter(
+    "deadline_exceeded_total", "Work abandoned because its deadline passed, by scope", ("scope",)
+)
+JSON_PARSE = counter(
+    "llm_json_parse_total", "LLM responses by JSON parse path (fast, extracted, repaired, truncated, failed)", ("path",)
+)
+CACHE_LOOKUPS = counter(
+    "cache_lookups_total", "Cache lookups by cache and result", ("cache", "result")
+)
+CACHE_HIT_RATIO = gauge(
+    "cache_hit_ratio", "Hits divided by lookups since start", ("cache",)
+)
+WARMUP_DURATION = gauge(
+    "warmup_duration_seconds", "Time the background startup warmup took (0 until it finishes)"
+)
+
+
+def _cache_hit_ratios() -> Dict[Tuple[str], float]:
+    lookups: Dict[str, List[float]] = {}
+    for (cache, result), child in list(CACHE_LOOKUPS._children.items()):
+        totals = lookups.setdefault(cache, [0.0, 0.0])
+        totals[0] += child.value if result == "hit" else 0.0
+        totals[1] += child.value
+    return {(cache,): hits / total for cache, (hits, total) in lookups.items() if total}
+
+
+CACHE_HIT_RATIO.set_function(_cache_hit_ratios)
+
+counter(
+    "log_records_dropped_total", "Log records discarded because the background log queue was full"
+).set_function(dropped_log_records)
+
+
+def observe_node(name: str) -> Callable:
+    """
+    Decorator recording a graph node's latency and failures under `name`
+    
+    Each execution also runs in its own trace span. Works for sync and
+    async nodes and keeps the wrapped signature, so LangGraph still passes
+    `config` to nodes that accept it.
+    """
+    duration = NODE_DURATION.labels(name)
+    errors = NODE_ERRORS.labels(name)
+    span_name = f"node {name}"
+    attributes = {"langgraph.node": name}
+    
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    with start_span(span_name, attributes):
+                        return await func(*args, **kwargs)
+                except BaseException:
+                    errors.inc()
+                    raise
+                finally:
+                    duration.observe(time.perf_counter() - start)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                with start_span(span_name, attributes):
+                    return func(*args, **kwargs)
+            except BaseException:
+                errors.inc()
+                raise
+            finally:
+                duration.observe(time.perf_counter() - start)
+        return wrapper
+    
+    return decorator
+
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """Path template of the route matching an ASGI scope, e.g. /jobs/{job_id}"""
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match.name == "FULL":
+            return route.path
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request counts, latency and in-flight gauges
+    
+    Routes are labelled by their path template (/jobs/{job_id}), not the
+    raw path, so ids do not create new series. Unmatched paths share the
+    "unmatched" label.
+    """
+    
+    def __init__(self, app: Any, exclude: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude = set(exclude)
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+        
+        route = route_template(scope)
+        method = scope["method"]
+        status_code = 500
+        
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        in_flight = HTTP_IN_FLIGHT.labels(route)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method, route, status_code).inc()
@@ -0,0 +1,92 @@
+"""
+Single-flight coalescing of identical concurrent calls
+Duplicate callers attach to the in-flight execution and share its outcome
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.utils.logger import logger
+from app.utils.metrics import counter
+
+
+SINGLE_FLIGHT_COALESCED = counter(
+    "single_flight_coalesced_total", "Calls that joined an identical in-flight execution", ("name",)
+)
+
+
+class _Call:
+    """An in-flight execution and the number of callers waiting on it"""
+    
+    __slots__ = ("task", "waiters")
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs at most one execution per key at a time
+    
+    The first caller for a key starts the work in its own task; callers
+    that arrive while it is running await the same task and receive the
+    same result or exception. A caller being cancelled only detaches it:
+    the shared work is cancelled once its last caller has gone. Keys are
+    forgotten as soon as the work finishes, so this coalesces concurrent
+    duplicates without caching anything.
+    """
+    
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Label used in log messages
+        """
+        self.name = name
+        self._calls: Dict[str, _Call] = {}
+        self.coalesced = 0
+        self._coalesced_metric = SINGLE_FLIGHT_COALESCED.labels(name)
+    
+    def in_flight(self, key: Optional[str] = None) -> int:
+        """Number of running executions (or 1/0 for a specific key)"""
+        if key is not None:
+            return int(key in self._calls)
+        return len(self._calls)
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `func` for `key`, or join the execution already running for it
+        
+        Args:
+            key: Content hash identifying identical work
+            func: Zero-argument coroutine function performing the work
+        
+        Returns:
+            The shared result of the execution
+        
+        Raises:
+            Exception: Whatever the shared execution raised
+            asyncio.CancelledError: If this caller is cancelled
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _task: self._forget(key, call))
+        else:
+            self.coalesced += 1
+            self._coalesced_metric.inc()
+            logger.info(f"Single-flight {self.name}: joined in-flight execution {key[:12]}")
+        
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Every caller was cancelled: nobody wants the result any more
+                call.task.cancel()
+    
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,52 @@
+"""
+Text normalisation and hashing helpers
+"""
+
+import hashlib
+import re
+import unicodedata
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_for_hash(text: str) -> str:
+    """
+    Normalise text so trivially different copies hash the same
+    
+    Applies Unicode NFKC, collapses all whitespace runs and casefolds.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE_RE.sub(" ", text).strip().casefold()
+
+
+def content_hash(*parts: str) -> str:
+    """
+    Stable SHA-256 hex digest of one or more text parts
+    
+    Parts are length-prefixed so ("ab", "c") and ("a", "bc") differ.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode("utf-8")
+        digest.update(str(len(encoded)).encode("ascii"))
+        digest.update(b":")
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the LLM token count of a text without a tokenizer
+    
+    Counts each punctuation mark as one token and each word as one token
+    per four characters, which tracks BPE tokenizers closely enough for
+    budgeting English prose.
+    """
+    return sum(
+        1 + (len(piece) - 1) // 4 if piece[0].isalnum() or piece[0] == "_" else 1
+        for piece in _TOKEN_RE.findall(text)
+    )
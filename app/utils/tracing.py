@@ -0,0 +1,472 @@
+"""
+Lightweight distributed tracing
+Spans for requests, graph nodes and LLM calls with W3C trace context
+propagation and pluggable exporters (stdout, JSON lines file, OTLP/HTTP)
+"""
+
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+from app.utils.logger import logger, register_log_context
+
+
+TRACE_EXPORTERS = ("none", "stdout", "file", "otlp")
+
+STATUS_UNSET = "unset"
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+KIND_INTERNAL = "internal"
+KIND_SERVER = "server"
+KIND_CLIENT = "client"
+
+# Control markers for the exporter thread
+_FLUSH = object()
+_STOP = object()
+
+
+class Span:
+    """A timed operation within a trace"""
+    
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "kind", "sampled",
+        "start_ns", "end_ns", "attributes", "status", "status_message"
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        kind: str = KIND_INTERNAL,
+        sampled: bool = True,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = STATUS_UNSET
+        self.status_message = ""
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a string, number or boolean attribute"""
+        if value is not None:
+            self.attributes[key] = value
+    
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+    
+    def record_error(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{error.__class__.__name__}: {error}"
+    
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value identifying this span"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "duration_ms": round(((self.end_ns or self.start_ns) - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "status": self.status,
+            "status_message": self.status_message or None,
+        }
+
+
+class SpanExporter:
+    """Destination for finished spans; export() runs on the exporter thread"""
+    
+    def export(self, spans: Sequence[Span]) -> None:
+        raise NotImplementedError
+    
+    def shutdown(self) -> None:
+        pass
+
+
+class StdoutExporter(SpanExporter):
+    """Print one JSON object per span"""
+    
+    def export(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            sys.stdout.write(json.dumps(span.to_dict()) + "\n")
+        sys.stdout.flush()
+
+
+class FileExporter(SpanExporter):
+    """Append one JSON object per span to a file"""
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def export(self, spans: Sequence[Span]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(span.to_dict()) + "\n" for span in spans)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_OTLP_KINDS = {KIND_INTERNAL: 1, KIND_SERVER: 2, KIND_CLIENT: 3}
+_OTLP_STATUS = {STATUS_UNSET: 0, STATUS_OK: 1, STATUS_ERROR: 2}
+
+
+class OTLPExporter(SpanExporter):
+    """Send spans to an OpenTelemetry collector with OTLP/HTTP (JSON encoding)"""
+    
+    def __init__(self, endpoint: str, service_name: str, headers: Optional[Dict[str, str]] = None):
+        self.url = endpoint.rstrip("/")
+        if not self.url.endswith("/v1/traces"):
+            self.url += "/v1/traces"
+        self.service_name = service_name
+        # Only OTLP export needs httpx; keep it out of every importer's startup
+        import httpx
+        self._client = httpx.Client(timeout=10.0, headers=headers or {})
+    
+    def _encode(self, spans: Sequence[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "resume-tailor"},
+                    "spans": [
+                        {
+                            "traceId": span.trace_id,
+                            "spanId": span.span_id,
+                            "parentSpanId": span.parent_id or "",
+                            "name": span.name,
+                            "kind": _OTLP_KINDS[span.kind],
+                            "startTimeUnixNano": str(span.start_ns),
+                            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                            "attributes": [
+                                {"key": key, "value": _otlp_value(value)}
+                                for key, value in span.attributes.items()
+                            ],
+                            "status": {"code": _OTLP_STATUS[span.status], "message": span.status_message},
+                        }
+                        for span in spans
+                    ],
+                }],
+            }]
+        }
+    
+    def export(self, spans: Sequence[Span]) -> None:
+        response = self._client.post(self.url, json=self._encode(spans))
+        response.raise_for_status()
+    
+    def shutdown(self) -> None:
+        self._client.close()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to an exporter
+    
+    Finished spans are queued and exported in batches by a daemon thread, so
+    the event loop never waits on stdout, disk or the collector. With no
+    exporter configured spans are still created (trace ids stay available
+    for logs and response headers) but nothing is queued.
+    """
+    
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_ratio: float = 1.0,
+        batch_size: int = 256,
+        flush_interval: float = 1.0
+    ):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._flushed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if exporter is not None:
+            self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+            self._thread.start()
+    
+    def sample(self) -> bool:
+        """Decide whether a new root trace is recorded"""
+        return self.sample_ratio >= 1.0 or random.random() < self.sample_ratio
+    
+    def finish(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        if self.exporter is not None and span.sampled:
+            self._queue.put(span)
+    
+    def _export(self, batch: List[Span]) -> None:
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.warning(f"Span export failed ({len(batch)} spans): {e}")
+    
+    def _run(self) -> None:
+        batch: List[Span] = []
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if isinstance(item, Span):
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            if batch:
+                self._export(batch)
+                batch = []
+            if item is _STOP:
+                self._flushed.set()
+                return
+            if item is _FLUSH:
+                self._flushed.set()
+    
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every span finished so far has been exported"""
+        self._signal(_FLUSH, timeout)
+    
+    def _signal(self, marker: object, timeout: float) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._flushed.clear()
+        self._queue.put(marker)
+        self._flushed.wait(timeout)
+    
+    def shutdown(self) -> None:
+        """Export pending spans and stop the exporter thread"""
+        self._signal(_STOP, 5.0)
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_tracer: Optional[Tracer] = None
+
+
+def _log_context() -> Dict[str, Any]:
+    """Trace and span ids for structured log records"""
+    span = _current_span.get()
+    if span is None:
+        return {}
+    return {"trace_id": span.trace_id, "span_id": span.span_id}
+
+
+register_log_context(_log_context)
+
+
+def _parse_headers(value: str) -> Dict[str, str]:
+    """Parse OTEL_EXPORTER_OTLP_HEADERS (comma-separated key=value pairs)"""
+    headers = {}
+    for pair in value.split(","):
+        if "=" in pair:
+            key, _, header_value = pair.partition("=")
+            headers[key.strip()] = header_value.strip()
+    return headers
+
+
+def _build_exporter(name: str) -> Optional[SpanExporter]:
+    if name == "none":
+        return None
+    if name == "stdout":
+        return StdoutExporter()
+    if name == "file":
+        return FileExporter(os.getenv("TRACE_FILE", "traces.jsonl"))
+    if name == "otlp":
+        return OTLPExporter(
+            os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318"),
+            os.getenv("OTEL_SERVICE_NAME", "resume-tailor"),
+            _parse_headers(os.getenv("OTEL_EXPORTER_OTLP_HEADERS", "")),
+        )
+    raise ValueError(f"Unknown TRACE_EXPORTER '{name}'. Use one of: {', '.join(TRACE_EXPORTERS)}")
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the process-wide tracer, creating it on first use
+    
+    Configured by TRACE_EXPORTER (none, stdout, file or otlp; defaults to
+    otlp when OTEL_EXPORTER_OTLP_ENDPOINT is set, otherwise none),
+    TRACE_FILE and TRACE_SAMPLE_RATIO.
+    """
+    global _tracer
+    
+    if _tracer is None:
+        default = "otlp" if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") else "none"
+        name = os.getenv("TRACE_EXPORTER", default).lower()
+        _tracer = Tracer(
+            _build_exporter(name),
+            sample_ratio=float(os.getenv("TRACE_SAMPLE_RATIO", 1.0)),
+        )
+        if name != "none":
+            logger.info(f"Tracing enabled ({name} exporter)")
+    return _tracer
+
+
+def set_span_exporter(exporter: Optional[SpanExporter], sample_ratio: float = 1.0) -> Tracer:
+    """Replace the process-wide tracer with one using a custom exporter"""
+    global _tracer
+    
+    shutdown_tracing()
+    _tracer = Tracer(exporter, sample_ratio=sample_ratio)
+    return _tracer
+
+
+def shutdown_tracing() -> None:
+    """Export pending spans and drop the tracer (the next use re-reads the environment)"""
+    global _tracer
+    
+    if _tracer is not None:
+        _tracer.shutdown()
+        _tracer = None
+
+
+def current_span() -> Optional[Span]:
+    """The span active in this context, if any"""
+    return _current_span.get()
+
+
+def set_current_attributes(attributes: Dict[str, Any]) -> None:
+    """Set attributes on the active span (no-op outside a span)"""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attributes(attributes)
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a W3C traceparent header
+    
+    Returns:
+        Tuple of (trace_id, parent span_id, sampled), or None if invalid
+    """
+    if not value:
+        return None
+    parts = value.strip().lower().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or parts[0] == "ff":
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        flags = int(parts[3][:2], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: str = KIND_INTERNAL,
+    traceparent: Optional[str] = None
+) -> Iterator[Span]:
+    """
+    Run a block inside a new span, child of the active span
+    
+    Args:
+        name: Span name
+        attributes: Initial attributes
+        kind: internal, server or client
+        traceparent: Incoming W3C header continuing a remote trace (root spans)
+    
+    Yields:
+        The span, active for the duration of the block
+    """
+    tracer = get_tracer()
+    parent = _current_span.get()
+    if parent is not None:
+        span = Span(name, parent.trace_id, parent.span_id, kind, parent.sampled, attributes)
+    else:
+        remote = parse_traceparent(traceparent)
+        if remote is not None:
+            span = Span(name, remote[0], remote[1], kind, remote[2], attributes)
+        else:
+            span = Span(name, f"{random.getrandbits(128):032x}", None, kind, tracer.sample(), attributes)
+    
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_error(e)
+        raise
+    finally:
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # Closed from another context (e.g. an abandoned async generator)
+            _current_span.set(parent)
+        tracer.finish(span)
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening the root span of each request
+    
+    Continues the caller's trace when a traceparent header is present and
+    returns the trace id in an X-Trace-Id response header, so a slow
+    response can be looked up in the trace backend.
+    """
+    
+    def __init__(self, app: Any, route_template: Callable[[Dict[str, Any]], str], exclude: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.route_template = route_template
+        self.exclude = set(exclude)
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+        
+        headers = dict(scope.get("headers") or ())
+        traceparent = headers.get(b"traceparent", b"").decode("latin-1") or None
+        route = self.route_template(scope)
+        
+        with start_span(
+            f"{scope['method']} {route}",
+            {"http.method": scope["method"], "http.route": route, "http.target": scope["path"]},
+            kind=KIND_SERVER,
+            traceparent=traceparent
+        ) as span:
+            async def send_wrapper(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status = STATUS_ERROR
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-trace-id", span.trace_id.encode("ascii"))
+                    ]
+                await send(message)
+            
+            await self.app(scope, receive, send_wrapper)
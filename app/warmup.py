@@ -0,0 +1,150 @@
+"""
+Background warmup and readiness
+Imports the LLM pipeline's heavy dependencies (LangGraph, LangChain, Groq,
+httpx, NumPy/SciPy) after the server starts instead of at import time
+"""
+
+import asyncio
+import importlib
+import os
+import time
+from typing import Any, Dict, Optional
+
+from app.utils.logger import logger
+from app.utils.metrics import WARMUP_DURATION
+from app.utils.tracing import start_span
+
+
+# Modules that pull in the heavy third-party packages, imported by warmup
+# (or by the first request that needs them, whichever comes first)
+HEAVY_MODULES = (
+    "app.llm.client",
+    "app.llm.routing",
+    "app.graph.nodes",
+    "app.graph.pipeline",
+    "app.graph.incremental",
+    "app.skills.ranking",
+    "app.jobs.worker",
+)
+
+WARMUP_PENDING = "warming_up"
+WARMUP_READY = "ready"
+WARMUP_FAILED = "failed"
+
+_status = WARMUP_PENDING
+_error: Optional[str] = None
+_duration: Optional[float] = None
+_task: Optional[asyncio.Task] = None
+
+
+def _import_heavy_modules() -> None:
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
+
+
+async def warm_up() -> None:
+    """
+    Import the pipeline, create the Groq client and compile the graphs
+    
+    Imports run in a thread so the event loop keeps answering /health while
+    they load. A failure is logged and reported by readiness() rather than
+    raised (start_warmup() retries it): requests still import what they
+    need on first use.
+    """
+    global _status, _error, _duration
+    
+    start = time.perf_counter()
+    try:
+        with start_span("warmup"):
+            await asyncio.to_thread(_import_heavy_modules)
+            
+            from app.graph.pipeline import warmup_graphs
+            from app.llm.client import get_model_name, init_groq_client
+            from app.llm.routing import ROUTED_NODES, cascade_enabled, get_node_model
+            
+            if os.getenv("GROQ_API_KEY"):
+                # One pooled client for the whole process (keep-alive + HTTP/2)
+                init_groq_client()
+            
+            logger.info(f"Using model: {get_model_name()}")
+            for node in ROUTED_NODES:
+                if get_node_model(node) != get_model_name():
+                    logger.info(f"Routing {node} to model: {get_node_model(node)}")
+            if cascade_enabled():
+                logger.info(f"Model cascade enabled: invalid fast-model outputs escalate to {get_model_name()}")
+            
+            # Compile the graph variants once and share them across requests
+            await warmup_graphs()
+    except Exception as e:
+        _status, _error = WARMUP_FAILED, f"{e.__class__.__name__}: {e}"
+        logger.error(f"Warmup failed: {_error}", exc_info=True)
+    else:
+        _status, _error = WARMUP_READY, None
+    finally:
+        _duration = time.perf_counter() - start
+        WARMUP_DURATION.set(_duration)
+    
+    logger.info(f"Warmup finished in {_duration:.2f}s ({_status})")
+
+
+def get_warmup_retry_delay(attempt: int) -> float:
+    """Delay before retrying a failed warmup: WARMUP_RETRY_SECONDS doubling per attempt, up to 5 minutes"""
+    return min(float(os.getenv("WARMUP_RETRY_SECONDS", 5)) * (2 ** max(attempt - 1, 0)), 300.0)
+
+
+async def _warm_up_until_ready() -> None:
+    """Retry warm_up() with backoff, so a transient failure does not leave /ready at 503"""
+    attempt = 0
+    while True:
+        attempt += 1
+        await warm_up()
+        if _status == WARMUP_READY:
+            return
+        delay = get_warmup_retry_delay(attempt)
+        logger.warning(f"Retrying warmup in {delay:.1f}s (attempt {attempt} failed)")
+        await asyncio.sleep(delay)
+
+
+def start_warmup() -> asyncio.Task:
+    """Run warm_up() in the background until it succeeds (once per process)"""
+    global _task
+    
+    if _task is None:
+        _task = asyncio.create_task(_warm_up_until_ready())
+    return _task
+
+
+async def stop_warmup() -> None:
+    """Cancel a warmup still in progress (on shutdown)"""
+    global _task
+    
+    if _task is not None and not _task.done():
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+    _task = None
+
+
+def readiness() -> Dict[str, Any]:
+    """
+    Warmup progress for the readiness probe
+    
+    Returns:
+        Dictionary with status (warming_up, ready or failed), warmup_seconds
+        once finished, and error if it failed
+    """
+    state: Dict[str, Any] = {"status": _status}
+    if _duration is not None:
+        state["warmup_seconds"] = round(_duration, 3)
+    if _error is not None:
+        state["error"] = _error
+    return state
+
+
+def reset_warmup() -> None:
+    """Forget warmup state (used by tests)"""
+    global _status, _error, _duration, _task
+    
+    _status, _error, _duration, _task = WARMUP_PENDING, None, None, None
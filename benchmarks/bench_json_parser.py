@@ -0,0 +1,87 @@
+"""
+LLM JSON parser benchmark
+Times the shared orjson-based parser against the previous per-node
+json.loads fallback chain across response sizes and defect types
+
+Usage:
+    python -m benchmarks.bench_json_parser [--iterations N]
+"""
+
+import argparse
+import json
+import re
+import time
+
+from app.llm.parsing import parse_llm_json
+
+
+def legacy_parse(response: str) -> dict:
+    """The fence-strip / json.loads / split-on-quotes chain nodes used before"""
+    response = response.strip()
+    if response.startswith("```json"):
+        response = response[7:]
+    if response.startswith("```"):
+        response = response[3:]
+    if response.endswith("```"):
+        response = response[:-3]
+    response = response.strip()
+    try:
+        return json.loads(response)
+    except json.JSONDecodeError:
+        try:
+            parts = response.split('"')
+            for i in range(1, len(parts), 2):
+                parts[i] = parts[i].replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+            return json.loads('"'.join(parts))
+        except json.JSONDecodeError:
+            return json.loads(re.sub(r"[\x00-\x1f\x7f-\x9f]", " ", response))
+
+
+def make_response(size: int, defect: str) -> str:
+    """Build a rewrite_resume-style response of roughly `size` characters"""
+    bullet = "- Built Python and FastAPI services handling 1M+ requests per day\n"
+    resume = "John Doe\nSenior Engineer\n\n" + bullet * max(1, size // len(bullet))
+    document = {"tailored_resume": resume, "professional_summary": "Backend engineer."}
+    
+    if defect == "clean":
+        return json.dumps(document)
+    if defect == "fenced":
+        return "```json\n" + json.dumps(document, indent=4) + "\n```"
+    if defect == "raw_newlines":
+        return json.dumps(document).replace("\\n", "\n")
+    raise ValueError(defect)
+
+
+def time_parser(parser, text: str, iterations: int) -> float:
+    """Mean microseconds per parse; NaN if the parser fails on this input"""
+    try:
+        parser(text)
+    except (ValueError, json.JSONDecodeError):
+        return float("nan")
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parser(text)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    
+    rows = []
+    for size in (1_000, 10_000, 100_000):
+        for defect in ("clean", "fenced", "raw_newlines"):
+            text = make_response(size, defect)
+            rows.append({
+                "size": size,
+                "defect": defect,
+                "legacy_us": round(time_parser(legacy_parse, text, args.iterations), 1),
+                "shared_us": round(time_parser(parse_llm_json, text, args.iterations), 1),
+            })
+    
+    print(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
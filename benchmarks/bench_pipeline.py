@@ -0,0 +1,250 @@
+"""
+Pipeline overhead benchmark suite
+Measures what our own code costs around the LLM calls (graph compile, node
+prompt building and parsing, JSON repair, state copying, schema validation)
+with a deterministic fake LLM, and stores the results as JSON per commit
+
+Usage:
+    python -m benchmarks.bench_pipeline [--iterations N] [--latency-ms MS]
+        [--output PATH] [--compare BASELINE.json] [--threshold 1.25]
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+from app.graph import nodes
+from app.graph.pipeline import (
+    build_initial_state,
+    create_resume_tailor_graph,
+    create_sectioned_graph,
+    route_section_rewrites,
+)
+from app.llm.parsing import parse_llm_json
+from app.schemas import TailorRequest, TailorResponse
+from benchmarks.bench_json_parser import make_response
+from benchmarks.fake_llm import patched_llm
+from benchmarks.samples import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def summarize(samples_s: list) -> Dict[str, float]:
+    """Mean/p50/p95 in microseconds"""
+    samples_us = sorted(sample * 1e6 for sample in samples_s)
+    p95_index = min(len(samples_us) - 1, int(len(samples_us) * 0.95))
+    return {
+        "mean_us": round(statistics.fmean(samples_us), 1),
+        "p50_us": round(statistics.median(samples_us), 1),
+        "p95_us": round(samples_us[p95_index], 1),
+        "iterations": len(samples_us),
+    }
+
+
+def measure(func: Callable[[], Any], iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """Time a synchronous callable"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def ameasure(func: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """Time a coroutine function"""
+    for _ in range(warmup):
+        await func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_graph_compile(iterations: int) -> Dict[str, Any]:
+    """Graph construction plus compile for each variant"""
+    return {
+        "graph.compile.standard": measure(lambda: create_resume_tailor_graph().compile(), iterations),
+        "graph.compile.sectioned": measure(lambda: create_sectioned_graph().compile(), iterations),
+    }
+
+
+async def bench_nodes(iterations: int) -> Dict[str, Any]:
+    """Each node with a zero-latency LLM: prompt building, parsing and state handling"""
+    state = nodes.compact_inputs_node(build_initial_state(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION))
+    state["jd_keywords"] = await nodes.analyze_job_description(state["job_description"])
+    state["all_required_skills"] = nodes.collect_required_skills(state["jd_keywords"])
+    matched = await nodes.match_skills_node(dict(state))
+    state.update(matched)
+    state.update(nodes.plan_sections_node(state))
+    tasks = [send.arg for send in route_section_rewrites(state) if send.node == "rewrite_section"]
+    
+    async def rewrite_sections():
+        for task in tasks:
+            await nodes.rewrite_section_node(task)
+    
+    return {
+        "node.compact_inputs": measure(
+            lambda: nodes.compact_inputs_node(build_initial_state(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION)),
+            iterations
+        ),
+        "node.analyze_job_description": await ameasure(
+            lambda: nodes.analyze_job_description(state["job_description"]), iterations
+        ),
+        "node.match_skills": await ameasure(lambda: nodes.match_skills_node(dict(state)), iterations),
+        "node.rewrite_resume": await ameasure(lambda: nodes.rewrite_resume_node(dict(state)), iterations),
+        "node.plan_sections": measure(lambda: nodes.plan_sections_node(state), iterations),
+        "node.rewrite_sections_all": await ameasure(rewrite_sections, iterations),
+        "node.write_summary": await ameasure(lambda: nodes.write_summary_node(dict(state)), iterations),
+    }
+
+
+async def bench_pipelines(iterations: int, latency_ms: float) -> Dict[str, Any]:
+    """End-to-end graph runs; a fresh job description each run forces extraction"""
+    results = {}
+    graphs = {
+        "standard": create_resume_tailor_graph().compile(),
+        "sectioned": create_sectioned_graph().compile(),
+    }
+    counter = iter(range(10 ** 9))
+    
+    def fresh_state() -> Dict[str, Any]:
+        return build_initial_state(SAMPLE_RESUME, f"{SAMPLE_JOB_DESCRIPTION}\nReference: {next(counter)}")
+    
+    for name, graph in graphs.items():
+        with patched_llm(0) as fake:
+            results[f"pipeline.{name}.overhead"] = await ameasure(lambda: graph.ainvoke(fresh_state()), iterations)
+            calls = len(fake.prompts) // (iterations + 3)
+        if latency_ms:
+            with patched_llm(latency_ms):
+                timing = await ameasure(lambda: graph.ainvoke(fresh_state()), max(iterations // 10, 3), warmup=1)
+            timing["llm_latency_ms"] = latency_ms
+            results[f"pipeline.{name}.with_latency"] = timing
+        results[f"pipeline.{name}.overhead"]["llm_calls"] = calls
+    
+    with patched_llm(0):
+        final_state = await graphs["sectioned"].ainvoke(fresh_state())
+    results["state.deepcopy_final"] = measure(lambda: copy.deepcopy(final_state), iterations)
+    return results
+
+
+def bench_parsing(iterations: int) -> Dict[str, Any]:
+    """Shared JSON parser across response sizes and defects"""
+    results = {}
+    for size in (1_000, 10_000, 100_000):
+        for defect in ("clean", "fenced", "raw_newlines"):
+            text = make_response(size, defect)
+            runs = max(iterations // (size // 1_000), 5)
+            results[f"parse.{defect}.{size}"] = measure(lambda: parse_llm_json(text), runs)
+    return results
+
+
+def bench_schemas(iterations: int) -> Dict[str, Any]:
+    """Pydantic validation of request bodies and response serialisation"""
+    request_body = {"resume_text": SAMPLE_RESUME, "job_description": SAMPLE_JOB_DESCRIPTION}
+    response = TailorResponse(
+        tailored_resume=SAMPLE_RESUME,
+        summary="Backend engineer with 5+ years of Python.",
+        matched_skills=["Python", "Docker", "PostgreSQL"],
+        missing_skills=["FastAPI", "Kubernetes"],
+    )
+    return {
+        "schema.TailorRequest.validate": measure(lambda: TailorRequest.model_validate(request_body), iterations),
+        "schema.TailorResponse.dump_json": measure(lambda: response.model_dump_json(), iterations),
+    }
+
+
+def git_revision() -> str:
+    """Short commit hash of the working tree ("unknown" outside git)"""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout
+        return revision + ("-dirty" if dirty.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print mean-time ratios against a baseline; return the number of regressions"""
+    regressions = 0
+    print(f"{'benchmark':45} {'baseline_us':>12} {'current_us':>12} {'ratio':>7}")
+    for name, result in sorted(current["results"].items()):
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["mean_us"] / before["mean_us"] if before["mean_us"] else float("inf")
+        flag = "  REGRESSION" if ratio > threshold else ""
+        regressions += bool(flag)
+        print(f"{name:45} {before['mean_us']:12.1f} {result['mean_us']:12.1f} {ratio:7.2f}{flag}")
+    return regressions
+
+
+async def run_suite(iterations: int, latency_ms: float) -> Dict[str, Any]:
+    results = {}
+    results.update(bench_graph_compile(max(iterations // 10, 5)))
+    with patched_llm(0):
+        results.update(await bench_nodes(iterations))
+    results.update(await bench_pipelines(max(iterations // 5, 5), latency_ms))
+    results.update(bench_parsing(iterations))
+    results.update(bench_schemas(iterations * 10))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="fake LLM latency for the with_latency runs")
+    parser.add_argument("--output", help="results file (default benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="baseline results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="mean-time ratio counted as a regression")
+    args = parser.parse_args()
+    
+    # Keep registry writes and logs out of the way of the measurements
+    os.environ["DATABASE_PATH"] = str(Path(tempfile.mkdtemp()) / "bench.db")
+    os.environ.setdefault("SKILL_MATCH_MODE", "hybrid")
+    nodes.logger.disabled = True
+    
+    revision = git_revision()
+    report = {
+        "commit": revision,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "results": asyncio.run(run_suite(args.iterations, args.latency_ms)),
+    }
+    
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {output}")
+    
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print(f"Comparing {revision} against {baseline.get('commit', args.compare)}")
+        sys.exit(1 if compare(report, baseline, args.threshold) else 0)
+    
+    for name, result in report["results"].items():
+        print(f"{name:45} {result['mean_us']:12.1f} us")
+
+
+if __name__ == "__main__":
+    main()
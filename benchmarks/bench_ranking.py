@@ -0,0 +1,65 @@
+"""
+Bulk ranking benchmark
+Times scoring a synthetic pool of resumes against many job descriptions
+with the sparse ranker (no LLM calls)
+
+Usage:
+    python -m benchmarks.bench_ranking [--resumes M] [--jobs N] [--top-k K]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from app.skills.ranking import score_matrix, top_k
+from app.skills.taxonomy import SKILL_TAXONOMY
+from benchmarks.samples import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+
+def make_corpus(resumes: int, jobs: int, seed: int = 0):
+    """Variants of the sample resume and job description with shuffled lines and skills"""
+    rng = random.Random(seed)
+    skills = list(SKILL_TAXONOMY)
+    
+    def variant(text: str, extra_skills: int) -> str:
+        lines = text.strip().splitlines()
+        rng.shuffle(lines)
+        lines.append("Skills: " + ", ".join(rng.sample(skills, extra_skills)))
+        return "\n".join(lines)
+    
+    return (
+        [variant(SAMPLE_RESUME, 8) for _ in range(resumes)],
+        [variant(SAMPLE_JOB_DESCRIPTION, 5) for _ in range(jobs)],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+    
+    resumes, jobs = make_corpus(args.resumes, args.jobs)
+    
+    start = time.perf_counter()
+    scores = score_matrix(resumes, jobs)
+    score_s = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    top_k(scores.T, args.top_k)
+    top_k(scores, args.top_k)
+    top_k_s = time.perf_counter() - start
+    
+    print(json.dumps({
+        "resumes": args.resumes,
+        "jobs": args.jobs,
+        "score_matrix_s": round(score_s, 3),
+        "top_k_s": round(top_k_s, 4),
+        "pairs_per_second": round(args.resumes * args.jobs / (score_s + top_k_s)),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
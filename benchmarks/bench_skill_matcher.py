@@ -0,0 +1,90 @@
+"""
+Skill matcher benchmark
+Compares the latency of the local taxonomy matcher against the LLM path
+and, when GROQ_API_KEY is set and --llm is passed, their agreement
+
+Usage:
+    python -m benchmarks.bench_skill_matcher [--iterations N] [--llm]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from app.graph.nodes import llm_match_skills
+from app.skills.matcher import SkillIndex, match_skills_locally
+from benchmarks.samples import SAMPLE_REQUIRED_SKILLS, SAMPLE_RESUME
+
+
+def bench_local(iterations: int) -> dict:
+    """Time index construction and classification of the sample resume"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        SkillIndex(tuple(SAMPLE_REQUIRED_SKILLS))
+    build_us = (time.perf_counter() - start) / iterations * 1e6
+    
+    match_skills_locally(SAMPLE_RESUME, SAMPLE_REQUIRED_SKILLS)  # warm the index cache
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = match_skills_locally(SAMPLE_RESUME, SAMPLE_REQUIRED_SKILLS)
+    match_us = (time.perf_counter() - start) / iterations * 1e6
+    
+    return {
+        "index_build_us": round(build_us, 1),
+        "match_us": round(match_us, 1),
+        "result": result,
+    }
+
+
+async def bench_llm() -> dict:
+    """Time one LLM classification of the sample resume"""
+    start = time.perf_counter()
+    result = await llm_match_skills(SAMPLE_RESUME, SAMPLE_REQUIRED_SKILLS)
+    return {
+        "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+        "result": result,
+    }
+
+
+def agreement(local: dict, llm: dict) -> dict:
+    """Share of skills both paths classify the same way"""
+    llm_matched = {str(skill).casefold() for skill in llm.get("matched_skills", [])}
+    local_matched = {skill.casefold() for skill in local["matched_skills"]}
+    decided = [
+        skill for skill in SAMPLE_REQUIRED_SKILLS
+        if skill not in local["ambiguous_skills"]
+    ]
+    
+    same_all = sum(
+        (skill.casefold() in llm_matched) == (skill.casefold() in local_matched)
+        for skill in SAMPLE_REQUIRED_SKILLS
+    )
+    same_decided = sum(
+        (skill.casefold() in llm_matched) == (skill.casefold() in local_matched)
+        for skill in decided
+    )
+    return {
+        "all_skills": round(same_all / len(SAMPLE_REQUIRED_SKILLS), 3),
+        "locally_decided_skills": round(same_decided / max(len(decided), 1), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--llm", action="store_true", help="also call Groq and compare")
+    args = parser.parse_args()
+    
+    report = {"local": bench_local(args.iterations)}
+    
+    if args.llm:
+        llm = asyncio.run(bench_llm())
+        report["llm"] = llm
+        report["agreement"] = agreement(report["local"]["result"], llm["result"])
+    
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
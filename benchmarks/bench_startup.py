@@ -0,0 +1,106 @@
+"""
+Cold-start import benchmark
+Imports app.main in fresh interpreters under `python -X importtime`, reports
+the median import time and the slowest modules, and fails when the median
+exceeds the budget or a lazily-loaded heavy dependency is imported eagerly
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--budget-ms MS] [--top N]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Default budget for the median `import app.main`; FastAPI itself accounts
+# for most of it
+DEFAULT_BUDGET_MS = 1000.0
+
+# Packages that must only load on first pipeline use or during warmup
+LAZY_PACKAGES = ("langgraph", "langchain_core", "langchain", "groq", "httpx", "numpy", "scipy")
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| *(\S+)$")
+
+
+def import_profile(module: str = "app.main") -> Tuple[float, Dict[str, float]]:
+    """
+    Import `module` in a fresh interpreter with -X importtime
+    
+    Returns:
+        Cumulative import time of `module` in ms, and self time in ms of
+        every module imported along the way
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_ms = 0.0
+    self_ms: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match is None:
+            continue
+        own, cumulative, name = match.groups()
+        self_ms[name] = int(own) / 1000
+        if name == module:
+            total_ms = int(cumulative) / 1000
+    return total_ms, self_ms
+
+
+def eager_heavy_imports(modules: Dict[str, float]) -> List[str]:
+    """Lazy packages that were imported anyway"""
+    return [package for package in LAZY_PACKAGES if package in modules]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="maximum median import time")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args()
+    
+    # The first run also writes bytecode caches; keep it out of the numbers
+    import_profile()
+    runs = [import_profile() for _ in range(args.runs)]
+    totals = [total for total, _ in runs]
+    modules = runs[-1][1]
+    eager = eager_heavy_imports(modules)
+    median = statistics.median(totals)
+    
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    print(json.dumps({
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "median_ms": round(median, 1),
+        "min_ms": round(min(totals), 1),
+        "max_ms": round(max(totals), 1),
+        "budget_ms": args.budget_ms,
+        "modules_imported": len(modules),
+        "slowest_self_ms": {name: round(ms, 1) for name, ms in slowest},
+        "eager_heavy_imports": eager,
+    }, indent=2))
+    
+    failed = False
+    if median > args.budget_ms:
+        print(f"FAIL: median import time {median:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if eager:
+        print(f"FAIL: imported eagerly by app.main: {', '.join(eager)}")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Sample resumes, job descriptions and skill lists shared by the benchmarks
+"""
+
+SAMPLE_RESUME = """
+John Doe
+Senior Software Engineer
+
+PROFESSIONAL SUMMARY
+Experienced software engineer with 5+ years in full-stack development.
+
+TECHNICAL SKILLS
+- Programming: Python, JavaScript, Java
+- Frameworks: Django, Flask, React
+- Databases: PostgreSQL, MongoDB, Redis
+- Tools: Git, Docker, Jenkins
+
+EXPERIENCE
+
+Senior Software Engineer | Tech Corp | 2020 - Present
+- Developed RESTful APIs serving 1M+ daily requests
+- Led team of 4 developers in agile environment
+- Implemented CI/CD pipelines reducing deployment time by 40%
+- Built microservices architecture using Docker and Kubernetes
+
+Software Engineer | StartupXYZ | 2018 - 2020
+- Created full-stack web applications using Python and React
+- Optimized database queries improving performance by 60%
+- Collaborated with cross-functional teams on product development
+
+EDUCATION
+Bachelor of Science in Computer Science
+University of Technology | 2018
+"""
+
+SAMPLE_JOB_DESCRIPTION = """
+Senior Backend Engineer - Python
+
+We are seeking a talented Senior Backend Engineer to join our growing team.
+
+REQUIREMENTS:
+- 5+ years of Python development experience
+- Expert knowledge of FastAPI or Django frameworks
+- Strong experience with PostgreSQL and Redis
+- Proficiency in Docker and containerization
+- Experience with AWS or Google Cloud Platform
+- Knowledge of microservices architecture
+- Excellent problem-solving and communication skills
+
+RESPONSIBILITIES:
+- Design and implement scalable RESTful APIs
+- Optimize application performance and database queries
+- Mentor junior developers
+- Collaborate with product and DevOps teams
+"""
+
+# What extract_keywords_node typically returns for SAMPLE_JOB_DESCRIPTION
+SAMPLE_REQUIRED_SKILLS = [
+    "Python", "FastAPI", "Django", "PostgreSQL", "Redis", "Docker",
+    "AWS", "Google Cloud Platform", "Microservices", "RESTful APIs",
+    "Kubernetes", "Terraform", "Problem-solving", "Communication",
+    "Mentoring", "5+ years of Python development experience",
+]
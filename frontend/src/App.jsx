@@ -1,5 +1,5 @@
 import { useState } from 'react';
-import { tailorResume } from './services/api';
+import { tailorResumeStream } from './services/api';
 import InputSection from './components/InputSection';
 import ResultsSection from './components/ResultsSection';
 import Header from './components/Header';
@@ -41,10 +41,34 @@ function App() {
     setLoading(true);
 
     try {
-      const data = await tailorResume({
-        resume_text: resumeText,
-        job_description: jobDescription,
-      });
+      // Show skills and the rewritten resume as soon as each part is ready
+      const data = await tailorResumeStream(
+        {
+          resume_text: resumeText,
+          job_description: jobDescription,
+        },
+        {
+          onNode: (node) => {
+            if (node.node !== 'match_skills') return;
+            setResults((prev) => ({
+              tailored_resume: '',
+              summary: '',
+              ...prev,
+              matched_skills: node.matched_skills || [],
+              missing_skills: node.missing_skills || [],
+            }));
+          },
+          onToken: (text) => {
+            setResults((prev) => ({
+              summary: '',
+              matched_skills: [],
+              missing_skills: [],
+              ...prev,
+              tailored_resume: (prev?.tailored_resume || '') + text,
+            }));
+          },
+        }
+      );
       
       setResults(data);
     } catch (err) {
@@ -95,11 +119,11 @@ function App() {
           loading={loading}
         />
 
-        {/* Loading Spinner */}
-        {loading && <LoadingSpinner />}
+        {/* Loading Spinner (until the first partial results arrive) */}
+        {loading && !results && <LoadingSpinner />}
 
         {/* Results Section */}
-        {results && !loading && <ResultsSection results={results} />}
+        {results && <ResultsSection results={results} />}
       </main>
 
       {/* Footer */}
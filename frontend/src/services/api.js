@@ -57,5 +57,72 @@ export const tailorResume = async ({ resume_text, job_description }) => {
   return response.data;
 };
 
+/**
+ * Tailor resume with progressive results streamed over Server-Sent Events
+ * @param {Object} data
+ * @param {string} data.resume_text - The original resume text
+ * @param {string} data.job_description - The target job description
+ * @param {Object} handlers
+ * @param {Function} [handlers.onNode] - Called with each finished node's outputs
+ * @param {Function} [handlers.onToken] - Called with tailored resume text as it is generated
+ * @returns {Promise<Object>} Final tailored resume data
+ */
+export const tailorResumeStream = async (
+  { resume_text, job_description },
+  { onNode, onToken } = {}
+) => {
+  const response = await fetch(`${api.defaults.baseURL}/tailor/stream`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Accept: 'text/event-stream',
+    },
+    body: JSON.stringify({ resume_text, job_description }),
+  });
+
+  if (!response.ok) {
+    const body = await response.json().catch(() => ({}));
+    const error = new Error(body.detail || body.error || `Request failed (${response.status})`);
+    error.response = { status: response.status, data: body };
+    throw error;
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  // SSE messages are separated by a blank line
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const message = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = 'message';
+      let data = '';
+      for (const line of message.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      const payload = data ? JSON.parse(data) : {};
+
+      if (event === 'node') onNode?.(payload);
+      else if (event === 'token') onToken?.(payload.text);
+      else if (event === 'result') return payload;
+      else if (event === 'error') {
+        const error = new Error(payload.detail);
+        error.response = { status: 500, data: payload };
+        throw error;
+      }
+    }
+  }
+
+  throw new Error('Stream ended before the result was received');
+};
+
 export default api;
 
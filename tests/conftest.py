@@ -0,0 +1,85 @@
+"""
+Shared fixtures for the Resume Tailor test suite
+"""
+
+import asyncio
+import json
+
+import pytest
+
+
+SAMPLE_RESUME = (
+    "John Doe\nSoftware Engineer\n\nExperience:\n"
+    "- 5 years Python development\n- Built REST APIs with FastAPI\n"
+    "- Worked with PostgreSQL databases"
+)
+
+SAMPLE_JOB_DESCRIPTION = (
+    "Senior Python Developer needed. Must have FastAPI, Docker, "
+    "and cloud experience."
+)
+
+
+def fake_llm_response(prompt: str) -> str:
+    """Return a canned JSON response based on which node built the prompt"""
+    if "Analyze the following job description" in prompt:
+        return json.dumps({
+            "technical_skills": ["Python", "FastAPI", "Docker"],
+            "soft_skills": ["Communication"],
+            "qualifications": [],
+            "keywords": ["backend", "APIs"]
+        })
+    if "analyzing a resume against required skills" in prompt:
+        return json.dumps({
+            "matched_skills": ["Python", "FastAPI"],
+            "missing_skills": ["Docker", "Communication"]
+        })
+    if "Rewrite ONE section of a resume" in prompt:
+        section = prompt.split("Section (", 1)[1].split("):\n", 1)[1].split("\n\nJob Description:", 1)[0]
+        return json.dumps({"rewritten_section": section + "\n- Tailored for the role"})
+    if "Write a compelling professional summary" in prompt:
+        return json.dumps({"professional_summary": "Python engineer with FastAPI experience."})
+    return json.dumps({
+        "tailored_resume": "John Doe\nSenior Python Engineer",
+        "professional_summary": "Python engineer with FastAPI experience."
+    })
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    """Point every SQLite-backed store at a per-test database and empty the caches"""
+    from app.jobs import queue
+    from app.storage import checkpoints, jd_registry, result_cache, sessions
+    
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "resume_tailor.db"))
+    jd_registry.close_jd_registry()
+    queue.close_job_queue()
+    asyncio.run(result_cache.close_result_cache())
+    sessions.close_session_store()
+    checkpoints.close_checkpoint_saver()
+    yield tmp_path
+    jd_registry.close_jd_registry()
+    queue.close_job_queue()
+    asyncio.run(result_cache.close_result_cache())
+    sessions.close_session_store()
+    checkpoints.close_checkpoint_saver()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Replace the Groq call used by the graph nodes with a canned responder"""
+    calls = []
+    
+    async def _fake_call_groq_api(prompt, temperature=0.3, max_tokens=2000, **kwargs):
+        calls.append(prompt)
+        return fake_llm_response(prompt)
+    
+    async def _fake_stream_groq_api(prompt, temperature=0.3, max_tokens=2000, **kwargs):
+        calls.append(prompt)
+        response = fake_llm_response(prompt)
+        for i in range(0, len(response), 5):
+            yield response[i:i + 5]
+    
+    monkeypatch.setattr("app.graph.nodes.call_groq_api", _fake_call_groq_api)
+    monkeypatch.setattr("app.graph.nodes.stream_groq_api", _fake_stream_groq_api)
+    return calls
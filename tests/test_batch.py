@@ -0,0 +1,61 @@
+"""
+Tests for batch tailoring
+"""
+
+from fastapi.testclient import TestClient
+
+from app.graph import nodes
+from app.main import app
+from tests.conftest import SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION
+
+client = TestClient(app)
+
+
+def test_batch_extracts_keywords_once(fake_llm, monkeypatch):
+    """Test a batch analyses the job description once and keeps input order"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    response = client.post("/tailor/batch", json={
+        "job_description": SAMPLE_JOB_DESCRIPTION,
+        "resumes": [SAMPLE_RESUME, SAMPLE_RESUME + "\nKubernetes", SAMPLE_RESUME + "\nAWS"]
+    })
+    
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2]
+    assert all(item["error"] is None for item in results)
+    extraction_calls = [p for p in fake_llm if "Analyze the following job description" in p]
+    assert len(extraction_calls) == 1
+
+
+def test_batch_reports_per_item_errors(fake_llm, monkeypatch):
+    """Test one failing resume does not fail the rest of the batch"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    fake = nodes.call_groq_api
+    
+    async def flaky_call(prompt, **kwargs):
+        if "BROKEN" in prompt:
+            raise RuntimeError("upstream error")
+        return await fake(prompt, **kwargs)
+    
+    monkeypatch.setattr("app.graph.nodes.call_groq_api", flaky_call)
+    
+    response = client.post("/tailor/batch", json={
+        "job_description": SAMPLE_JOB_DESCRIPTION,
+        "resumes": [SAMPLE_RESUME, SAMPLE_RESUME + "\nBROKEN"]
+    })
+    
+    assert response.status_code == 200
+    first, second = response.json()["results"]
+    assert first["result"]["matched_skills"] == ["Python", "FastAPI"]
+    assert second["result"] is None
+    assert "upstream error" in second["error"]
+
+
+def test_batch_requires_resumes():
+    """Test an empty resume list is rejected"""
+    response = client.post("/tailor/batch", json={
+        "job_description": SAMPLE_JOB_DESCRIPTION,
+        "resumes": []
+    })
+    assert response.status_code == 422
@@ -0,0 +1,125 @@
+"""
+Tests for checkpointed tailoring runs that resume after a failure
+"""
+
+import asyncio
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+
+from app.graph.pipeline import get_run_checkpoint, run_resume_tailor_pipeline
+from app.llm.routing import routing_fingerprint
+from app.storage import checkpoints
+from app.storage.result_cache import compute_result_key
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME, fake_llm_response
+
+
+@pytest.fixture
+def flaky_llm(monkeypatch):
+    """LLM stub that fails the first call whose prompt contains `fail_on`"""
+    state = {"fail_on": None, "calls": []}
+    
+    async def _call(prompt, temperature=0.3, max_tokens=2000, **kwargs):
+        state["calls"].append(prompt)
+        if state["fail_on"] and state["fail_on"] in prompt:
+            state["fail_on"] = None
+            # Fail after parallel siblings finished (LangGraph cancels
+            # siblings still running, and those are redone on resume)
+            await asyncio.sleep(0.05)
+            raise RuntimeError("Groq API returned 503")
+        return fake_llm_response(prompt)
+    
+    monkeypatch.setattr("app.graph.nodes.call_groq_api", _call)
+    return state
+
+
+def _run(variant):
+    return asyncio.run(run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, variant=variant))
+
+
+def _thread_id(variant):
+    return compute_result_key(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, routing_fingerprint(), variant)
+
+
+def test_retry_resumes_at_failed_node(flaky_llm):
+    """Test a failed rewrite keeps the paid-for analysis and a retry only redoes the rewrite"""
+    flaky_llm["fail_on"] = "tailor the given resume to match"
+    
+    with pytest.raises(Exception, match="503"):
+        _run("standard")
+    
+    checkpoint = asyncio.run(get_run_checkpoint(_thread_id("standard"), "standard"))
+    assert checkpoint["next"] == ["rewrite_resume"]
+    assert checkpoint["values"]["matched_skills"] == ["Python", "FastAPI"]
+    
+    flaky_llm["calls"].clear()
+    result = _run("standard")
+    
+    assert len(flaky_llm["calls"]) == 1
+    assert "tailor the given resume to match" in flaky_llm["calls"][0]
+    assert result["tailored_resume"] == "John Doe\nSenior Python Engineer"
+    # Finished runs are not kept
+    assert asyncio.run(get_run_checkpoint(_thread_id("standard"), "standard")) is None
+
+
+def test_retry_only_reruns_failed_parallel_branch(flaky_llm):
+    """Test section rewrites that finished next to a failed one are not repeated"""
+    flaky_llm["fail_on"] = "Write a compelling professional summary"
+    
+    with pytest.raises(Exception, match="503"):
+        _run("sectioned")
+    sections = sum("Rewrite ONE section" in prompt for prompt in flaky_llm["calls"])
+    assert sections > 0
+    
+    flaky_llm["calls"].clear()
+    result = _run("sectioned")
+    
+    assert len(flaky_llm["calls"]) == 1
+    assert "Write a compelling professional summary" in flaky_llm["calls"][0]
+    assert "Tailored for the role" in result["tailored_resume"]
+
+
+def test_checkpoints_can_be_disabled(flaky_llm, monkeypatch):
+    """Test PIPELINE_CHECKPOINTS=false restarts failed runs from scratch"""
+    monkeypatch.setenv("PIPELINE_CHECKPOINTS", "false")
+    flaky_llm["fail_on"] = "tailor the given resume to match"
+    
+    with pytest.raises(Exception):
+        _run("standard")
+    flaky_llm["calls"].clear()
+    _run("standard")
+    
+    assert len(flaky_llm["calls"]) > 1
+    assert asyncio.run(get_run_checkpoint(_thread_id("standard"), "standard")) is None
+
+
+def test_empty_checkpoint_db_path_uses_database_path(monkeypatch, isolated_storage):
+    """Test CHECKPOINT_DB_PATH= (as in .env.example) stores checkpoints in DATABASE_PATH, not a temp database"""
+    monkeypatch.setenv("CHECKPOINT_DB_PATH", "")
+    checkpoints.close_checkpoint_saver()
+    
+    checkpoints.get_checkpoint_saver()
+    
+    assert (isolated_storage / "resume_tailor.db").exists()
+
+
+def test_expired_threads_are_purged_once_per_interval(monkeypatch, isolated_storage):
+    """Test put() does not scan for expired threads on every checkpoint"""
+    saver = checkpoints.SQLiteCheckpointSaver(str(isolated_storage / "purge.db"), ttl_seconds=60, purge_interval=300)
+    purges = []
+    monkeypatch.setattr(saver, "_purge_expired", purges.append)
+    clock = [1000.0]
+    monkeypatch.setattr(checkpoints.time, "time", lambda: clock[0])
+    
+    def put(thread_id):
+        saver.put({"configurable": {"thread_id": thread_id}}, empty_checkpoint(), {}, {})
+    
+    put("a")
+    put("b")
+    clock[0] += 299
+    put("c")
+    clock[0] += 1
+    put("d")
+    saver.close()
+    
+    assert purges == [1000.0, 1300.0]
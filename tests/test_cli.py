@@ -0,0 +1,92 @@
+"""
+Tests for the tailor-batch command-line tool
+"""
+
+import asyncio
+import json
+
+from app import cli
+from app.cli import Checkpoint, tailor_batch
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+
+def _write_input(path, count, extra_lines=()):
+    lines = [
+        json.dumps({"id": f"item-{i}", "resume_text": f"{SAMPLE_RESUME}\n- Project {i}", "job_description": SAMPLE_JOB_DESCRIPTION})
+        for i in range(count)
+    ]
+    path.write_text("\n".join([*lines, *extra_lines]) + "\n")
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_tailor_batch_writes_one_record_per_line(fake_llm, tmp_path):
+    """Test every input line gets a result or error record"""
+    source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    _write_input(source, 5, extra_lines=["", "not json"])
+    
+    stats = asyncio.run(tailor_batch(str(source), str(output), concurrency=2, checkpoint_every=2))
+    
+    records = _records(output)
+    assert stats == {"succeeded": 5, "failed": 1, "skipped": 0, "recovered": 0}
+    assert sorted(record["line"] for record in records) == [1, 2, 3, 4, 5, 7]
+    assert {record["id"] for record in records if "result" in record} == {f"item-{i}" for i in range(5)}
+    assert all(record["result"]["tailored_resume"] for record in records if "result" in record)
+    assert "Invalid JSON" in next(record["error"] for record in records if record["line"] == 7)
+    assert json.loads((tmp_path / "out.jsonl.checkpoint").read_text())["watermark"] == 8
+
+
+def test_rerun_skips_completed_items(fake_llm, tmp_path):
+    """Test a finished run re-run does no work and bills nothing"""
+    source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    _write_input(source, 3)
+    asyncio.run(tailor_batch(str(source), str(output)))
+    calls = len(fake_llm)
+    
+    stats = asyncio.run(tailor_batch(str(source), str(output), use_cache=False))
+    
+    assert stats["skipped"] == 3 and stats["succeeded"] == 0
+    assert len(fake_llm) == calls
+    assert len(_records(output)) == 3
+
+
+def test_killed_run_resumes_from_output_tail(fake_llm, tmp_path, monkeypatch):
+    """Test records written after the last checkpoint are recovered and a torn record is redone"""
+    source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    _write_input(source, 5)
+    
+    # Simulate a run killed after line 1 was checkpointed, lines 3 and 4
+    # were written, and line 2 was half written
+    first = json.dumps({"line": 1, "id": "item-0", "result": {"tailored_resume": "x"}}) + "\n"
+    output.write_text(first)
+    checkpoint = Checkpoint(str(output) + ".checkpoint", str(source))
+    checkpoint.mark_done(1)
+    checkpoint.save(len(first))
+    with output.open("a") as f:
+        for line in (3, 4):
+            f.write(json.dumps({"line": line, "id": f"item-{line - 1}", "result": {"tailored_resume": "x"}}) + "\n")
+        f.write('{"line": 2, "id": "item-1", "res')
+    
+    ran = []
+    
+    async def fake_pipeline(resume_text, job_description, **kwargs):
+        ran.append(resume_text.rsplit(" ", 1)[-1])
+        return {"tailored_resume": "tailored"}
+    
+    monkeypatch.setattr("app.graph.pipeline.run_resume_tailor_pipeline", fake_pipeline)
+    
+    stats = asyncio.run(tailor_batch(str(source), str(output)))
+    
+    assert sorted(ran) == ["1", "4"]
+    assert stats == {"succeeded": 2, "failed": 0, "skipped": 3, "recovered": 2}
+    assert sorted(record["line"] for record in _records(output)) == [1, 2, 3, 4, 5]
+
+
+def test_cli_requires_api_key(tmp_path, monkeypatch):
+    """Test the command refuses to start without GROQ_API_KEY"""
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    monkeypatch.setattr(cli, "load_dotenv", lambda: None)
+    
+    assert cli.main(["tailor-batch", str(tmp_path / "in.jsonl"), str(tmp_path / "out.jsonl")]) == 2
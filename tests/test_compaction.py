@@ -0,0 +1,133 @@
+"""
+Tests for prompt input compaction
+"""
+
+import asyncio
+
+from app.graph.compaction import cap_tokens, compact_job_description, compact_resume
+from app.graph.nodes import collect_required_skills, compact_inputs_node
+from app.graph.pipeline import run_resume_tailor_pipeline
+from app.utils.text import estimate_tokens
+
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+
+REQUIREMENTS:
+- Python   experience
+- python experience
+- Docker
+
+About Us
+We are a fast-growing company with a great culture.
+
+Benefits:
+Health Insurance
+Unlimited PTO
+
+Responsibilities
+- Build APIs
+
+We are an equal opportunity employer. Applicants are considered without regard to race or religion."""
+
+
+def test_compact_job_description_strips_boilerplate_and_duplicates():
+    """Test boilerplate sections, EEO paragraphs and repeated lines are removed"""
+    compacted = compact_job_description(JOB_DESCRIPTION)
+    
+    assert compacted == (
+        "Senior Backend Engineer\n\nREQUIREMENTS:\n- Python experience\n- Docker\n\n"
+        "Responsibilities\n- Build APIs"
+    )
+
+
+def test_compact_resume_keeps_repeated_lines():
+    """Test resume compaction only touches whitespace"""
+    resume = "Jane  Roe\n\n\n\nAcme\n- Python\nBeta\n- Python"
+    assert compact_resume(resume) == "Jane Roe\n\nAcme\n- Python\nBeta\n- Python"
+
+
+def test_cap_tokens_cuts_at_line_boundary():
+    """Test the token cap keeps whole lines within budget"""
+    text = "\n".join(f"line number {i}" for i in range(100))
+    capped = cap_tokens(text, 50)
+    
+    assert estimate_tokens(capped) <= 50
+    assert capped.endswith(capped.splitlines()[-1])
+    assert text.startswith(capped)
+
+
+def test_job_title_is_not_taken_for_a_boilerplate_heading():
+    """Test a title containing a boilerplate word keeps the whole job description"""
+    text = (
+        "Benefits Specialist\n"
+        "We need an HR professional with 5 years of Workday and benefits administration experience."
+    )
+    
+    assert compact_job_description(text, 1500) == text
+
+
+def test_trailing_boilerplate_block_is_kept():
+    """Test a boilerplate heading with no content heading after it drops nothing"""
+    text = "Data Engineer\n\nRequirements:\n- SQL\n\nBenefits:\nRemote work"
+    
+    assert compact_job_description(text) == text
+
+
+def test_single_paragraph_posting_only_loses_boilerplate_sentences():
+    """Test an EEO sentence in a posting without blank lines drops only that sentence"""
+    text = (
+        "Senior Python Developer\nRequirements:\n- 5+ years Python, FastAPI and Docker\n"
+        "We ship weekly. Acme is an equal opportunity employer. Remote friendly."
+    )
+    
+    compacted = compact_job_description(text, 1500)
+    
+    assert "equal opportunity" not in compacted
+    assert compacted == (
+        "Senior Python Developer\nRequirements:\n- 5+ years Python, FastAPI and Docker\n"
+        "We ship weekly. Remote friendly."
+    )
+
+
+def test_stripping_nearly_everything_keeps_the_original():
+    """Test a posting that is mostly boilerplate-sounding text is not emptied"""
+    text = "We are an equal opportunity employer seeking a Python developer with Docker skills."
+    
+    assert compact_job_description(text) == text
+
+
+def test_compact_inputs_node_keeps_the_whole_resume(monkeypatch):
+    """Test the capped resume only feeds prompts and the original stays in state"""
+    monkeypatch.setenv("RESUME_TOKEN_BUDGET", "500")
+    resume = "Jane Roe\n\nEXPERIENCE\n" + "\n".join(f"- Shipped feature {i}" for i in range(400))
+    resume += "\n\nEDUCATION\nBSc Computer Science"
+    state = {"resume_text": resume, "job_description": JOB_DESCRIPTION}
+    
+    result = compact_inputs_node(state)
+    
+    assert result["resume_text"] == resume
+    assert "EDUCATION" not in result["prompt_resume_text"]
+    assert result["tokens_saved"] > 0
+    assert "equal opportunity" not in result["job_description"]
+
+
+def test_tailored_resume_keeps_sections_past_the_token_budget(fake_llm, monkeypatch):
+    """Test sections cut from the prompts still appear in the tailored resume"""
+    monkeypatch.setenv("RESUME_TOKEN_BUDGET", "500")
+    resume = "Jane Roe\n\nEXPERIENCE\n" + "\n".join(f"- Shipped feature {i}" for i in range(400))
+    resume += "\n\nEDUCATION\nBSc Computer Science"
+    
+    result = asyncio.run(run_resume_tailor_pipeline(resume, JOB_DESCRIPTION, variant="sectioned"))
+    
+    assert "BSc Computer Science" in result["tailored_resume"]
+    assert "- Shipped feature 399" in result["tailored_resume"]
+
+
+def test_collect_required_skills_dedupes():
+    """Test repeated skills across categories are reported once"""
+    skills = collect_required_skills({
+        "technical_skills": ["Python", "Docker"],
+        "soft_skills": ["Communication", "python"],
+        "qualifications": ["Docker "]
+    })
+    assert skills == ["Python", "Docker", "Communication"]
@@ -0,0 +1,158 @@
+"""
+Tests for request/node deadlines and hedged LLM calls
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.graph import nodes
+from app.llm import client as llm_client
+from app.llm import hedging
+from app.llm.rate_limiter import RateLimiter
+from app.main import app
+from app.utils.deadline import DeadlineExceeded, deadline, remaining, within_deadline
+from app.utils.metrics import LLM_HEDGES, LLM_REQUEST_DURATION
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def hedger(monkeypatch):
+    """A hedger that hedges after 50 ms and may hedge every call"""
+    monkeypatch.setenv("HEDGE_MIN_SAMPLES", "5")
+    monkeypatch.setenv("HEDGE_MIN_DELAY", "0.05")
+    monkeypatch.setenv("HEDGE_MAX_FRACTION", "1.0")
+    monkeypatch.setattr(hedging, "get_rate_limiter", lambda: RateLimiter())
+    hedger = hedging.Hedger()
+    for _ in range(5):
+        hedger.latencies.record("test_node", 0.01)
+    return hedger
+
+
+def test_nested_deadline_only_shortens():
+    with deadline(10):
+        outer = remaining()
+        with deadline(60):
+            assert remaining() <= outer
+        with deadline(0.5):
+            assert remaining() <= 0.5
+    assert remaining() is None
+
+
+def test_within_deadline_cancels_slow_work():
+    cancelled = []
+    
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+    
+    async def run():
+        with deadline(0.05):
+            await within_deadline(slow())
+    
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(run())
+    assert cancelled == [True]
+
+
+def test_slow_call_is_hedged_and_loser_cancelled(hedger):
+    attempts = []
+    cancelled = []
+    won = LLM_HEDGES.labels("test_node", "won").value
+    
+    async def call():
+        attempt = len(attempts)
+        attempts.append(attempt)
+        try:
+            await asyncio.sleep(5 if attempt == 0 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return f"attempt {attempt}"
+    
+    result = asyncio.run(hedger.call("test_node", call))
+    
+    assert result == "attempt 1"
+    assert cancelled == [0]
+    assert LLM_HEDGES.labels("test_node", "won").value == won + 1
+
+
+def test_hedge_is_skipped_without_rate_limiter_capacity(hedger, monkeypatch):
+    limiter = RateLimiter(requests_per_minute=1)
+    asyncio.run(limiter.acquire(1))
+    monkeypatch.setattr(hedging, "get_rate_limiter", lambda: limiter)
+    attempts = []
+    
+    async def call():
+        attempts.append(True)
+        await asyncio.sleep(0.1)
+        return "only attempt"
+    
+    assert asyncio.run(hedger.call("test_node", call)) == "only attempt"
+    assert len(attempts) == 1
+
+
+def test_failed_and_cancelled_calls_record_capped_latency(hedger, monkeypatch):
+    monkeypatch.setenv("NODE_DEADLINE_TEST_NODE", "0.05")
+    monkeypatch.setenv("LLM_HEDGING", "false")
+    
+    async def failing():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("upstream error")
+    
+    async def cancelled():
+        await asyncio.wait_for(hedger.call("test_node", lambda: asyncio.sleep(5)), 0.2)
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedger.call("test_node", failing))
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(cancelled())
+    
+    samples = list(hedger.latencies._samples["test_node"])[5:]
+    assert len(samples) == 2
+    assert 0.02 <= samples[0] < 0.05
+    assert samples[1] == 0.05
+
+
+def test_groq_call_is_bounded_by_deadline(monkeypatch):
+    monkeypatch.setenv("MODEL_NAME", "test-model")
+    
+    async def hanging_create(**kwargs):
+        await asyncio.sleep(60)
+    
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=hanging_create)))
+    monkeypatch.setattr(llm_client, "get_groq_client", lambda: fake_client)
+    before = sum(LLM_REQUEST_DURATION.labels("test-model", "deadline").counts)
+    
+    async def run():
+        with deadline(0.05):
+            await llm_client.call_groq_api("prompt", max_tokens=10)
+    
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(run())
+    assert sum(LLM_REQUEST_DURATION.labels("test-model", "deadline").counts) == before + 1
+
+
+def test_request_past_deadline_returns_504(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setenv("REQUEST_DEADLINE_SECONDS", "0.1")
+    monkeypatch.setattr(hedging, "_hedger", None)
+    
+    async def stalled_call(prompt, **kwargs):
+        await asyncio.sleep(5)
+    
+    monkeypatch.setattr(nodes, "call_groq_api", stalled_call)
+    
+    response = client.post("/tailor", json={
+        "resume_text": SAMPLE_RESUME,
+        "job_description": SAMPLE_JOB_DESCRIPTION
+    })
+    
+    assert response.status_code == 504
@@ -0,0 +1,252 @@
+"""
+Tests for resume uploads: multipart parsing, text extraction and POST /tailor/upload
+"""
+
+import asyncio
+import hashlib
+import io
+import tempfile
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.ingest import upload as ingest
+from app.ingest.extract import (
+    DocumentExtractionError,
+    UnsupportedDocumentError,
+    extract_text
+)
+from app.main import app
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+client = TestClient(app)
+
+BOUNDARY = "----resume-tailor-test"
+
+
+def make_docx(paragraphs):
+    """Minimal DOCX containing the given paragraphs"""
+    body = "".join(
+        f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def multipart_body(fields, files):
+    """Encode form fields and (name, filename, content_type, data) files"""
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+            + value.encode() + b"\r\n"
+        )
+    for name, filename, content_type, data in files:
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode()
+            + data + b"\r\n"
+        )
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+def post_upload(body):
+    return client.post(
+        "/tailor/upload",
+        content=body,
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+    )
+
+
+@pytest.fixture(autouse=True)
+def inline_extraction(monkeypatch):
+    """Extract in a thread rather than spawning worker processes"""
+    monkeypatch.setenv("INGEST_WORKERS", "0")
+    ingest.close_ingest()
+    yield
+    ingest.close_ingest()
+
+
+def test_extracts_docx_paragraphs():
+    data = make_docx(["John Doe", "Software Engineer"])
+    assert extract_text(data, "resume.docx") == "John Doe\nSoftware Engineer"
+
+
+def test_extracts_plain_text_with_bom():
+    assert extract_text("﻿John Doe".encode("utf-8"), "resume.txt") == "John Doe"
+
+
+def test_rejects_unsupported_and_mislabelled_files():
+    with pytest.raises(UnsupportedDocumentError):
+        extract_text(b"\x89PNG\r\n\x1a\n\x00\x00", "photo.png", "image/png")
+    with pytest.raises(DocumentExtractionError):
+        extract_text(b"not really a pdf", "resume.pdf")
+
+
+def test_multipart_reader_handles_tiny_chunks():
+    body = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "resume.txt", "text/plain", SAMPLE_RESUME.encode())]
+    )
+    
+    async def chunks():
+        for i in range(0, len(body), 7):
+            yield body[i:i + 7]
+    
+    async def run():
+        return await ingest.read_multipart(chunks(), BOUNDARY.encode(), max_file_bytes=1024)
+    
+    form = asyncio.run(run())
+    try:
+        assert form.fields == {"job_description": SAMPLE_JOB_DESCRIPTION}
+        assert form.files["resume"].read() == SAMPLE_RESUME.encode()
+        assert form.files["resume"].filename == "resume.txt"
+    finally:
+        form.close()
+
+
+def test_docx_that_inflates_past_the_cap_is_rejected(monkeypatch):
+    monkeypatch.setattr("app.ingest.extract.MAX_DOCX_XML_BYTES", 1024)
+    with pytest.raises(DocumentExtractionError, match="expands to"):
+        extract_text(make_docx(["x" * 2048]), "resume.docx")
+
+
+def test_multipart_reader_caps_body_parts_and_duplicates(monkeypatch):
+    resume = ("resume", "resume.txt", "text/plain", SAMPLE_RESUME.encode())
+    
+    def read(body, **limits):
+        async def chunks():
+            # No Content-Length: the body arrives in chunks of unknown total size
+            for i in range(0, len(body), 64):
+                yield body[i:i + 64]
+        return asyncio.run(ingest.read_multipart(chunks(), BOUNDARY.encode(), max_file_bytes=1024, **limits))
+    
+    with pytest.raises(ingest.UploadTooLargeError):
+        read(multipart_body({"a": "x" * 600, "b": "y" * 600}, [resume]), max_total_bytes=1024)
+    with pytest.raises(ingest.MultipartError, match="more than 2 parts"):
+        read(multipart_body({"a": "1", "b": "2"}, [resume]), max_parts=2)
+    
+    # The first copy's temporary file is released
+    closed = []
+    real_close = ingest.UploadedFile.close
+    monkeypatch.setattr(ingest.UploadedFile, "close", lambda self: closed.append(self) or real_close(self))
+    with pytest.raises(ingest.MultipartError, match="Duplicate file field"):
+        read(multipart_body({}, [resume, resume]))
+    assert len(closed) == 1 and closed[0].file.closed
+
+
+def make_upload(data, filename="resume.txt"):
+    """UploadedFile holding `data`, as read_multipart would spool it"""
+    sink = tempfile.SpooledTemporaryFile()
+    sink.write(data)
+    return ingest.UploadedFile(filename, "text/plain", sink, len(data), hashlib.sha256(data).hexdigest())
+
+
+def test_joined_extraction_survives_the_first_caller_closing_its_file():
+    data = SAMPLE_RESUME.encode()
+    
+    async def run():
+        first, second = make_upload(data), make_upload(data)
+        leader = asyncio.create_task(ingest.extract_upload_text(first))
+        follower = asyncio.create_task(ingest.extract_upload_text(second))
+        await asyncio.sleep(0)
+        # The leader's request is cancelled and its form closed mid-flight
+        leader.cancel()
+        first.close()
+        try:
+            return await follower
+        finally:
+            second.close()
+    
+    assert "John Doe" in asyncio.run(run())
+
+
+def test_text_cache_is_keyed_by_document_type(fake_llm, monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    body = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "resume.txt", "text/plain", SAMPLE_RESUME.encode())]
+    )
+    mislabelled = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "resume.pdf", "application/pdf", SAMPLE_RESUME.encode())]
+    )
+    
+    assert post_upload(body).status_code == 200
+    assert post_upload(mislabelled).status_code == 422
+
+
+def test_duplicate_resume_part_is_a_bad_request():
+    body = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "a.txt", "text/plain", b"first"), ("resume", "b.txt", "text/plain", b"second")]
+    )
+    assert post_upload(body).status_code == 400
+
+
+def test_upload_is_tailored(fake_llm, monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    body = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "resume.docx", "application/octet-stream", make_docx(SAMPLE_RESUME.split("\n")))]
+    )
+    
+    response = post_upload(body)
+    
+    assert response.status_code == 200
+    assert "Python" in response.json()["matched_skills"]
+    assert any("John Doe" in prompt for prompt in fake_llm)
+
+
+def test_repeat_upload_hits_text_cache(fake_llm, monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    calls = []
+    original = ingest.extract_text
+    
+    def counting_extract(*args):
+        calls.append(args)
+        return original(*args)
+    
+    monkeypatch.setattr(ingest, "extract_text", counting_extract)
+    body = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "resume.txt", "text/plain", SAMPLE_RESUME.encode())]
+    )
+    
+    assert post_upload(body).status_code == 200
+    assert post_upload(body).status_code == 200
+    assert len(calls) == 1
+
+
+def test_oversized_upload_is_rejected(monkeypatch):
+    monkeypatch.setenv("UPLOAD_MAX_BYTES", "100")
+    body = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "resume.txt", "text/plain", b"x" * 500)]
+    )
+    assert post_upload(body).status_code == 413
+
+
+def test_upload_errors_map_to_status_codes():
+    unsupported = multipart_body(
+        {"job_description": SAMPLE_JOB_DESCRIPTION},
+        [("resume", "photo.png", "image/png", b"\x89PNG\r\n\x1a\n\x00\x00")]
+    )
+    assert post_upload(unsupported).status_code == 415
+    
+    missing_file = multipart_body({"job_description": SAMPLE_JOB_DESCRIPTION}, [])
+    assert post_upload(missing_file).status_code == 422
+    
+    no_jd = multipart_body({}, [("resume", "resume.txt", "text/plain", SAMPLE_RESUME.encode())])
+    assert post_upload(no_jd).status_code == 422
+    
+    not_multipart = client.post("/tailor/upload", json={"resume_text": SAMPLE_RESUME})
+    assert not_multipart.status_code == 400
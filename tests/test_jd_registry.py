@@ -0,0 +1,70 @@
+"""
+Tests for the job-description registry
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.graph.pipeline import run_resume_tailor_pipeline
+from app.storage.jd_registry import JobDescriptionRegistry, compute_jd_id
+from tests.conftest import SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION
+
+client = TestClient(app)
+
+
+def test_jd_id_ignores_whitespace_and_case():
+    """Test trivially different copies of a posting share an id"""
+    assert compute_jd_id("Senior  Python\nDeveloper") == compute_jd_id("senior python developer")
+    assert compute_jd_id("Python developer") != compute_jd_id("Java developer")
+
+
+def test_registry_persists_across_instances(tmp_path):
+    """Test entries survive in SQLite when the memory tier is cold"""
+    db_path = str(tmp_path / "registry.db")
+    keywords = {"technical_skills": ["Python"], "soft_skills": [], "qualifications": [], "keywords": []}
+    
+    first = JobDescriptionRegistry(db_path)
+    entry = asyncio.run(first.put(SAMPLE_JOB_DESCRIPTION, keywords, ["Python"]))
+    first.close()
+    
+    second = JobDescriptionRegistry(db_path)
+    found = asyncio.run(second.find_by_text(SAMPLE_JOB_DESCRIPTION.upper()))
+    second.close()
+    
+    assert found["jd_id"] == entry["jd_id"]
+    assert found["all_required_skills"] == ["Python"]
+
+
+def test_repeated_job_description_skips_extraction(fake_llm):
+    """Test the second run against the same posting reuses the stored analysis"""
+    asyncio.run(run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION))
+    asyncio.run(run_resume_tailor_pipeline(SAMPLE_RESUME + "\nDocker", SAMPLE_JOB_DESCRIPTION))
+    
+    extraction_calls = [p for p in fake_llm if "Analyze the following job description" in p]
+    assert len(extraction_calls) == 1
+
+
+def test_tailor_with_jd_id(fake_llm, monkeypatch):
+    """Test /tailor accepts a jd_id from /jobs-descriptions"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    stored = client.post("/jobs-descriptions", json={"job_description": SAMPLE_JOB_DESCRIPTION})
+    assert stored.status_code == 200
+    jd_id = stored.json()["jd_id"]
+    assert stored.json()["all_required_skills"] == ["Python", "FastAPI", "Docker", "Communication"]
+    
+    response = client.post("/tailor", json={"resume_text": SAMPLE_RESUME, "jd_id": jd_id})
+    assert response.status_code == 200
+    assert response.json()["matched_skills"] == ["Python", "FastAPI"]
+    extraction_calls = [p for p in fake_llm if "Analyze the following job description" in p]
+    assert len(extraction_calls) == 1
+
+
+def test_tailor_with_unknown_jd_id(monkeypatch):
+    """Test an unknown jd_id is reported as not found"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    response = client.post("/tailor", json={"resume_text": SAMPLE_RESUME, "jd_id": "missing"})
+    assert response.status_code == 404
@@ -0,0 +1,199 @@
+"""
+Tests for the asynchronous job queue, workers and /jobs endpoints
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.graph import nodes
+from app.jobs import callbacks, worker
+from app.jobs.queue import JobQueue, get_job_queue, get_worker_count, get_worker_rate_share
+from app.jobs.worker import process_next_job
+from app.llm.rate_limiter import get_rate_limiter, set_rate_budget_share
+from app.main import app
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+client = TestClient(app)
+
+PAYLOAD = {"resume_text": SAMPLE_RESUME, "job_description": SAMPLE_JOB_DESCRIPTION}
+
+
+def mock_callbacks(monkeypatch, handler, addresses=("93.184.215.14",)):
+    """Route callback POSTs to `handler` and resolve every host to `addresses`"""
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        worker.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+    
+    async def resolve(host):
+        return list(addresses)
+    
+    monkeypatch.setattr(callbacks, "_host_addresses", resolve)
+
+
+def test_post_jobs_returns_immediately_and_worker_completes(fake_llm):
+    """Test a job is queued without running the pipeline and finished by a worker"""
+    response = client.post("/jobs", json=PAYLOAD)
+    
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert fake_llm == []
+    
+    assert asyncio.run(process_next_job(get_job_queue(), "worker-1")) is True
+    
+    finished = client.get(f"/jobs/{job['job_id']}").json()
+    assert finished["status"] == "succeeded"
+    assert finished["attempts"] == 1
+    assert finished["result"]["tailored_resume"]
+    assert asyncio.run(process_next_job(get_job_queue(), "worker-1")) is False
+
+
+def test_unknown_job_is_404():
+    """Test polling an unknown job id"""
+    assert client.get("/jobs/does-not-exist").status_code == 404
+
+
+def test_failed_attempts_are_retried_then_marked_failed(fake_llm, monkeypatch):
+    """Test a failing job is requeued until it runs out of attempts"""
+    monkeypatch.setenv("JOB_RETRY_DELAY_SECONDS", "0")
+    
+    async def broken_call(prompt, **kwargs):
+        raise RuntimeError("upstream error")
+    
+    monkeypatch.setattr(nodes, "call_groq_api", broken_call)
+    queue = get_job_queue()
+    job = queue.enqueue(PAYLOAD, max_attempts=2)
+    
+    asyncio.run(process_next_job(queue, "worker-1"))
+    assert queue.get(job["job_id"])["status"] == "queued"
+    
+    asyncio.run(process_next_job(queue, "worker-1"))
+    failed = queue.get(job["job_id"])
+    assert failed["status"] == "failed"
+    assert failed["attempts"] == 2
+    assert "upstream error" in failed["error"]
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(tmp_path):
+    """Test a job whose worker died becomes visible again after the timeout"""
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    job = queue.enqueue(PAYLOAD, max_attempts=2)
+    
+    assert queue.claim("crashed-worker", visibility_timeout=0.05)["job_id"] == job["job_id"]
+    assert queue.claim("worker-2", visibility_timeout=60) is None
+    
+    time.sleep(0.1)
+    reclaimed = queue.claim("worker-2", visibility_timeout=60)
+    assert reclaimed["job_id"] == job["job_id"]
+    assert reclaimed["attempts"] == 2
+    
+    # The crashed worker's late result is rejected: it no longer owns the lease
+    assert queue.complete(job["job_id"], "crashed-worker", {"tailored_resume": "late"}) is False
+    assert queue.complete(job["job_id"], "worker-2", {"tailored_resume": "ok"}) is True
+    
+    # Out of attempts: an expired lease fails the job instead of requeueing it
+    other = queue.enqueue(PAYLOAD, max_attempts=1)
+    queue.claim("crashed-worker", visibility_timeout=0.05)
+    time.sleep(0.1)
+    assert queue.claim("worker-2", visibility_timeout=60) is None
+    assert [job["job_id"] for job in queue.expire_leases()] == [other["job_id"]]
+    assert queue.get(other["job_id"])["status"] == "failed"
+    queue.close()
+
+
+def test_callback_receives_signed_job(fake_llm, monkeypatch):
+    """Test the finished job is POSTed to its callback URL with a signature"""
+    monkeypatch.setenv("JOB_CALLBACK_SECRET", "s3cret")
+    received = []
+    
+    def handler(request):
+        received.append(request)
+        return httpx.Response(204)
+    
+    mock_callbacks(monkeypatch, handler)
+    
+    response = client.post("/jobs", json={**PAYLOAD, "callback_url": "https://example.com/hook"})
+    job_id = response.json()["job_id"]
+    asyncio.run(process_next_job(get_job_queue(), "worker-1"))
+    
+    assert len(received) == 1
+    assert str(received[0].url) == "https://example.com/hook"
+    assert received[0].headers["X-Signature"].startswith("sha256=")
+    assert json.loads(received[0].content)["status"] == "succeeded"
+    assert get_job_queue().get(job_id)["callback_status"] == "delivered"
+
+
+def test_lease_expiry_failure_fires_callback(monkeypatch):
+    """Test a job failed by an expired lease still notifies its callback URL"""
+    received = []
+    
+    def handler(request):
+        received.append(json.loads(request.content))
+        return httpx.Response(204)
+    
+    mock_callbacks(monkeypatch, handler)
+    queue = get_job_queue()
+    job = queue.enqueue(PAYLOAD, callback_url="https://example.com/hook", max_attempts=1)
+    queue.claim("crashed-worker", visibility_timeout=0.05)
+    time.sleep(0.1)
+    
+    assert asyncio.run(process_next_job(queue, "worker-2")) is False
+    
+    assert [body["status"] for body in received] == ["failed"]
+    assert received[0]["error"] == "Visibility timeout expired"
+    assert queue.get(job["job_id"])["callback_status"] == "delivered"
+
+
+def test_private_callback_urls_are_refused(monkeypatch):
+    """Test loopback, private and unlisted callback URLs are rejected up front"""
+    for url in ("http://127.0.0.1:8000/hook", "http://localhost/hook", "http://169.254.169.254/latest", "http://[::1]/"):
+        response = client.post("/jobs", json={**PAYLOAD, "callback_url": url})
+        assert response.status_code == 422, url
+    
+    monkeypatch.setenv("JOB_CALLBACK_ALLOWED_PREFIXES", "https://hooks.example.com/")
+    assert client.post("/jobs", json={**PAYLOAD, "callback_url": "https://example.org/hook"}).status_code == 422
+    assert client.post("/jobs", json={**PAYLOAD, "callback_url": "https://hooks.example.com/a"}).status_code == 202
+
+
+def test_callback_to_host_resolving_privately_is_blocked(monkeypatch):
+    """Test a hostname resolving to an internal address is not called"""
+    received = []
+    mock_callbacks(monkeypatch, lambda request: received.append(request) or httpx.Response(204), ["10.0.0.5"])
+    job = {"job_id": "j1", "status": "succeeded", "attempts": 1, "result": None, "error": None,
+           "created_at": 0, "updated_at": 0, "callback_url": "https://internal.example.com/hook"}
+    
+    assert asyncio.run(worker.deliver_callback(job)).startswith("blocked:")
+    assert received == []
+    
+    # The operator's own JOB_CALLBACK_URL is trusted
+    monkeypatch.setenv("JOB_CALLBACK_URL", "https://internal.example.com/hook")
+    assert asyncio.run(worker.deliver_callback(job)) == "delivered"
+
+
+def test_workers_leave_a_rate_budget_share_to_the_api(monkeypatch):
+    """Test worker processes and the API process split GROQ_RPM / GROQ_TPM"""
+    monkeypatch.setenv("GROQ_RPM", "30")
+    monkeypatch.setenv("GROQ_TPM", "30000")
+    # No in-process workers by default: the API keeps the whole budget
+    monkeypatch.delenv("JOB_WORKERS", raising=False)
+    assert get_worker_count() == 0
+    assert get_worker_rate_share(get_worker_count()) == 0
+    assert get_worker_rate_share(2) == 2 / 3
+    assert get_worker_rate_share(0) == 0
+    
+    try:
+        set_rate_budget_share(get_worker_rate_share(2) / 2)
+        assert get_rate_limiter()._requests.capacity == 10
+        assert get_rate_limiter()._tokens.capacity == 10000
+        
+        monkeypatch.setenv("JOB_WORKER_RATE_SHARE", "0.5")
+        set_rate_budget_share(1.0 - get_worker_rate_share(2))
+        assert get_rate_limiter()._requests.capacity == 15
+    finally:
+        set_rate_budget_share(1.0)
@@ -0,0 +1,28 @@
+"""
+Tests for the shared Groq client lifecycle
+"""
+
+import asyncio
+
+import pytest
+
+from app.llm import client as llm_client
+
+
+def test_groq_client_is_shared(monkeypatch):
+    """Test every caller gets the same pooled client until it is closed"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    first = llm_client.get_groq_client()
+    assert llm_client.get_groq_client() is first
+    
+    asyncio.run(llm_client.close_groq_client())
+    assert llm_client._client is None
+
+
+def test_groq_client_requires_api_key(monkeypatch):
+    """Test client creation fails clearly without an API key"""
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    
+    with pytest.raises(ValueError):
+        llm_client.init_groq_client()
@@ -0,0 +1,62 @@
+"""
+Tests for the shared LLM JSON parser
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from app.graph.nodes import rewrite_section_node
+from app.llm.parsing import parse_llm_json, parse_llm_json_with_path
+
+
+CORPUS = json.loads(
+    (Path(__file__).parent / "fixtures" / "llm_responses.json").read_text(encoding="utf-8")
+)
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case["name"] for case in CORPUS])
+def test_parses_malformed_response_corpus(case):
+    """Test every recorded response shape parses to the intended object"""
+    assert parse_llm_json(case["response"]) == case["expected"]
+
+
+def test_reports_parse_path():
+    """Test clean JSON takes the fast path and broken JSON the repair path"""
+    assert parse_llm_json_with_path('{"a": 1}')[1] == "fast"
+    assert parse_llm_json_with_path('```json\n{"a": 1}\n```')[1] == "extracted"
+    assert parse_llm_json_with_path('{"a": [1,],}')[1] == "repaired"
+    assert parse_llm_json_with_path('{"a": "cut off mid')[1] == "truncated"
+
+
+@pytest.mark.parametrize("length", [10, 5000])
+def test_raw_control_characters_are_escaped_in_short_and_long_strings(length):
+    """Test every raw control character inside a string survives the repair"""
+    value = "x" * length + "\n\r\t\x01\x1f\b end"
+    response = '{"text": "' + value + '"}'
+    
+    assert parse_llm_json(response) == {"text": value}
+
+
+def test_rejects_non_objects_and_garbage():
+    """Test unparseable responses raise JSONDecodeError"""
+    with pytest.raises(json.JSONDecodeError):
+        parse_llm_json("I'm sorry, I can't help with that.")
+    with pytest.raises(json.JSONDecodeError):
+        parse_llm_json('["not", "an", "object"]')
+
+
+def test_truncated_section_rewrite_is_not_accepted(monkeypatch):
+    """Test a rewrite cut off by max_tokens keeps the section as written"""
+    async def _truncated(prompt, temperature=0.3, max_tokens=2000, **kwargs):
+        return '{"rewritten_section": "Acme Corp\\n- Led the migration of'
+    
+    monkeypatch.setattr("app.graph.nodes.call_groq_api", _truncated)
+    section = {"index": 1, "kind": "experience", "text": "Acme Corp\n- Led the migration to AWS"}
+    task = {"section": section, "job_description": "AWS engineer", "matched_skills": [], "missing_skills": [], "keywords": []}
+    
+    result = asyncio.run(rewrite_section_node(task))
+    
+    assert result["section_rewrites"][0]["text"] == section["text"]
@@ -0,0 +1,113 @@
+"""
+Tests for structured, queued logging
+"""
+
+import io
+import json
+import logging
+import queue
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils import logger as logger_module
+from app.utils.logger import (
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    bind_request_id,
+    preview,
+    setup_logger,
+    shutdown_logging,
+)
+from app.utils.tracing import start_span
+
+client = TestClient(app)
+
+
+def test_json_records_are_written_by_the_listener(monkeypatch):
+    """Test queued JSON records carry request, trace and extra fields"""
+    stream = io.StringIO()
+    monkeypatch.setattr(logger_module.sys, "stdout", stream)
+    # Restored after the test: caller_info=False switches stack inspection off globally
+    monkeypatch.setattr(logging, "_srcfile", logging._srcfile)
+    test_logger = setup_logger("test_json_queue", log_format="json", use_queue=True, caller_info=False)
+    
+    with bind_request_id("req-123"), start_span("op") as span:
+        test_logger.info("hello %s", "world", extra={"node": "match_skills"})
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        test_logger.error("failed", exc_info=True)
+    shutdown_logging("test_json_queue")
+    
+    first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert first["message"] == "hello world"
+    assert first["level"] == "INFO"
+    assert first["request_id"] == "req-123"
+    assert first["trace_id"] == span.trace_id
+    assert first["node"] == "match_skills"
+    assert "func" not in first
+    assert "request_id" not in second
+    assert "ValueError: bad" in second["exc_info"]
+
+
+def test_full_queue_drops_instead_of_blocking():
+    """Test a saturated queue discards records and counts them"""
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    record = logging.makeLogRecord({"msg": "x"})
+    
+    handler.emit(record)
+    handler.emit(record)
+    
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_sampling_keeps_whole_requests_and_all_warnings():
+    """Test info sampling is consistent per request id and never drops warnings"""
+    sampler = SamplingFilter(0.5)
+    
+    def info(request_id):
+        return logging.makeLogRecord({"levelno": logging.INFO, "request_id": request_id})
+    
+    decisions = {request_id: sampler.filter(info(request_id)) for request_id in map(str, range(200))}
+    assert all(sampler.filter(info(request_id)) == kept for request_id, kept in decisions.items())
+    assert 50 < sum(decisions.values()) < 150
+    assert sampler.filter(logging.makeLogRecord({"levelno": logging.WARNING, "request_id": "0"}))
+
+
+def test_preview_caps_long_responses():
+    """Test previews keep the head and report what was cut"""
+    assert preview("short") == "short"
+    assert preview("x" * 250, limit=200) == "x" * 200 + "... (+50 chars)"
+    assert preview(None) == ""
+
+
+def test_request_id_header_is_reused_or_generated():
+    """Test responses echo the caller's X-Request-ID or a generated one"""
+    assert client.get("/health", headers={"X-Request-ID": "abc-1"}).headers["x-request-id"] == "abc-1"
+    generated = client.get("/health").headers["x-request-id"]
+    assert len(generated) == 32
+
+
+def test_empty_flags_fall_back_to_their_defaults(monkeypatch):
+    """Test an empty LOG_CALLER_INFO (as in .env.example) keeps the format's default"""
+    monkeypatch.setenv("LOG_CALLER_INFO", "")
+    assert logger_module._env_flag("LOG_CALLER_INFO", True) is True
+    assert logger_module._env_flag("LOG_CALLER_INFO", False) is False
+    
+    monkeypatch.setenv("LOG_CALLER_INFO", "false")
+    assert logger_module._env_flag("LOG_CALLER_INFO", True) is False
+
+
+def test_empty_log_format_and_level_use_the_defaults(monkeypatch):
+    """Test empty LOG_FORMAT and LOG_LEVEL configure a text logger at INFO"""
+    monkeypatch.setenv("LOG_FORMAT", "")
+    monkeypatch.setenv("LOG_LEVEL", "")
+    monkeypatch.setenv("LOG_QUEUE", "false")
+    
+    configured = logger_module.setup_logger_from_env("test_empty_log_env")
+    
+    assert configured.level == logging.INFO
+    formatter = configured.handlers[0].formatter
+    assert not isinstance(formatter, logger_module.JsonFormatter)
@@ -0,0 +1,142 @@
+"""
+Tests for the Prometheus metrics registry and the /metrics endpoint
+"""
+
+import asyncio
+import inspect
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.llm import client as llm_client
+from app.llm.parsing import parse_llm_json
+from app.main import app
+from app.utils.metrics import (
+    JSON_PARSE,
+    LLM_TOKENS,
+    NODE_DURATION,
+    Counter,
+    Histogram,
+    observe_node,
+    render_metrics,
+)
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+client = TestClient(app)
+
+
+def sample_value(text: str, line_prefix: str) -> float:
+    """Value of the first exposition line starting with `line_prefix`"""
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"No sample {line_prefix}")
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test bucket counts are cumulative and end with +Inf, _sum and _count"""
+    latency = Histogram("test_latency_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.labels("/a").observe(value)
+    
+    lines = latency.render()
+    
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'test_latency_seconds_sum{route="/a"} 4.05' in lines
+    assert 'test_latency_seconds_count{route="/a"} 4' in lines
+
+
+def test_labels_are_validated_and_escaped():
+    """Test label arity is enforced and values are escaped"""
+    requests = Counter("test_requests_total", "Test requests", ("path",))
+    requests.labels('say "hi"\n').inc(2)
+    
+    assert 'test_requests_total{path="say \\"hi\\"\\n"} 2' in requests.render()
+    with pytest.raises(ValueError):
+        requests.labels("a", "b")
+
+
+def test_observe_node_keeps_config_parameter():
+    """Test the node decorator records latency and preserves the signature LangGraph inspects"""
+    @observe_node("test_node")
+    async def node(state, config=None):
+        return {"configured": config is not None}
+    
+    assert asyncio.run(node({}, config={"configurable": {}})) == {"configured": True}
+    assert "config" in inspect.signature(node).parameters
+    assert sum(NODE_DURATION.labels("test_node").counts) == 1
+
+
+def test_json_parse_paths_are_counted():
+    """Test each parse path, including failures, increments its counter"""
+    fast = JSON_PARSE.labels("fast").value
+    repaired = JSON_PARSE.labels("repaired").value
+    failed = JSON_PARSE.labels("failed").value
+    
+    parse_llm_json('{"a": 1}')
+    parse_llm_json('{"a": "line\nbreak"}')
+    with pytest.raises(json.JSONDecodeError):
+        parse_llm_json("[1, 2]")
+    
+    assert JSON_PARSE.labels("fast").value == fast + 1
+    assert JSON_PARSE.labels("repaired").value == repaired + 1
+    assert JSON_PARSE.labels("failed").value == failed + 1
+
+
+def test_groq_usage_is_recorded(monkeypatch):
+    """Test prompt and completion tokens from chat_completion.usage are counted"""
+    monkeypatch.setenv("MODEL_NAME", "test-model")
+    
+    async def fake_create(**kwargs):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))],
+            usage=SimpleNamespace(prompt_tokens=120, completion_tokens=30, total_tokens=150),
+        )
+    
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create)))
+    monkeypatch.setattr(llm_client, "get_groq_client", lambda: fake_client)
+    prompt_before = LLM_TOKENS.labels("test-model", "prompt").value
+    completion_before = LLM_TOKENS.labels("test-model", "completion").value
+    
+    asyncio.run(llm_client.call_groq_api("prompt", max_tokens=100))
+    
+    assert LLM_TOKENS.labels("test-model", "prompt").value == prompt_before + 120
+    assert LLM_TOKENS.labels("test-model", "completion").value == completion_before + 30
+    assert 'llm_request_duration_seconds_count{model="test-model",outcome="ok"}' in render_metrics()
+
+
+def test_metrics_endpoint_reports_routes_nodes_and_cache(fake_llm, monkeypatch):
+    """Test /metrics exposes per-route, per-node and cache metrics after a request"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    payload = {"resume_text": SAMPLE_RESUME, "job_description": SAMPLE_JOB_DESCRIPTION}
+    before = client.get("/metrics").text
+    
+    assert client.post("/tailor", json=payload).status_code == 200
+    assert client.post("/tailor", json=payload).status_code == 200
+    assert client.get("/jobs/unknown-id").status_code == 404
+    
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    
+    def delta(prefix):
+        try:
+            previous = sample_value(before, prefix)
+        except AssertionError:
+            previous = 0.0
+        return sample_value(text, prefix) - previous
+    
+    assert delta('http_requests_total{method="POST",route="/tailor",status="200"}') == 2
+    # Routes are labelled by template, not by the raw path
+    assert delta('http_requests_total{method="GET",route="/jobs/{job_id}",status="404"}') == 1
+    assert delta('pipeline_node_duration_seconds_count{node="extract_keywords"}') == 1
+    assert delta('pipeline_node_duration_seconds_count{node="match_skills"}') == 1
+    assert delta('cache_lookups_total{cache="result",result="hit"}') == 1
+    assert 'cache_hit_ratio{cache="result"}' in text
+    assert "http_requests_in_flight" in text
+    assert 'route="/metrics"' not in text
@@ -0,0 +1,75 @@
+"""
+Tests for per-node model routing and the fast/large model cascade
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.graph import nodes
+from app.llm.routing import get_node_model, routing_fingerprint, validate_output
+from app.utils.metrics import MODEL_ROUTING
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, fake_llm_response
+
+
+@pytest.fixture
+def routed_llm(monkeypatch):
+    """Fake Groq call whose fast model returns a malformed keyword analysis"""
+    monkeypatch.setenv("MODEL_NAME", "large-model")
+    monkeypatch.setenv("MODEL_EXTRACT_KEYWORDS", "fast-model")
+    calls = []
+    
+    async def _fake_call_groq_api(prompt, temperature=0.3, max_tokens=2000, json_mode=False, model=None):
+        calls.append(model)
+        if model == "fast-model":
+            return json.dumps({"technical_skills": "Python, FastAPI"})
+        return fake_llm_response(prompt)
+    
+    monkeypatch.setattr(nodes, "call_groq_api", _fake_call_groq_api)
+    return calls
+
+
+def test_node_model_falls_back_to_model_name(monkeypatch):
+    monkeypatch.setenv("MODEL_NAME", "large-model")
+    monkeypatch.setenv("MODEL_MATCH_SKILLS", "fast-model")
+    
+    assert get_node_model("match_skills") == "fast-model"
+    assert get_node_model("rewrite_resume") == "large-model"
+
+
+def test_fingerprint_is_model_name_without_routes(monkeypatch):
+    monkeypatch.setenv("MODEL_NAME", "large-model")
+    assert routing_fingerprint() == "large-model"
+    
+    monkeypatch.setenv("MODEL_EXTRACT_KEYWORDS", "fast-model")
+    assert "extract_keywords=fast-model" in routing_fingerprint()
+
+
+def test_validate_output_reports_schema_problems():
+    assert validate_output("match_skills", {"matched_skills": ["Python"], "missing_skills": []}) is None
+    assert "matched_skills" in validate_output("match_skills", {"matched": ["Python"]})
+    assert validate_output("unknown_node", {}) is None
+
+
+def test_cascade_escalates_invalid_output(routed_llm, monkeypatch):
+    monkeypatch.setenv("MODEL_CASCADE", "true")
+    escalated = MODEL_ROUTING.labels("extract_keywords", "fast-model", "escalated").value
+    accepted = MODEL_ROUTING.labels("extract_keywords", "large-model", "accepted").value
+    
+    result = asyncio.run(nodes.analyze_job_description(SAMPLE_JOB_DESCRIPTION))
+    
+    assert routed_llm == ["fast-model", "large-model"]
+    assert result["technical_skills"] == ["Python", "FastAPI", "Docker"]
+    assert MODEL_ROUTING.labels("extract_keywords", "fast-model", "escalated").value == escalated + 1
+    assert MODEL_ROUTING.labels("extract_keywords", "large-model", "accepted").value == accepted + 1
+
+
+def test_without_cascade_fast_output_is_kept(routed_llm):
+    invalid = MODEL_ROUTING.labels("extract_keywords", "fast-model", "invalid").value
+    
+    result = asyncio.run(nodes.analyze_job_description(SAMPLE_JOB_DESCRIPTION))
+    
+    assert routed_llm == ["fast-model"]
+    assert result == {"technical_skills": "Python, FastAPI"}
+    assert MODEL_ROUTING.labels("extract_keywords", "fast-model", "invalid").value == invalid + 1
@@ -0,0 +1,97 @@
+"""
+Tests for the LangGraph resume tailoring pipeline
+"""
+
+import asyncio
+
+import pytest
+
+from app.graph import pipeline
+from app.graph.pipeline import (
+    create_resume_tailor_graph,
+    get_compiled_graph,
+    register_graph_variant,
+    run_resume_tailor_pipeline,
+    warmup_graphs
+)
+from tests.conftest import SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION
+
+
+def test_pipeline_runs_all_nodes(fake_llm):
+    """Test the standard pipeline runs the three nodes and returns the merged result"""
+    result = asyncio.run(
+        run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, variant="standard")
+    )
+    
+    assert len(fake_llm) == 3
+    assert result["tailored_resume"].startswith("John Doe")
+    assert result["matched_skills"] == ["Python", "FastAPI"]
+    assert result["missing_skills"] == ["Docker", "Communication"]
+
+
+def test_pipeline_runs_concurrently(fake_llm):
+    """Test concurrent pipeline runs share the event loop instead of blocking it"""
+    async def run_many():
+        return await asyncio.gather(*[
+            run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION)
+            for _ in range(5)
+        ])
+    
+    results = asyncio.run(run_many())
+    
+    assert len(results) == 5
+    assert all(result["tailored_resume"] for result in results)
+
+
+def test_sectioned_pipeline_rewrites_sections_in_parallel(fake_llm):
+    """Test the default map-reduce graph rewrites each section and stitches them in order"""
+    resume = (
+        "Jane Roe\njane@example.com\n\nSUMMARY\nBackend developer.\n\n"
+        "EXPERIENCE\nEngineer | Acme | 2020 - Present\n- Built Python services\n"
+        "Developer | Beta | 2018 - 2020\n- Wrote FastAPI endpoints\n\n"
+        "EDUCATION\nBSc Computer Science"
+    )
+    
+    result = asyncio.run(run_resume_tailor_pipeline(resume, SAMPLE_JOB_DESCRIPTION))
+    
+    section_calls = [p for p in fake_llm if "Rewrite ONE section of a resume" in p]
+    assert len(section_calls) == 4
+    assert result["summary"] == "Python engineer with FastAPI experience."
+    tailored = result["tailored_resume"]
+    assert tailored.startswith("Jane Roe\njane@example.com")
+    assert tailored.index("Acme") < tailored.index("Beta") < tailored.index("EDUCATION")
+    assert tailored.count("Tailored for the role") == 4
+
+
+def test_compiled_graph_is_reused():
+    """Test the compiled graph is built once and shared"""
+    assert get_compiled_graph() is get_compiled_graph()
+
+
+def test_register_graph_variant(fake_llm, monkeypatch):
+    """Test an alternative variant can be registered and selected by name"""
+    monkeypatch.setattr(pipeline, "_graph_factories", dict(pipeline._graph_factories))
+    monkeypatch.setattr(pipeline, "_compiled_graphs", dict(pipeline._compiled_graphs))
+    
+    def short_graph(nodes=None):
+        return create_resume_tailor_graph(nodes={"match_skills": _skip_match, **(nodes or {})})
+    
+    async def _skip_match(state):
+        return state
+    
+    register_graph_variant("test-short", short_graph)
+    asyncio.run(warmup_graphs())
+    result = asyncio.run(
+        run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, variant="test-short")
+    )
+    
+    assert len(fake_llm) == 2
+    assert result["matched_skills"] == []
+
+
+def test_unknown_variant_fails(fake_llm):
+    """Test selecting an unregistered variant raises"""
+    with pytest.raises(Exception, match="Unknown pipeline variant"):
+        asyncio.run(
+            run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, variant="missing")
+        )
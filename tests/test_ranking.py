@@ -0,0 +1,99 @@
+"""
+Tests for bulk resume/job ranking
+"""
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.skills.ranking import rank_matches, score_matrix, top_k
+
+client = TestClient(app)
+
+BACKEND_JOB = (
+    "Backend engineer: Python, FastAPI and PostgreSQL services deployed "
+    "with Docker on Kubernetes."
+)
+FRONTEND_JOB = (
+    "Frontend engineer building React and TypeScript user interfaces with "
+    "modern CSS and accessible HTML."
+)
+RESUMES = [
+    "Built React dashboards in TypeScript, styled with CSS and semantic HTML.",
+    "Wrote Python FastAPI services backed by Postgres, shipped in Docker containers on k8s.",
+    "Managed a retail store and supervised a team of cashiers.",
+]
+
+
+def test_scores_prefer_matching_skills():
+    """Test each job ranks the resume with its skills highest"""
+    scores = score_matrix(RESUMES, [BACKEND_JOB, FRONTEND_JOB])
+    
+    assert scores.shape == (3, 2)
+    assert scores.dtype == np.float32
+    assert scores[:, 0].argmax() == 1
+    assert scores[:, 1].argmax() == 0
+    assert scores[2].max() < 0.2
+    assert scores.min() >= 0 and scores.max() <= 1
+
+
+def test_required_skills_override_text_skills():
+    """Test extracted required skills drive coverage when provided"""
+    job = "We are hiring an engineer for our platform team."
+    resume = ["Ten years of Rust and Go systems programming."]
+    
+    without = score_matrix(resume, [job])
+    with_skills = score_matrix(resume, [job], [["Rust", "Go"]])
+    
+    assert with_skills[0, 0] > without[0, 0]
+
+
+def test_top_k_orders_and_truncates():
+    """Test top_k returns the best columns in descending order"""
+    scores = np.array([[0.1, 0.9, 0.5, 0.7]], dtype=np.float32)
+    
+    indices, values = top_k(scores, 3)
+    assert indices.tolist() == [[1, 3, 2]]
+    assert np.allclose(values, [[0.9, 0.7, 0.5]])
+    assert top_k(scores, 10)[0].shape == (1, 4)
+
+
+def test_rank_matches_shortlists_both_sides():
+    """Test resumes are shortlisted per job and jobs per resume"""
+    ranking = rank_matches(RESUMES, [BACKEND_JOB, FRONTEND_JOB], k=2)
+    
+    assert ranking["resumes_by_job"][0][0]["index"] == 1
+    assert len(ranking["resumes_by_job"]) == 2
+    assert all(len(matches) == 2 for matches in ranking["resumes_by_job"])
+    assert len(ranking["jobs_by_resume"]) == 3
+    assert ranking["jobs_by_resume"][0][0]["index"] == 1
+
+
+def test_rank_endpoint_uses_registered_skills(fake_llm, monkeypatch):
+    """Test /rank needs no LLM call and reuses stored job description analysis"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    stored = client.post("/jobs-descriptions", json={"job_description": BACKEND_JOB})
+    assert stored.status_code == 200
+    jd_id = stored.json()["jd_id"]
+    calls = len(fake_llm)
+    
+    response = client.post("/rank", json={
+        "resumes": RESUMES,
+        "job_descriptions": [FRONTEND_JOB],
+        "jd_ids": [jd_id],
+        "top_k": 1
+    })
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert len(fake_llm) == calls
+    assert data["jd_ids"] == [None, jd_id]
+    assert data["resumes_by_job"][0][0]["index"] == 0
+    assert data["resumes_by_job"][1][0]["index"] == 1
+    assert [len(matches) for matches in data["jobs_by_resume"]] == [1, 1, 1]
+
+
+def test_rank_endpoint_rejects_unknown_jd_id():
+    """Test an unknown jd_id returns 404"""
+    response = client.post("/rank", json={"resumes": RESUMES, "jd_ids": ["missing"]})
+    assert response.status_code == 404
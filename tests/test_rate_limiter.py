@@ -0,0 +1,129 @@
+"""
+Tests for the Groq rate limiter and retry scheduling
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from groq import RateLimitError
+
+from app.llm import client as llm_client
+from app.llm import rate_limiter
+from app.llm.rate_limiter import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    parse_retry_after,
+    request_priority,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    """Rebuild the shared limiter from the environment for every test"""
+    rate_limiter.reset_rate_limiter()
+    yield
+    rate_limiter.reset_rate_limiter()
+
+
+def test_token_budget_queues_calls():
+    """Test a call that would exceed the TPM budget waits for the refill"""
+    limiter = RateLimiter(tokens_per_minute=6000)  # 100 tokens/second
+    
+    async def run():
+        await limiter.acquire(6000)
+        start = time.monotonic()
+        await limiter.acquire(10)
+        return time.monotonic() - start
+    
+    assert asyncio.run(run()) >= 0.08
+
+
+def test_interactive_calls_overtake_batch_calls():
+    """Test queued callers are granted by priority, then arrival order"""
+    limiter = RateLimiter(requests_per_minute=6000)
+    order = []
+    
+    async def call(name, priority):
+        await limiter.acquire(1, priority=priority)
+        order.append(name)
+    
+    async def run():
+        limiter.pause(0.05)
+        batch = [asyncio.create_task(call(f"batch-{i}", PRIORITY_BATCH)) for i in range(2)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("interactive", PRIORITY_INTERACTIVE))
+        await asyncio.gather(*batch, interactive)
+    
+    asyncio.run(run())
+    assert order == ["interactive", "batch-0", "batch-1"]
+
+
+def test_priority_follows_context():
+    """Test request_priority applies to tasks spawned inside the block"""
+    async def run():
+        with request_priority(PRIORITY_BATCH):
+            inner = await asyncio.create_task(asyncio.sleep(0, result=rate_limiter.get_request_priority()))
+        return inner, rate_limiter.get_request_priority()
+    
+    assert asyncio.run(run()) == (PRIORITY_BATCH, PRIORITY_INTERACTIVE)
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, HTTP dates and junk"""
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_call_groq_api_retries_after_429(monkeypatch):
+    """Test a 429 is retried after Retry-After instead of failing the request"""
+    monkeypatch.setenv("GROQ_BACKOFF_BASE", "0.01")
+    attempts = []
+    
+    async def fake_create(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) == 1:
+            response = httpx.Response(
+                429,
+                headers={"retry-after": "0"},
+                request=httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions"),
+            )
+            raise RateLimitError("rate limited", response=response, body=None)
+        message = SimpleNamespace(content='{"ok": true}')
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)],
+            usage=SimpleNamespace(total_tokens=42),
+        )
+    
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create)))
+    monkeypatch.setattr(llm_client, "get_groq_client", lambda: fake_client)
+    
+    assert asyncio.run(llm_client.call_groq_api("prompt", max_tokens=100)) == '{"ok": true}'
+    assert len(attempts) == 2
+
+
+def test_call_groq_api_gives_up_after_max_retries(monkeypatch):
+    """Test persistent rate limiting surfaces the error once retries run out"""
+    monkeypatch.setenv("GROQ_BACKOFF_BASE", "0.01")
+    monkeypatch.setenv("GROQ_MAX_RETRIES", "1")
+    attempts = []
+    
+    async def fake_create(**kwargs):
+        attempts.append(kwargs)
+        response = httpx.Response(
+            429,
+            request=httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions"),
+        )
+        raise RateLimitError("rate limited", response=response, body=None)
+    
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create)))
+    monkeypatch.setattr(llm_client, "get_groq_client", lambda: fake_client)
+    
+    with pytest.raises(RateLimitError):
+        asyncio.run(llm_client.call_groq_api("prompt", max_tokens=100))
+    assert len(attempts) == 2
@@ -0,0 +1,205 @@
+"""
+Tests for the full-result cache and its backends
+"""
+
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.storage.redis_client import _read_reply
+from app.storage.result_cache import (
+    MemoryBackend,
+    RedisBackend,
+    ResultCache,
+    SQLiteBackend,
+    compute_result_key,
+)
+from app.utils.lru import LRUCache
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME, fake_llm_response
+
+client = TestClient(app)
+
+RESULT = {
+    "tailored_resume": "John Doe\nSenior Python Engineer\n" * 50,
+    "summary": "Backend engineer",
+    "matched_skills": ["Python"],
+    "missing_skills": ["Docker"],
+}
+
+
+async def start_fake_redis():
+    """Local stand-in speaking enough RESP for the cache (GET/SET EX/DEL/PING)"""
+    store = {}
+    
+    async def handle(reader, writer):
+        while True:
+            try:
+                command = await _read_reply(reader)
+            except Exception:
+                break
+            name = command[0].upper()
+            if name == b"PING":
+                writer.write(b"+PONG\r\n")
+            elif name == b"SET":
+                ttl = int(command[4]) if len(command) > 4 else None
+                store[command[1]] = (command[2], time.monotonic() + ttl if ttl else None)
+                writer.write(b"+OK\r\n")
+            elif name == b"GET":
+                value, expires_at = store.get(command[1], (None, None))
+                if value is None or (expires_at and expires_at <= time.monotonic()):
+                    writer.write(b"$-1\r\n")
+                else:
+                    writer.write(b"$%d\r\n%s\r\n" % (len(value), value))
+            elif name == b"DEL":
+                writer.write(b":%d\r\n" % int(store.pop(command[1], None) is not None))
+            else:
+                writer.write(b"-ERR unknown command\r\n")
+            await writer.drain()
+        writer.close()
+    
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], store
+
+
+def test_lru_evicts_by_total_bytes():
+    """Test the byte limit evicts least recently used values first"""
+    cache = LRUCache(max_entries=100, max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"5678")
+    cache.get("a")
+    cache.set("c", b"90ab")
+    
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.total_bytes == 8
+    
+    cache.set("huge", b"x" * 11)
+    assert "huge" not in cache
+
+
+def test_values_are_compressed_and_round_trip():
+    """Test results are stored compressed and decoded unchanged"""
+    backend = MemoryBackend()
+    cache = ResultCache(backend)
+    
+    async def run():
+        await cache.set("key", RESULT)
+        stored = await backend.get("key")
+        return stored, await cache.get("key"), await cache.get("other")
+    
+    stored, hit, miss = asyncio.run(run())
+    assert stored[:1] == b"z"
+    assert len(stored) < len(RESULT["tailored_resume"])
+    assert hit == RESULT
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_sqlite_backend_persists_and_expires(tmp_path):
+    """Test SQLite entries survive a restart and expire after their TTL"""
+    path = str(tmp_path / "cache.db")
+    
+    async def run():
+        first = ResultCache(SQLiteBackend(path))
+        await first.set("key", RESULT)
+        first_ttl = ResultCache(SQLiteBackend(path), ttl_seconds=0.01)
+        await first_ttl.set("short", RESULT)
+        await first.close()
+        await first_ttl.close()
+        
+        await asyncio.sleep(0.05)
+        second = ResultCache(SQLiteBackend(path))
+        found = await second.get("key"), await second.get("short")
+        await second.close()
+        return found
+    
+    assert asyncio.run(run()) == (RESULT, None)
+
+
+def test_redis_backend_against_local_stand_in():
+    """Test the RESP client round-trips results through a Redis-protocol server"""
+    async def run():
+        server, port, store = await start_fake_redis()
+        cache = ResultCache(RedisBackend(f"redis://127.0.0.1:{port}/0"), ttl_seconds=60)
+        await cache.set("key", RESULT)
+        found = await cache.get("key")
+        await cache.backend.delete("key")
+        gone = await cache.get("key")
+        await cache.close()
+        server.close()
+        await server.wait_closed()
+        return found, gone, store
+    
+    found, gone, store = asyncio.run(run())
+    assert found == RESULT
+    assert gone is None
+    assert store == {}
+
+
+def test_unreachable_backend_is_a_miss():
+    """Test a broken backend degrades to misses instead of failing requests"""
+    cache = ResultCache(RedisBackend("redis://127.0.0.1:1/0"))
+    
+    async def run():
+        await cache.set("key", RESULT)
+        return await cache.get("key")
+    
+    assert asyncio.run(run()) is None
+    assert cache.stats()["errors"] == 2
+
+
+def test_key_tracks_inputs_model_and_prompt_version(monkeypatch):
+    """Test the key ignores spacing but changes with model and prompt version"""
+    key = compute_result_key(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, "model-a", "sectioned")
+    
+    assert key == compute_result_key(SAMPLE_RESUME + "  \n\n\n", SAMPLE_JOB_DESCRIPTION, "model-a", "sectioned")
+    assert key != compute_result_key(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, "model-b", "sectioned")
+    
+    monkeypatch.setenv("PROMPT_TEMPLATE_VERSION", "v2")
+    assert key != compute_result_key(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION, "model-a", "sectioned")
+
+
+def test_repeat_tailor_request_is_served_from_cache(fake_llm, monkeypatch):
+    """Test a repeat submission skips the LLM unless Cache-Control: no-cache"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    payload = {"resume_text": SAMPLE_RESUME, "job_description": SAMPLE_JOB_DESCRIPTION}
+    
+    first = client.post("/tailor", json=payload)
+    calls_after_first = len(fake_llm)
+    second = client.post("/tailor", json=payload)
+    
+    assert first.status_code == second.status_code == 200
+    # Every response opens its own session; the tailored result is identical
+    first_result, second_result = first.json(), second.json()
+    assert first_result.pop("session_id") != second_result.pop("session_id")
+    assert second_result == first_result
+    assert len(fake_llm) == calls_after_first
+    
+    fresh = client.post("/tailor", json=payload, headers={"Cache-Control": "no-cache"})
+    assert fresh.status_code == 200
+    assert len(fake_llm) > calls_after_first
+
+
+def test_degraded_result_is_not_cached(monkeypatch):
+    """Test a fallback summary is returned but a retry calls the LLM again"""
+    calls = []
+    
+    async def _call(prompt, temperature=0.3, max_tokens=2000, **kwargs):
+        calls.append(prompt)
+        if "Write a compelling professional summary" in prompt:
+            return "Sorry, I cannot do that."
+        return fake_llm_response(prompt)
+    
+    monkeypatch.setattr("app.graph.nodes.call_groq_api", _call)
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    payload = {"resume_text": SAMPLE_RESUME, "job_description": SAMPLE_JOB_DESCRIPTION}
+    
+    first = client.post("/tailor", json=payload)
+    assert first.json()["summary"] == "Unable to generate summary. Please try again."
+    calls_after_first = len(calls)
+    
+    client.post("/tailor", json=payload)
+    assert len(calls) > calls_after_first
@@ -0,0 +1,45 @@
+"""
+Tests for resume section splitting
+"""
+
+from app.graph.sections import split_resume_sections, stitch_sections
+
+
+RESUME = """Jane Roe
+jane@example.com
+
+PROFESSIONAL SUMMARY
+Backend developer.
+
+Experience:
+Engineer | Acme | 2020 - Present
+- Built Python services
+
+Developer | Beta | 2018 - 2020
+- Wrote FastAPI endpoints
+
+EDUCATION
+BSc Computer Science"""
+
+
+def test_split_resume_sections_kinds_and_entries():
+    """Test headings start sections and experience is split per entry"""
+    sections = split_resume_sections(RESUME)
+    
+    assert [section["kind"] for section in sections] == [
+        "header", "summary", "experience", "experience", "education"
+    ]
+    assert sections[2]["text"].startswith("Experience:\nEngineer | Acme")
+    assert sections[3]["text"].startswith("Developer | Beta")
+
+
+def test_stitch_sections_keeps_order_and_unrewritten_text():
+    """Test stitching uses rewrites where present and originals elsewhere"""
+    sections = split_resume_sections(RESUME)
+    
+    stitched = stitch_sections(sections, {3: "Developer | Beta | 2018 - 2020\n- Shipped FastAPI APIs"})
+    
+    assert stitched.startswith("Jane Roe")
+    assert "Shipped FastAPI APIs" in stitched
+    assert "Wrote FastAPI endpoints" not in stitched
+    assert stitched.endswith("BSc Computer Science")
@@ -0,0 +1,123 @@
+"""
+Tests for incremental re-tailoring sessions
+"""
+
+from fastapi.testclient import TestClient
+
+from app.graph import nodes
+from app.main import app
+from app.storage import sessions
+from tests.conftest import SAMPLE_JOB_DESCRIPTION
+
+client = TestClient(app)
+
+RESUME = (
+    "Jane Roe\njane@example.com\n\nSUMMARY\nBackend developer.\n\n"
+    "EXPERIENCE\nEngineer | Acme | 2020 - Present\n- Built Python services\n"
+    "Developer | Beta | 2018 - 2020\n- Wrote FastAPI endpoints\n\n"
+    "EDUCATION\nBSc Computer Science"
+)
+
+
+def _section_calls(calls):
+    return [prompt for prompt in calls if "Rewrite ONE section of a resume" in prompt]
+
+
+def _start_session(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    response = client.post("/tailor", json={"resume_text": RESUME, "job_description": SAMPLE_JOB_DESCRIPTION})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_tailor_returns_session_id(fake_llm, monkeypatch):
+    data = _start_session(monkeypatch)
+    
+    assert data["session_id"]
+    assert len(_section_calls(fake_llm)) == 4
+
+
+def test_unchanged_update_makes_no_llm_calls(fake_llm, monkeypatch):
+    data = _start_session(monkeypatch)
+    fake_llm.clear()
+    
+    response = client.post(f"/tailor/{data['session_id']}/update", json={"resume_text": RESUME})
+    
+    assert response.status_code == 200
+    assert fake_llm == []
+    update = response.json()
+    assert update["tailored_resume"] == data["tailored_resume"]
+    assert update["rewritten_sections"] == 0
+    assert update["reused_sections"] == 4
+
+
+def test_edited_bullet_only_rewrites_its_section(fake_llm, monkeypatch):
+    data = _start_session(monkeypatch)
+    fake_llm.clear()
+    edited = RESUME.replace("- Wrote FastAPI endpoints", "- Wrote FastAPI endpoints backed by Docker")
+    
+    response = client.post(f"/tailor/{data['session_id']}/update", json={"resume_text": edited})
+    
+    assert response.status_code == 200
+    update = response.json()
+    section_calls = _section_calls(fake_llm)
+    assert len(section_calls) == 1
+    assert "backed by Docker" in section_calls[0]
+    assert update["rewritten_sections"] == 1
+    assert update["reused_sections"] == 3
+    assert update["tailored_resume"].count("Tailored for the role") == 4
+    assert "Docker" in update["matched_skills"]
+    
+    # The session now holds the edit, so resubmitting it is free
+    fake_llm.clear()
+    response = client.post(f"/tailor/{data['session_id']}/update", json={"resume_text": edited})
+    assert response.json()["rewritten_sections"] == 0
+    assert fake_llm == []
+
+
+def test_failed_calls_are_retried_by_the_next_update(fake_llm, monkeypatch):
+    data = _start_session(monkeypatch)
+    edited = RESUME.replace("- Wrote FastAPI endpoints", "- Wrote FastAPI endpoints with the team")
+    working_call = nodes.call_groq_api
+    
+    async def unparsable(prompt, **kwargs):
+        if any(marker in prompt for marker in ("against required skills", "Rewrite ONE section", "professional summary")):
+            return "not json"
+        return await working_call(prompt, **kwargs)
+    
+    monkeypatch.setattr(nodes, "call_groq_api", unparsable)
+    response = client.post(f"/tailor/{data['session_id']}/update", json={"resume_text": edited})
+    assert response.status_code == 200
+    assert response.json()["summary"] == nodes.SUMMARY_UNAVAILABLE
+    assert response.json()["tailored_resume"].count("Tailored for the role") == 3
+    
+    # Nothing from the failed calls was kept: resubmitting retries all of it
+    monkeypatch.setattr(nodes, "call_groq_api", working_call)
+    response = client.post(f"/tailor/{data['session_id']}/update", json={"resume_text": edited})
+    update = response.json()
+    assert update["rewritten_sections"] == 1
+    assert update["rematched_skills"] > 0
+    assert update["summary"] != nodes.SUMMARY_UNAVAILABLE
+    assert update["tailored_resume"].count("Tailored for the role") == 4
+    
+    fake_llm.clear()
+    response = client.post(f"/tailor/{data['session_id']}/update", json={"resume_text": edited})
+    assert response.json()["rewritten_sections"] == 0
+    assert fake_llm == []
+
+
+def test_unknown_session_returns_404(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    response = client.post("/tailor/missing/update", json={"resume_text": RESUME})
+    
+    assert response.status_code == 404
+
+
+def test_empty_session_db_path_uses_database_path(monkeypatch, isolated_storage):
+    monkeypatch.setenv("SESSION_DB_PATH", "")
+    sessions.close_session_store()
+    
+    sessions.get_session_store()
+    
+    assert (isolated_storage / "resume_tailor.db").exists()
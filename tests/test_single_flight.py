@@ -0,0 +1,124 @@
+"""
+Tests for single-flight coalescing of identical in-flight work
+"""
+
+import asyncio
+
+import pytest
+
+from app.graph.pipeline import run_resume_tailor_pipeline
+from app.utils.single_flight import SingleFlight
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+
+def test_concurrent_duplicates_share_one_execution():
+    """Test callers with the same key get one execution and one result"""
+    flight = SingleFlight("test")
+    runs = []
+    
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": 42}
+    
+    async def run():
+        return await asyncio.gather(*[flight.do("key", work) for _ in range(5)])
+    
+    results = asyncio.run(run())
+    assert len(runs) == 1
+    assert all(result == {"value": 42} for result in results)
+    assert flight.coalesced == 4
+    assert flight.in_flight() == 0
+
+
+def test_errors_reach_every_caller_and_are_not_cached():
+    """Test a failure propagates to all joined callers, then the key is free"""
+    flight = SingleFlight("test")
+    runs = []
+    
+    async def failing():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    
+    async def run():
+        return await asyncio.gather(
+            *[flight.do("key", failing) for _ in range(3)],
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(runs) == 1
+    
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("key", failing))
+    assert len(runs) == 2
+
+
+def test_cancelling_one_caller_keeps_shared_work_running():
+    """Test a cancelled caller detaches without cancelling the others"""
+    flight = SingleFlight("test")
+    
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+    
+    async def run():
+        first = asyncio.create_task(flight.do("key", work))
+        second = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, first.cancelled()
+    
+    assert asyncio.run(run()) == ("done", True)
+
+
+def test_cancelling_every_caller_cancels_shared_work():
+    """Test the shared work stops once nobody is waiting for it"""
+    flight = SingleFlight("test")
+    finished = []
+    
+    async def work():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+    
+    async def run():
+        caller = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0.1)
+    
+    asyncio.run(run())
+    assert finished == []
+    assert flight.in_flight() == 0
+
+
+def test_duplicate_pipeline_requests_coalesce(fake_llm):
+    """Test identical concurrent tailoring requests run the pipeline once"""
+    async def run():
+        return await asyncio.gather(
+            run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION),
+            run_resume_tailor_pipeline(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION)
+        )
+    
+    first, second = asyncio.run(run())
+    
+    assert first == second
+    assert first is not second
+    # Without coalescing every prompt would have been sent twice
+    assert fake_llm
+    assert len(fake_llm) == len(set(fake_llm))
+
+
+def test_extraction_coalesces_across_resumes(fake_llm):
+    """Test different resumes against one new job description extract once"""
+    async def run():
+        return await asyncio.gather(*[
+            run_resume_tailor_pipeline(SAMPLE_RESUME + f"\nProject {i}", SAMPLE_JOB_DESCRIPTION)
+            for i in range(3)
+        ])
+    
+    asyncio.run(run())
+    extraction_calls = [p for p in fake_llm if "Analyze the following job description" in p]
+    assert len(extraction_calls) == 1
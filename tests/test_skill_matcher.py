@@ -0,0 +1,101 @@
+"""
+Tests for the deterministic skill matcher
+"""
+
+import asyncio
+import json
+
+from app.graph.nodes import match_skills_node
+from app.skills.matcher import AhoCorasick, match_skills_locally
+from app.skills.taxonomy import canonicalize_skill
+
+
+def test_canonicalize_aliases_and_filler_words():
+    """Test synonyms and qualified phrases map to one canonical skill"""
+    assert canonicalize_skill("Postgres") == "PostgreSQL"
+    assert canonicalize_skill("k8s") == "Kubernetes"
+    assert canonicalize_skill("Python programming") == "Python"
+    assert canonicalize_skill("Team leadership") is None
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    """Test every pattern is reported in a single pass, including overlaps"""
+    automaton = AhoCorasick({
+        ("amazon", "web", "services"): {"AWS"},
+        ("web", "services"): {"Web Services"},
+        ("services",): {"Services"},
+    })
+    found = automaton.search("built on amazon web services today".split())
+    assert found == {"AWS", "Web Services", "Services"}
+
+
+def test_match_skills_locally_classifies_skills():
+    """Test matched, missing and ambiguous classification"""
+    resume = "Built REST APIs in Python 3 with FastAPI, deployed on k8s and Postgres."
+    result = match_skills_locally(
+        resume,
+        ["Python", "PostgreSQL", "Kubernetes", "Docker", "Communication"]
+    )
+    
+    assert result["matched_skills"] == ["Python", "PostgreSQL", "Kubernetes"]
+    assert result["missing_skills"] == ["Docker"]
+    assert result["ambiguous_skills"] == ["Communication"]
+
+
+def test_short_aliases_are_case_sensitive():
+    """Test short aliases like Go and R do not match ordinary words"""
+    assert match_skills_locally("Go-to person for R&D, ready to go", ["Go", "R"])["matched_skills"] == []
+    assert match_skills_locally("Services written in Go and R.", ["Go", "R"])["matched_skills"] == ["Go", "R"]
+
+
+def test_hybrid_mode_escalates_only_unmatched_skills(fake_llm, monkeypatch):
+    """Test hybrid mode sends only the skills the local matcher did not find to the LLM"""
+    monkeypatch.setenv("SKILL_MATCH_MODE", "hybrid")
+    state = {
+        "resume_text": "Python and FastAPI developer",
+        "all_required_skills": ["Python", "Docker", "Communication"]
+    }
+    
+    result = asyncio.run(match_skills_node(state))
+    
+    assert len(fake_llm) == 1
+    assert "Required Skills from Job Description:\nDocker, Communication\n" in fake_llm[0]
+    assert result["matched_skills"] == ["Python"]
+    assert result["missing_skills"] == ["Docker", "Communication"]
+
+
+def test_hybrid_mode_asks_llm_about_unfound_taxonomy_skills(monkeypatch):
+    """Test a taxonomy skill evidenced only by related terms is not ruled missing locally"""
+    monkeypatch.setenv("SKILL_MATCH_MODE", "hybrid")
+    
+    async def _fake_call_groq_api(prompt, temperature=0.3, max_tokens=2000, **kwargs):
+        return json.dumps({"matched_skills": ["SQL"], "missing_skills": []})
+    
+    monkeypatch.setattr("app.graph.nodes.call_groq_api", _fake_call_groq_api)
+    state = {"resume_text": "Tuned MySQL and PostgreSQL queries", "all_required_skills": ["SQL", "PostgreSQL"]}
+    
+    result = asyncio.run(match_skills_node(state))
+    
+    assert result["matched_skills"] == ["SQL", "PostgreSQL"]
+    assert result["missing_skills"] == []
+
+
+def test_broad_terms_do_not_imply_specific_tools():
+    """Test generic phrases are not read as claims of a specific tool"""
+    resume = "Designed distributed systems with containerization; code hosted on GitLab."
+    
+    assert match_skills_locally(resume, ["Docker", "GitLab CI", "System Design"])["matched_skills"] == []
+
+
+def test_local_mode_never_calls_llm(fake_llm, monkeypatch):
+    """Test local mode treats ambiguous skills as missing without an LLM call"""
+    monkeypatch.setenv("SKILL_MATCH_MODE", "local")
+    state = {
+        "resume_text": "Python and FastAPI developer",
+        "all_required_skills": ["Python", "Communication"]
+    }
+    
+    result = asyncio.run(match_skills_node(state))
+    
+    assert fake_llm == []
+    assert result["missing_skills"] == ["Communication"]
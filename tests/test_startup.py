@@ -0,0 +1,94 @@
+"""
+Tests for lazy imports, background warmup and the readiness endpoint
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import warmup
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def fresh_warmup(monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    warmup.reset_warmup()
+    yield
+    warmup.reset_warmup()
+
+
+def test_importing_app_skips_heavy_dependencies():
+    """Test app.main loads without LangGraph, Groq, httpx or NumPy/SciPy"""
+    code = (
+        "import sys, app.main; "
+        "print(','.join(m for m in ('langgraph', 'langchain_core', 'groq', 'httpx', 'numpy', 'scipy') "
+        "if m in sys.modules))"
+    )
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    
+    assert completed.stdout.strip() == ""
+
+
+def test_ready_returns_503_until_warmup_finishes():
+    """Test /ready reports warming_up, then ready once warmup has run"""
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming_up"
+    
+    asyncio.run(warmup.warm_up())
+    
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["warmup_seconds"] >= 0
+
+
+def test_failed_warmup_is_reported(monkeypatch):
+    """Test a warmup error keeps /ready at 503 and says why"""
+    monkeypatch.setattr(warmup, "HEAVY_MODULES", ("app.missing_module",))
+    
+    asyncio.run(warmup.warm_up())
+    
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "failed"
+    assert "app.missing_module" in response.json()["error"]
+
+
+def test_failed_warmup_is_retried(monkeypatch):
+    """Test a transient warmup failure recovers without a restart"""
+    monkeypatch.setenv("WARMUP_RETRY_SECONDS", "0.01")
+    monkeypatch.setattr(warmup, "HEAVY_MODULES", ("app.missing_module",))
+    
+    async def run():
+        task = warmup.start_warmup()
+        while warmup.readiness()["status"] != "failed":
+            await asyncio.sleep(0.01)
+        monkeypatch.setattr(warmup, "HEAVY_MODULES", ())
+        await asyncio.wait_for(task, 5)
+    
+    asyncio.run(run())
+    
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json().get("error") is None
+
+
+def test_lifespan_starts_warmup(monkeypatch):
+    """Test the app becomes ready on its own after startup"""
+    monkeypatch.setenv("JOB_WORKERS", "0")
+    
+    with TestClient(app) as started:
+        assert started.get("/health").status_code == 200
+        for _ in range(100):
+            if started.get("/ready").status_code == 200:
+                break
+            time.sleep(0.05)
+        assert started.get("/ready").json()["status"] == "ready"
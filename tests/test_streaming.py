@@ -0,0 +1,82 @@
+"""
+Tests for the Server-Sent Events streaming endpoint
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils.json_stream import JsonStringFieldStreamer
+from tests.conftest import SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION
+
+client = TestClient(app)
+
+
+def parse_sse(body: str):
+    """Split an SSE body into (event, data) pairs"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_emits_progressive_events(fake_llm, monkeypatch):
+    """Test node events arrive in order, followed by tokens and the result"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    response = client.post("/tailor/stream", json={
+        "resume_text": SAMPLE_RESUME,
+        "job_description": SAMPLE_JOB_DESCRIPTION
+    })
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    names = [name for name, _ in events]
+    nodes = [data for name, data in events if name == "node"]
+    
+    assert [node["node"] for node in nodes] == [
+        "compact_inputs", "extract_keywords", "match_skills", "rewrite_resume"
+    ]
+    assert nodes[1]["all_required_skills"] == ["Python", "FastAPI", "Docker", "Communication"]
+    assert nodes[2]["matched_skills"] == ["Python", "FastAPI"]
+    assert names.index("token") > names.index("node") + 2
+    assert names.count("token") > 1
+    assert names[-1] == "result"
+    
+    streamed = "".join(data["text"] for name, data in events if name == "token")
+    assert streamed == events[-1][1]["tailored_resume"]
+
+
+def test_stream_reports_pipeline_errors(fake_llm, monkeypatch):
+    """Test failures after the stream starts become an error event"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    async def failing_call(prompt, **kwargs):
+        raise RuntimeError("upstream error")
+    
+    monkeypatch.setattr("app.graph.nodes.call_groq_api", failing_call)
+    
+    response = client.post("/tailor/stream", json={
+        "resume_text": SAMPLE_RESUME,
+        "job_description": SAMPLE_JOB_DESCRIPTION
+    })
+    
+    events = parse_sse(response.text)
+    assert events[-1][0] == "error"
+    assert "upstream error" in events[-1][1]["detail"]
+
+
+def test_json_string_field_streamer_handles_split_escapes():
+    """Test escapes cut across chunk boundaries decode correctly"""
+    document = json.dumps({"tailored_resume": "Line one\nCafé \"quoted\"", "other": "x"})
+    
+    for size in (1, 2, 3, 7):
+        streamer = JsonStringFieldStreamer("tailored_resume")
+        text = "".join(
+            streamer.feed(document[i:i + size]) for i in range(0, len(document), size)
+        )
+        assert text == "Line one\nCafé \"quoted\""
+        assert streamer.done
@@ -0,0 +1,166 @@
+"""
+Tests for trace spans, context propagation and exporters
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.llm import client as llm_client
+from app.main import app
+from app.utils import tracing
+from app.utils.tracing import (
+    FileExporter,
+    OTLPExporter,
+    SpanExporter,
+    parse_traceparent,
+    set_span_exporter,
+    start_span,
+)
+from tests.conftest import SAMPLE_JOB_DESCRIPTION, SAMPLE_RESUME
+
+client = TestClient(app)
+
+REMOTE_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+REMOTE_SPAN_ID = "00f067aa0ba902b7"
+
+
+class ListExporter(SpanExporter):
+    """Collects exported spans in memory"""
+    
+    def __init__(self):
+        self.spans = []
+    
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter():
+    """Route spans to an in-memory exporter for the duration of a test"""
+    collected = ListExporter()
+    set_span_exporter(collected)
+    yield collected
+    tracing.shutdown_tracing()
+
+
+def test_parse_traceparent():
+    """Test valid headers are parsed and malformed ones ignored"""
+    assert parse_traceparent(f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01") == (REMOTE_TRACE_ID, REMOTE_SPAN_ID, True)
+    assert parse_traceparent(f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-00")[2] is False
+    assert parse_traceparent("00-xyz-123-01") is None
+    assert parse_traceparent(f"00-{'0' * 32}-{REMOTE_SPAN_ID}-01") is None
+    assert parse_traceparent(None) is None
+
+
+def test_request_spans_nest_and_continue_remote_trace(fake_llm, monkeypatch, exporter):
+    """Test a /tailor request yields root, pipeline and node spans in one trace"""
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    
+    response = client.post(
+        "/tailor",
+        json={"resume_text": SAMPLE_RESUME, "job_description": SAMPLE_JOB_DESCRIPTION},
+        headers={"traceparent": f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01"},
+    )
+    tracing.get_tracer().flush()
+    
+    assert response.status_code == 200
+    assert response.headers["x-trace-id"] == REMOTE_TRACE_ID
+    
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["POST /tailor"]
+    assert root.parent_id == REMOTE_SPAN_ID
+    assert root.attributes["http.status_code"] == 200
+    assert root.attributes["cache.hit"] is False
+    assert spans["pipeline"].parent_id == root.span_id
+    for node in ("node extract_keywords", "node match_skills", "node stitch_sections"):
+        assert spans[node].parent_id == spans["pipeline"].span_id
+    assert spans["node extract_keywords"].attributes["llm.json_parse_path"] == "fast"
+    assert {span.trace_id for span in exporter.spans} == {REMOTE_TRACE_ID}
+
+
+def test_llm_span_records_model_and_usage(monkeypatch, exporter):
+    """Test call_groq_api opens a client span with request and usage attributes"""
+    monkeypatch.setenv("MODEL_NAME", "test-model")
+    
+    async def fake_create(**kwargs):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"ok": true}'))],
+            usage=SimpleNamespace(prompt_tokens=50, completion_tokens=7, total_tokens=57),
+        )
+    
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create)))
+    monkeypatch.setattr(llm_client, "get_groq_client", lambda: fake_client)
+    
+    async def run():
+        with start_span("node test") as parent:
+            await llm_client.call_groq_api("a" * 400, temperature=0.2, max_tokens=100, json_mode=True)
+        return parent
+    
+    parent = asyncio.run(run())
+    tracing.get_tracer().flush()
+    
+    llm_span = next(span for span in exporter.spans if span.name == "llm.chat_completion")
+    assert llm_span.parent_id == parent.span_id
+    assert llm_span.kind == "client"
+    assert llm_span.attributes["llm.model"] == "test-model"
+    assert llm_span.attributes["llm.temperature"] == 0.2
+    assert llm_span.attributes["llm.prompt_chars"] == 400
+    assert llm_span.attributes["llm.json_mode"] is True
+    assert llm_span.attributes["llm.usage.prompt_tokens"] == 50
+    assert llm_span.attributes["llm.usage.completion_tokens"] == 7
+
+
+def test_failed_span_records_error(exporter):
+    """Test an exception marks the span as an error"""
+    with pytest.raises(RuntimeError):
+        with start_span("failing"):
+            raise RuntimeError("boom")
+    tracing.get_tracer().flush()
+    
+    assert exporter.spans[0].status == "error"
+    assert "boom" in exporter.spans[0].status_message
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    """Test spans are appended to the trace file as JSON lines"""
+    path = tmp_path / "traces.jsonl"
+    set_span_exporter(FileExporter(str(path)))
+    
+    with start_span("outer"):
+        with start_span("inner", {"k": 1}):
+            pass
+    tracing.shutdown_tracing()
+    
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == ["inner", "outer"]
+    assert records[0]["parent_id"] == records[1]["span_id"]
+    assert records[0]["attributes"] == {"k": 1}
+
+
+def test_otlp_exporter_posts_resource_spans():
+    """Test the OTLP exporter sends the OTLP/HTTP JSON payload"""
+    received = []
+    
+    def handler(request):
+        received.append(request)
+        return httpx.Response(200)
+    
+    otlp = OTLPExporter("http://collector:4318", "resume-tailor")
+    otlp._client = httpx.Client(transport=httpx.MockTransport(handler))
+    set_span_exporter(otlp)
+    
+    with start_span("outer", {"count": 3, "ratio": 0.5, "flag": True}):
+        pass
+    tracing.shutdown_tracing()
+    
+    assert str(received[0].url) == "http://collector:4318/v1/traces"
+    body = json.loads(received[0].content)
+    span = body["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert span["name"] == "outer"
+    assert {"key": "count", "value": {"intValue": "3"}} in span["attributes"]
+    assert {"key": "flag", "value": {"boolValue": True}} in span["attributes"]